@@ -1,19 +1,29 @@
 """
 AI-Powered Startup Idea Generator using Claude API
 """
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from typing import List, Dict, Optional
+import asyncio
 import os
 import json
 import logging
+import time
 from datetime import datetime
 
+from app.studio.config import calculate_cost
+
 logger = logging.getLogger(__name__)
 
 
 class IdeaGenerator:
     """Generates startup ideas using Claude AI"""
 
+    # Sampling settings per generation channel
+    CHANNELS = {
+        "strategic": {"temperature": 0.7, "max_tokens": 8000},
+        "quick-win": {"temperature": 0.8, "max_tokens": 8000},  # Slightly higher for more creative quick wins
+    }
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -22,6 +32,9 @@ class IdeaGenerator:
         self.client = Anthropic(api_key=self.api_key)
         self.model = "claude-sonnet-4-5-20250929"
 
+        # Latency, tokens and cost of the last call per channel
+        self.channel_metrics: Dict[str, Dict] = {}
+
     def generate_strategic_ideas(
         self,
         vc_sources: List[Dict],
@@ -40,10 +53,52 @@ class IdeaGenerator:
         try:
             logger.info(f"Generating {count} strategic startup ideas...")
 
-            # Prepare context from sources
-            context = self._prepare_vc_context(vc_sources, trends)
+            prompt = self.build_strategic_prompt(vc_sources, trends, count)
+            ideas, self.channel_metrics["strategic"] = self._complete("strategic", prompt)
 
-            prompt = f"""You are a venture capital analyst and startup strategist. Based on the following market insights and VC requests for startups, generate {count} highly strategic startup ideas that VCs would be excited to fund.
+            logger.info(f"✓ Generated {len(ideas)} strategic ideas")
+            return ideas[:count]
+
+        except Exception as e:
+            logger.error(f"Error generating strategic ideas: {e}")
+            self.channel_metrics["strategic"] = {"model": self.model, "error": str(e)}
+            return []
+
+    def generate_quick_win_ideas(
+        self,
+        product_hunt_data: List[Dict],
+        trends: List[Dict],
+        count: int = 5
+    ) -> List[Dict]:
+        """
+        Generate quick-win startup ideas based on market gaps
+        Args:
+            product_hunt_data: Product Hunt trending products
+            trends: Market trend data
+            count: Number of ideas to generate
+        Returns:
+            List of quick-win startup ideas
+        """
+        try:
+            logger.info(f"Generating {count} quick-win startup ideas...")
+
+            prompt = self.build_quick_win_prompt(product_hunt_data, trends, count)
+            ideas, self.channel_metrics["quick-win"] = self._complete("quick-win", prompt)
+
+            logger.info(f"✓ Generated {len(ideas)} quick-win ideas")
+            return ideas[:count]
+
+        except Exception as e:
+            logger.error(f"Error generating quick-win ideas: {e}")
+            self.channel_metrics["quick-win"] = {"model": self.model, "error": str(e)}
+            return []
+
+    def build_strategic_prompt(self, vc_sources: List[Dict], trends: List[Dict], count: int) -> str:
+        """Build the strategic channel prompt from VC sources and trends"""
+        # Prepare context from sources
+        context = self._prepare_vc_context(vc_sources, trends)
+
+        return f"""You are a venture capital analyst and startup strategist. Based on the following market insights and VC requests for startups, generate {count} highly strategic startup ideas that VCs would be excited to fund.
 
 MARKET CONTEXT:
 {context}
@@ -77,48 +132,12 @@ Focus on ideas that:
 
 Return your response as a JSON array of idea objects."""
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=8000,
-                temperature=0.7,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            # Parse response
-            ideas = self._parse_claude_response(response.content[0].text, "strategic")
-
-            logger.info(f"✓ Generated {len(ideas)} strategic ideas")
-            return ideas[:count]
-
-        except Exception as e:
-            logger.error(f"Error generating strategic ideas: {e}")
-            return []
+    def build_quick_win_prompt(self, product_hunt_data: List[Dict], trends: List[Dict], count: int) -> str:
+        """Build the quick-win channel prompt from Product Hunt data and trends"""
+        # Prepare context
+        context = self._prepare_quick_win_context(product_hunt_data, trends)
 
-    def generate_quick_win_ideas(
-        self,
-        product_hunt_data: List[Dict],
-        trends: List[Dict],
-        count: int = 5
-    ) -> List[Dict]:
-        """
-        Generate quick-win startup ideas based on market gaps
-        Args:
-            product_hunt_data: Product Hunt trending products
-            trends: Market trend data
-            count: Number of ideas to generate
-        Returns:
-            List of quick-win startup ideas
-        """
-        try:
-            logger.info(f"Generating {count} quick-win startup ideas...")
-
-            # Prepare context
-            context = self._prepare_quick_win_context(product_hunt_data, trends)
-
-            prompt = f"""You are a pragmatic entrepreneur focused on quick wins and rapid monetization. Based on the following market data, generate {count} startup ideas that can be built and monetized FAST (within 2-8 weeks).
+        return f"""You are a pragmatic entrepreneur focused on quick wins and rapid monetization. Based on the following market data, generate {count} startup ideas that can be built and monetized FAST (within 2-8 weeks).
 
 MARKET DATA:
 {context}
@@ -155,25 +174,103 @@ Think: Chrome extensions, Notion templates, API wrappers, niche SaaS tools, auto
 
 Return your response as a JSON array of idea objects."""
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=8000,
-                temperature=0.8,  # Slightly higher for more creative quick wins
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+    def generate_channels(self, prompts: Dict[str, str], count: int = 5) -> Dict[str, Dict]:
+        """
+        Generate ideas for several channels in parallel
+        Args:
+            prompts: Channel name -> prompt (see build_*_prompt)
+            count: Max ideas to keep per channel
+        Returns:
+            Channel name -> {"ideas": [...], "metrics": {...}}
+        """
+        return asyncio.run(self.generate_channels_async(prompts, count))
 
-            # Parse response
-            ideas = self._parse_claude_response(response.content[0].text, "quick-win")
+    async def generate_channels_async(self, prompts: Dict[str, str], count: int = 5) -> Dict[str, Dict]:
+        """
+        Put every channel's Claude call in flight at once on a shared client.
+        A failed channel returns no ideas and records its error in metrics.
+        """
+        logger.info(f"Generating ideas for channels in parallel: {list(prompts)}")
 
-            logger.info(f"✓ Generated {len(ideas)} quick-win ideas")
-            return ideas[:count]
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            outcomes = await asyncio.gather(
+                *(self._complete_async(client, channel, prompt) for channel, prompt in prompts.items()),
+                return_exceptions=True
+            )
 
-        except Exception as e:
-            logger.error(f"Error generating quick-win ideas: {e}")
-            return []
+        results = {}
+        for channel, outcome in zip(prompts, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error generating {channel} ideas: {outcome}")
+                ideas, metrics = [], {"model": self.model, "error": str(outcome)}
+            else:
+                ideas, metrics = outcome
+                logger.info(f"✓ Generated {len(ideas)} {channel} ideas in {metrics['latency_seconds']}s")
+
+            self.channel_metrics[channel] = metrics
+            results[channel] = {"ideas": ideas[:count], "metrics": metrics}
+
+        return results
+
+    def _complete(self, channel: str, prompt: str):
+        """Blocking Claude call for one channel, returns (ideas, metrics)"""
+        settings = self.CHANNELS[channel]
+        start = time.monotonic()
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=settings["max_tokens"],
+            temperature=settings["temperature"],
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
+
+        return self._handle_response(channel, response, time.monotonic() - start)
+
+    async def _complete_async(self, client: AsyncAnthropic, channel: str, prompt: str):
+        """Async Claude call for one channel, returns (ideas, metrics)"""
+        settings = self.CHANNELS[channel]
+        start = time.monotonic()
+
+        response = await client.messages.create(
+            model=self.model,
+            max_tokens=settings["max_tokens"],
+            temperature=settings["temperature"],
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
+
+        return self._handle_response(channel, response, time.monotonic() - start)
+
+    def _handle_response(self, channel: str, response, latency: float):
+        """
+        Parse a channel response and measure its usage.
+        An unparseable response yields no ideas and an error in metrics.
+        """
+        ideas = self._parse_claude_response(response.content[0].text, channel)
+        error = None
+        if ideas is None:
+            ideas, error = [], f"Unparseable {channel} response"
+
+        input_tokens = response.usage.input_tokens
+        output_tokens = response.usage.output_tokens
+        metrics = {
+            "model": self.model,
+            "latency_seconds": round(latency, 2),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cost_usd": round(calculate_cost(self.model, input_tokens, output_tokens), 6),
+            "ideas_generated": len(ideas)
+        }
+        if error:
+            metrics["error"] = error
+
+        return ideas, metrics
 
     def _prepare_vc_context(self, vc_sources: List[Dict], trends: List[Dict]) -> str:
         """Prepare context from VC sources and trends"""
@@ -220,8 +317,8 @@ Return your response as a JSON array of idea objects."""
 
         return "\n".join(context_parts)
 
-    def _parse_claude_response(self, response_text: str, channel: str) -> List[Dict]:
-        """Parse Claude's JSON response into structured ideas"""
+    def _parse_claude_response(self, response_text: str, channel: str) -> Optional[List[Dict]]:
+        """Parse Claude's JSON response into structured ideas (None if it can't be parsed)"""
         try:
             # Try to extract JSON from response
             # Claude sometimes wraps JSON in markdown code blocks
@@ -230,7 +327,7 @@ Return your response as a JSON array of idea objects."""
 
             if json_start == -1 or json_end == 0:
                 logger.error("No JSON array found in response")
-                return []
+                return None
 
             json_str = response_text[json_start:json_end]
             ideas_raw = json.loads(json_str)
@@ -276,10 +373,10 @@ Return your response as a JSON array of idea objects."""
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON: {e}")
             logger.debug(f"Response text: {response_text[:500]}...")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Error parsing Claude response: {e}")
-            return []
+            return None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+"""
+Near-duplicate detection for generated ideas (MinHash + LSH)
+
+Each idea's title and description become a set of stemmed words
+(stopwords dropped), so "AI coding assistant for developers" and "AI code
+assistant for software developers" mostly overlap. A MinHash signature
+estimates the Jaccard similarity of two such sets; banding the signature
+into an LSH table means a lookup only compares against ideas that share
+at least one band, so checking a candidate stays well under a
+millisecond however many ideas are indexed.
+"""
+import logging
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+LSH_BANDS = 32  # 4 rows per band: pairs above ~0.4 similarity share a band
+
+DEFAULT_DEDUPE_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+# Fixed seed: signatures must be comparable across processes and scans
+_rng = np.random.RandomState(1729)
+_PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+STOPWORDS = frozenset(
+    "a about an and are as at be by for from has in is it its of on or that the this to "
+    "with your you we our their into using use uses via who which app platform tool".split()
+)
+
+
+SUFFIXES = ("ings", "ing", "ers", "er", "ed", "es", "s")
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping, so coding, coder and code all stem to cod"""
+    for suffix in SUFFIXES:
+        if len(word) > len(suffix) + 2 and word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    return word.rstrip("e") if len(word) > 3 else word
+
+
+def shingles(text: str) -> Set[str]:
+    """Stemmed words of a text, lowercased, stopwords dropped"""
+    return {stem(word) for word in re.findall(r"[a-z0-9]+", text.lower()) if word not in STOPWORDS}
+
+
+def idea_text(title: Optional[str], description: Optional[str]) -> str:
+    """Text an idea is compared on"""
+    return f"{title or ''} {description or ''}"
+
+
+def signature(text: str) -> np.ndarray:
+    """MinHash signature (NUM_PERM 32-bit values) of a text"""
+    tokens = shingles(text)
+    if not tokens:
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint64)
+
+    hashes = np.fromiter((zlib.crc32(token.encode()) for token in tokens), dtype=np.uint64, count=len(tokens))
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=0)
+
+
+def pack_signature(sig: np.ndarray) -> bytes:
+    """Signature as stored in idea_signatures (NUM_PERM little-endian uint32s)"""
+    return sig.astype("<u4").tobytes()
+
+
+def unpack_signature(data: bytes) -> np.ndarray:
+    """Signature stored by pack_signature()"""
+    return np.frombuffer(data, dtype="<u4").astype(np.uint64)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(first == second)) / NUM_PERM
+
+
+class SimilarityIndex:
+    """LSH index of MinHash signatures for near-duplicate lookups"""
+
+    def __init__(self, threshold: float = DEFAULT_DEDUPE_THRESHOLD, bands: int = LSH_BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"bands must divide {NUM_PERM}")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self.signatures: Dict[Hashable, np.ndarray] = {}
+        self.buckets = [defaultdict(set) for _ in range(bands)]
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def __contains__(self, key):
+        return key in self.signatures
+
+    def _band_keys(self, sig: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, sig[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key: Hashable, sig: np.ndarray):
+        """Index a signature under a key (an idea id)"""
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = sig
+        for band, band_key in self._band_keys(sig):
+            self.buckets[band][band_key].add(key)
+
+    def remove(self, key: Hashable):
+        sig = self.signatures.pop(key, None)
+        if sig is None:
+            return
+        for band, band_key in self._band_keys(sig):
+            bucket = self.buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band][band_key]
+
+    def query(self, sig: np.ndarray) -> Optional[Tuple[Hashable, float]]:
+        """
+        Most similar indexed key at or above the threshold.
+        Returns:
+            (key, estimated similarity), or None if nothing is that close
+        """
+        candidates = set()
+        for band, band_key in self._band_keys(sig):
+            candidates.update(self.buckets[band].get(band_key, ()))
+
+        best = None
+        for key in candidates:
+            score = similarity(sig, self.signatures[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
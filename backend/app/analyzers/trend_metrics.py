@@ -0,0 +1,206 @@
+"""
+Vectorized trend metrics over stored history
+
+Loads the packed series of every active trend into one keywords x periods
+matrix (right-aligned on each series' latest point, NaN-padded on the
+left) and computes, for all rows in one NumPy pass:
+    growth_rate   % change of the last `window` periods over the `window` before
+    acceleration  growth_rate now minus growth_rate one window earlier
+    momentum      fast EWMA over slow EWMA, in %
+    z_score       latest value against the mean/std of the earlier periods
+    breakout      z_score at or above the breakout threshold
+
+Metrics are per period, so series are compared point for point whatever
+their step; a keyword without enough history gets NaN and is not ranked.
+"""
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import LargeBinary, type_coerce
+from sqlalchemy.orm import Session
+
+from app.models.database import Trend, TrendSeries
+from app.models.types import unpack
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERIODS = 90  # Latest points per series in the matrix
+GROWTH_WINDOW = 4
+FAST_SPAN = 4
+SLOW_SPAN = 16
+BREAKOUT_Z = 2.0
+
+# Metrics /trends/movers can rank by
+RANKINGS = ("momentum", "growth_rate", "acceleration", "z_score")
+
+
+def series_matrix(series: List[Sequence[int]], periods: int = DEFAULT_PERIODS) -> np.ndarray:
+    """Series (lists or arrays) right-aligned into a len(series) x periods float matrix, NaN where missing"""
+    tails = [points[-periods:] if points is not None else [] for points in series]
+    if tails and all(len(tail) == periods for tail in tails):
+        return np.vstack(tails).astype(float)
+
+    matrix = np.full((len(series), periods), np.nan)
+    for row, tail in enumerate(tails):
+        if len(tail):
+            matrix[row, periods - len(tail):] = tail
+    return matrix
+
+
+def _window_mean(matrix: np.ndarray, end: int, window: int) -> np.ndarray:
+    """Mean of the `window` periods ending `end` periods before the last (NaN if any is missing)"""
+    stop = matrix.shape[1] - end
+    start = stop - window
+    if start < 0:
+        return np.full(matrix.shape[0], np.nan)
+    return matrix[:, start:stop].mean(axis=1)
+
+
+def _growth(recent: np.ndarray, prior: np.ndarray) -> np.ndarray:
+    growth = np.full_like(recent, np.nan)
+    np.divide((recent - prior) * 100, prior, out=growth, where=prior > 0)
+    # A series rising from zero has no finite growth; rank it by its rise
+    rising_from_zero = (prior == 0) & (recent > 0)
+    growth[rising_from_zero] = recent[rising_from_zero] * 100
+    growth[(prior == 0) & (recent == 0)] = 0.0
+    return growth
+
+
+def _ewma(matrix: np.ndarray, span: int) -> np.ndarray:
+    """Exponentially weighted mean of each row, skipping missing periods"""
+    alpha = 2 / (span + 1)
+    weights = (1 - alpha) ** np.arange(matrix.shape[1] - 1, -1, -1)
+    present = ~np.isnan(matrix)
+    weighted = np.where(present, matrix, 0.0) @ weights
+    total = present @ weights
+    ewma = np.full(matrix.shape[0], np.nan)
+    np.divide(weighted, total, out=ewma, where=total > 0)
+    return ewma
+
+
+def compute_metrics(
+    matrix: np.ndarray,
+    window: int = GROWTH_WINDOW,
+    fast_span: int = FAST_SPAN,
+    slow_span: int = SLOW_SPAN,
+    breakout_z: float = BREAKOUT_Z
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics for every row of a keywords x periods matrix.
+    Returns:
+        Arrays keyed by metric name (see module docstring), one value per row
+    """
+    latest = matrix[:, -1]
+    growth = _growth(_window_mean(matrix, 0, window), _window_mean(matrix, window, window))
+    previous_growth = _growth(_window_mean(matrix, window, window), _window_mean(matrix, 2 * window, window))
+
+    fast, slow = _ewma(matrix, fast_span), _ewma(matrix, slow_span)
+    momentum = np.full_like(fast, np.nan)
+    np.divide((fast - slow) * 100, slow, out=momentum, where=slow > 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        baseline = matrix[:, :-1]
+        counts = np.sum(~np.isnan(baseline), axis=1)
+        mean = np.nansum(baseline, axis=1) / np.maximum(counts, 1)
+        variance = np.nansum((baseline - mean[:, None]) ** 2, axis=1) / np.maximum(counts, 1)
+        std = np.sqrt(variance)
+        z_score = np.where((counts >= 2 * window) & (std > 0), (latest - mean) / std, np.nan)
+
+    return {
+        "latest": latest,
+        "growth_rate": growth,
+        "acceleration": growth - previous_growth,
+        "momentum": momentum,
+        "z_score": z_score,
+        "breakout": z_score >= breakout_z,
+    }
+
+
+def top_rows(values: np.ndarray, limit: int) -> np.ndarray:
+    """Row indexes of the `limit` largest values, largest first (NaN never ranked)"""
+    if limit <= 0:
+        return np.array([], dtype=int)
+    ranked = np.where(np.isnan(values), -np.inf, values)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-ranked[candidates], limit - 1)[:limit]]
+    return candidates[np.argsort(-ranked[candidates], kind="stable")]
+
+
+def packed_points(stored: Optional[bytes]) -> Optional[np.ndarray]:
+    """Stored PackedInts bytes as an int32 array, without a Python list in between"""
+    if stored is None:
+        return None
+    return np.frombuffer(unpack(bytes(stored)), dtype="<i4")
+
+
+def active_series(db: Session, geo: Optional[str] = None, source: Optional[str] = None):
+    """(id, keyword, source, geo, packed) of active trends with a stored series"""
+    packed = type_coerce(TrendSeries.points, LargeBinary).label("packed")
+    query = db.query(Trend.id, Trend.keyword, Trend.source, Trend.geo, packed).join(
+        TrendSeries, TrendSeries.trend_id == Trend.id
+    ).filter(Trend.is_active == True)
+    if geo:
+        query = query.filter(Trend.geo == geo)
+    if source:
+        query = query.filter(Trend.source == source)
+    return query.all()
+
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def rank_movers(
+    db: Session,
+    by: str = "momentum",
+    limit: int = 20,
+    geo: Optional[str] = None,
+    source: Optional[str] = None,
+    periods: int = DEFAULT_PERIODS,
+    breakouts_only: bool = False
+) -> List[Dict]:
+    """
+    Active trends ranked by a metric over their stored history.
+    Args:
+        db: Database session
+        by: One of RANKINGS
+        limit: Number of movers returned
+        geo: Only trends for this region
+        source: Only trends from this source
+        periods: Latest points per series considered
+        breakouts_only: Only trends whose latest point is a z-score breakout
+    Returns:
+        Mover dicts, best first
+    """
+    if by not in RANKINGS:
+        raise ValueError(f"Unknown ranking {by!r}, expected one of {RANKINGS}")
+
+    rows = active_series(db, geo=geo, source=source)
+    if not rows:
+        return []
+
+    start = time.perf_counter()
+    metrics = compute_metrics(series_matrix([packed_points(row.packed) for row in rows], periods))
+    values = metrics[by]
+    if breakouts_only:
+        values = np.where(metrics["breakout"], values, np.nan)
+    ranked = top_rows(values, limit)
+    logger.info(f"✓ Ranked {len(rows)} trends by {by} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    return [
+        {
+            "keyword": rows[i].keyword,
+            "source": rows[i].source,
+            "geo": rows[i].geo,
+            "latest": _round(metrics["latest"][i]),
+            "growth_rate": _round(metrics["growth_rate"][i]),
+            "acceleration": _round(metrics["acceleration"][i]),
+            "momentum": _round(metrics["momentum"][i]),
+            "z_score": _round(metrics["z_score"][i]),
+            "breakout": bool(metrics["breakout"][i]),
+        }
+        for i in ranked
+    ]
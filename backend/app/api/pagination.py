@@ -0,0 +1,79 @@
+"""
+Keyset (cursor) pagination for list endpoints
+
+A list is ordered by a keyset: columns sorted descending and ending in the
+primary key, so every row has a unique position. A page's cursor encodes
+the keyset values of its last row, and the next page is the rows strictly
+after it:
+    WHERE (overall_score, created_at, id) < (:score, :created_at, :id)
+
+Backed by an index over the same columns, the database seeks straight to
+the cursor, so page 1000 costs the same as page 1 (OFFSET would read and
+discard every row before it). Cursors are opaque to clients: URL-safe
+base64 of the JSON-encoded values.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+# Largest page a list endpoint returns
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Opaque cursor for a row's keyset values"""
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _parse(value: Any, column) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if python_type is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"Bad cursor value for {column.key}")
+
+
+def decode_cursor(cursor: str, keyset: Sequence) -> Tuple:
+    """
+    Keyset values of a cursor.
+    Raises:
+        ValueError: If the cursor is malformed or wasn't issued for this keyset
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Malformed cursor")
+
+    if not isinstance(values, list) or len(values) != len(keyset):
+        raise ValueError("Malformed cursor")
+    try:
+        return tuple(_parse(value, column) for value, column in zip(values, keyset))
+    except (TypeError, ValueError):
+        raise ValueError("Malformed cursor")
+
+
+def after_cursor(keyset: Sequence, values: Sequence):
+    """Filter for rows after a cursor in a descending keyset order"""
+    return tuple_(*keyset) < tuple_(*values)
+
+
+def split_page(rows: List, limit: int, keyset: Sequence) -> Tuple[List, Optional[str]]:
+    """
+    Trim rows fetched with limit + 1 to one page.
+    Returns:
+        (page rows, cursor for the next page or None on the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]._mapping
+    return rows, encode_cursor([last[column] for column in keyset])
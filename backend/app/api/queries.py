@@ -0,0 +1,225 @@
+"""
+Query builders for hot read paths
+
+Each builder matches one of the composite indexes declared on the models,
+so filters and sort orders stay in sync with the index set. The query-plan
+test in tests/api runs EXPLAIN on every builder here.
+
+*_query builders return ORM Query objects for sync Sessions; *_select
+builders return the same statement as a Select for AsyncSession handlers.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, select, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from app.models.database import Idea, Trend, ScanJob, APIUsage, APIUsageDaily, RollupWatermark
+from app.models.search import apply_idea_search
+from app.api.pagination import after_cursor
+from app.services.usage_rollup import USAGE_ROLLUP_NAME
+from app.studio.models import StudioSession
+
+
+def month_bounds(now: datetime = None) -> Tuple[datetime, datetime]:
+    """Start of the current month and start of the next one"""
+    now = now or datetime.utcnow()
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def _monthly_usage_total(user_id: int, now: datetime = None):
+    """
+    Requests a user made this month: the daily rollup for rows at or below
+    the rollup watermark, plus the raw rows above it. One statement, so a
+    rollup committing mid-request can't double count.
+    """
+    start, end = month_bounds(now)
+
+    watermark = select(func.coalesce(func.max(RollupWatermark.last_id), 0)).where(
+        RollupWatermark.name == USAGE_ROLLUP_NAME
+    ).scalar_subquery()
+
+    rolled_up = select(func.coalesce(func.sum(APIUsageDaily.request_count), 0)).where(
+        APIUsageDaily.user_id == user_id,
+        APIUsageDaily.day >= start.date(),
+        APIUsageDaily.day < end.date()
+    ).scalar_subquery()
+
+    # A timestamp range (not extract(month/year)) so (user_id, timestamp) is used
+    recent = select(func.count(APIUsage.id)).where(
+        APIUsage.user_id == user_id,
+        APIUsage.timestamp >= start,
+        APIUsage.timestamp < end,
+        APIUsage.id > watermark
+    ).scalar_subquery()
+
+    return rolled_up + recent
+
+
+def monthly_usage_query(db: Session, user_id: int, now: datetime = None) -> Query:
+    """Count of a user's API requests this month (ix_api_usage_daily_user_day + raw tail)"""
+    return db.query(_monthly_usage_total(user_id, now))
+
+
+def monthly_usage_select(user_id: int, now: datetime = None) -> Select:
+    """Async variant of monthly_usage_query()"""
+    return select(_monthly_usage_total(user_id, now))
+
+
+def count_monthly_requests(db: Session, user_id: int, now: datetime = None) -> int:
+    """Number of API requests a user made this month"""
+    return monthly_usage_query(db, user_id, now).scalar() or 0
+
+
+async def count_monthly_requests_async(db: AsyncSession, user_id: int, now: datetime = None) -> int:
+    """Number of API requests a user made this month (AsyncSession)"""
+    return (await db.scalar(monthly_usage_select(user_id, now))) or 0
+
+
+def _idea_criteria(
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None
+) -> List:
+    criteria = []
+    if channel:
+        criteria.append(Idea.channel == channel)
+    if category:
+        criteria.append(Idea.category == category)
+    if min_score:
+        criteria.append(Idea.overall_score >= min_score)
+    return criteria
+
+
+# Idea lists page by (score, created_at, id), all descending
+IDEAS_KEYSET = (Idea.overall_score, Idea.created_at, Idea.id)
+IDEAS_ORDER = tuple(column.desc() for column in IDEAS_KEYSET)
+
+
+def ideas_query(
+    db: Session,
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None,
+    after: Optional[Tuple] = None
+) -> Query:
+    """
+    Ideas by overall score (ix_ideas_channel_score_created_id / category_... / score_...).
+    `after` is a decoded cursor: only ideas past it are returned.
+    """
+    query = db.query(Idea).filter(*_idea_criteria(channel, category, min_score))
+    if after:
+        query = query.filter(after_cursor(IDEAS_KEYSET, after))
+    return query.order_by(*IDEAS_ORDER)
+
+
+def ideas_select(
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None,
+    after: Optional[Tuple] = None
+) -> Select:
+    """Async variant of ideas_query()"""
+    statement = select(Idea).where(*_idea_criteria(channel, category, min_score))
+    if after:
+        statement = statement.where(after_cursor(IDEAS_KEYSET, after))
+    return statement.order_by(*IDEAS_ORDER)
+
+
+def search_ideas_select(
+    search: str,
+    dialect: str,
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None
+) -> Optional[Select]:
+    """Ideas matching a full-text search, best match first (ideas_fts / ix_ideas_search_vector)"""
+    return apply_idea_search(
+        select(Idea).where(*_idea_criteria(channel, category, min_score)), dialect, search
+    )
+
+
+def search_ideas_query(
+    db: Session,
+    search: str,
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None
+) -> Optional[Query]:
+    """Sync variant of search_ideas_select()"""
+    return apply_idea_search(
+        db.query(Idea).filter(*_idea_criteria(channel, category, min_score)), db.get_bind().dialect.name, search
+    )
+
+
+def quick_win_query(db: Session) -> Query:
+    """Quick-win ideas by monetization then feasibility (ix_ideas_channel_monetization)"""
+    return db.query(Idea).filter(
+        Idea.channel == "quick-win"
+    ).order_by(Idea.monetization_score.desc(), Idea.feasibility_score.desc())
+
+
+def active_trends_query(db: Session, min_momentum: Optional[float] = None) -> Query:
+    """Active trends by momentum (ix_trends_active_momentum)"""
+    query = db.query(Trend).filter(Trend.is_active == True)
+
+    if min_momentum:
+        query = query.filter(Trend.momentum_score >= min_momentum)
+
+    return query.order_by(Trend.momentum_score.desc())
+
+
+def usage_report_query(db: Session, user_id: int, start_day, end_day) -> Query:
+    """A user's daily usage rows between two dates (ix_api_usage_daily_user_day)"""
+    return db.query(APIUsageDaily).filter(
+        APIUsageDaily.user_id == user_id,
+        APIUsageDaily.day >= start_day,
+        APIUsageDaily.day < end_day
+    ).order_by(APIUsageDaily.day.desc(), APIUsageDaily.endpoint)
+
+
+def recent_scans_query(db: Session) -> Query:
+    """Scan jobs, newest first (ix_scan_jobs_started_at)"""
+    return db.query(ScanJob).order_by(ScanJob.started_at.desc())
+
+
+def last_completed_scan_query(db: Session) -> Query:
+    """Completed scan jobs, most recently completed first (ix_scan_jobs_status_completed)"""
+    return db.query(ScanJob).filter(
+        ScanJob.status == "completed"
+    ).order_by(ScanJob.completed_at.desc())
+
+
+# Session lists page by (created_at, id), both descending
+STUDIO_SESSIONS_KEYSET = (StudioSession.created_at, StudioSession.id)
+STUDIO_SESSIONS_ORDER = tuple(column.desc() for column in STUDIO_SESSIONS_KEYSET)
+
+
+def studio_sessions_query(db: Session, status: Optional[str] = None, after: Optional[Tuple] = None) -> Query:
+    """Studio sessions, newest first (ix_studio_sessions_status_created_id / created_id)"""
+    query = db.query(StudioSession)
+
+    if status:
+        query = query.filter(StudioSession.status == status)
+    if after:
+        query = query.filter(after_cursor(STUDIO_SESSIONS_KEYSET, after))
+
+    return query.order_by(*STUDIO_SESSIONS_ORDER)
+
+
+def studio_sessions_select(status: Optional[str] = None, after: Optional[Tuple] = None) -> Select:
+    """Async variant of studio_sessions_query()"""
+    statement = select(StudioSession)
+
+    if status:
+        statement = statement.where(StudioSession.status == status)
+    if after:
+        statement = statement.where(after_cursor(STUDIO_SESSIONS_KEYSET, after))
+
+    return statement.order_by(*STUDIO_SESSIONS_ORDER)
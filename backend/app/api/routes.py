@@ -1,26 +1,57 @@
 """
 FastAPI routes for ShapeX API
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import time
 
-from app.models.database import get_db, Idea, Trend, Source, ScanJob, User, APIKey
-from app.services.scanner import ShapeXScanner
-from app.auth.middleware import validate_api_key, track_api_usage, get_rate_limit_headers
+from app.models.database import get_db, get_async_db, get_read_db, get_async_read_db, Idea, Source, ScanJob, ScanCheckpoint, User, APIKey
+from app.analyzers.trend_metrics import rank_movers, RANKINGS
+from app.services.scan_events import scan_events, TERMINAL_EVENTS
+from app.services.scan_coordinator import scan_coordinator
+from app.services.response_cache import response_cache, IDEAS, TRENDS, SCANS
+from app.services.idea_stats import load_idea_totals, record_idea_changes, stats_snapshot, summarize_ideas
+from app.api.queries import (
+    count_monthly_requests_async,
+    ideas_query,
+    ideas_select,
+    search_ideas_select,
+    IDEAS_KEYSET,
+    quick_win_query,
+    active_trends_query,
+    recent_scans_query,
+    last_completed_scan_query
+)
+from app.api.pagination import decode_cursor, split_page, MAX_PAGE_SIZE
+from app.api.serializers import (
+    project,
+    rows_to_dicts,
+    IDEA_LIST_FIELDS,
+    STRATEGIC_OPPORTUNITY_FIELDS,
+    QUICK_WIN_OPPORTUNITY_FIELDS,
+    TREND_LIST_FIELDS
+)
+from app.auth.middleware import validate_api_key, track_api_usage_async, get_rate_limit_headers
 from app.auth import api_key_header
+import asyncio
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Seconds between keep-alive messages on quiet scan progress sockets
+SCAN_WS_HEARTBEAT_SECONDS = 30
+
 
 # ===== AUTHENTICATION DEPENDENCY =====
 
 async def get_authenticated_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Depends(api_key_header)
 ) -> Tuple[User, APIKey]:
     """Dependency to get authenticated user"""
@@ -40,6 +71,17 @@ def get_scanner_config():
         "enable_a16z_scraper": os.getenv("ENABLE_A16Z_SCRAPER", "true").lower() == "true",
         "enable_product_hunt": os.getenv("ENABLE_PRODUCT_HUNT", "true").lower() == "true",
         "enable_google_trends": os.getenv("ENABLE_GOOGLE_TRENDS", "true").lower() == "true",
+        "parallel_generation": os.getenv("PARALLEL_GENERATION", "true").lower() == "true",
+        "enable_http_cache": os.getenv("ENABLE_HTTP_CACHE", "true").lower() == "true",
+        "enable_idea_dedupe": os.getenv("ENABLE_IDEA_DEDUPE", "true").lower() == "true",
+        "idea_dedupe_threshold": float(os.getenv("IDEA_DEDUPE_THRESHOLD", 0.5)),
+        "trends_batch_mode": os.getenv("TRENDS_BATCH_MODE", "true").lower() == "true",
+        "trends_anchor": os.getenv("TRENDS_ANCHOR") or None,
+        "trends_timeframe": os.getenv("TRENDS_TIMEFRAME", "today 3-m"),
+        "trends_geo": os.getenv("TRENDS_GEO", "US"),
+        "trends_cache_ttl_hours": float(os.getenv("TRENDS_CACHE_TTL_HOURS", 24)),
+        "source_timeout_seconds": float(os.getenv("SOURCE_TIMEOUT_SECONDS", 60)),
+        "trends_timeout_seconds": float(os.getenv("TRENDS_TIMEOUT_SECONDS", 120)),
     }
 
 
@@ -47,17 +89,21 @@ def get_scanner_config():
 
 @router.get("/ideas")
 async def list_ideas(
-    response: Response,
     channel: Optional[str] = None,
     category: Optional[str] = None,
     min_score: Optional[float] = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     user_and_key: Tuple[User, APIKey] = Depends(get_authenticated_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db),
+    usage_db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all generated ideas with optional filters
 
+    Ideas come best first; pass the response's next_cursor (with the same
+    filters) to get the next page. next_cursor is null on the last page.
+
     **Authentication Required**: X-API-Key header
 
     **Rate Limits**:
@@ -69,68 +115,99 @@ async def list_ideas(
     start_time = time.time()
     user, api_key = user_and_key
 
-    # Add rate limit headers
-    from sqlalchemy import extract
-    current_month = datetime.utcnow().month
-    current_year = datetime.utcnow().year
+    # Rate limit headers (sent with cached responses too)
+    monthly_requests = await count_monthly_requests_async(usage_db, user.id)
+    rate_limit_headers = get_rate_limit_headers(user.tier, monthly_requests)
 
-    from app.models.database import APIUsage
-    monthly_requests = db.query(func.count(APIUsage.id)).filter(
-        APIUsage.user_id == user.id,
-        extract('month', APIUsage.timestamp) == current_month,
-        extract('year', APIUsage.timestamp) == current_year
-    ).scalar()
+    try:
+        after = decode_cursor(cursor, IDEAS_KEYSET) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    key = response_cache.key("/ideas", {
+        "channel": channel, "category": category, "min_score": min_score, "limit": limit, "cursor": cursor
+    })
+    stamp = await response_cache.stamp_async((IDEAS,))
+    body = response_cache.get(key, stamp)
+    if body is None:
+        rows = (await db.execute(project(
+            ideas_select(channel=channel, category=category, min_score=min_score, after=after),
+            IDEA_LIST_FIELDS
+        ).limit(limit + 1))).all()
+        rows, next_cursor = split_page(rows, limit, IDEAS_KEYSET)
+        body = response_cache.put(key, stamp, {
+            "count": len(rows),
+            "ideas": rows_to_dicts(rows, IDEA_LIST_FIELDS),
+            "next_cursor": next_cursor
+        })
 
-    rate_limit_headers = get_rate_limit_headers(user.tier, monthly_requests)
-    for key, value in rate_limit_headers.items():
-        response.headers[key] = value
+    # Track API usage
+    response_time = int((time.time() - start_time) * 1000)
+    await track_api_usage_async(
+        db=usage_db,
+        user_id=user.id,
+        api_key_id=api_key.id,
+        endpoint="/api/ideas",
+        method="GET",
+        status_code=200,
+        response_time_ms=response_time
+    )
+
+    return Response(content=body, media_type="application/json", headers=rate_limit_headers)
+
+
+@router.get("/ideas/search")
+async def search_ideas(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    channel: Optional[str] = None,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    user_and_key: Tuple[User, APIKey] = Depends(get_authenticated_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    usage_db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full-text search over idea titles, descriptions, target markets,
+    differentiation and key features, best match first.
+    Accepts the same filters as /ideas; page with limit and offset.
 
-    query = db.query(Idea)
+    **Authentication Required**: X-API-Key header
+    """
+    start_time = time.time()
+    user, api_key = user_and_key
 
-    if channel:
-        query = query.filter(Idea.channel == channel)
-    if category:
-        query = query.filter(Idea.category == category)
-    if min_score:
-        query = query.filter(Idea.overall_score >= min_score)
+    monthly_requests = await count_monthly_requests_async(usage_db, user.id)
+    for key, value in get_rate_limit_headers(user.tier, monthly_requests).items():
+        response.headers[key] = value
 
-    ideas = query.order_by(Idea.overall_score.desc(), Idea.created_at.desc()).limit(limit).all()
+    statement = search_ideas_select(
+        q, db.get_bind().dialect.name, channel=channel, category=category, min_score=min_score
+    )
+    rows = []
+    if statement is not None:
+        rows = (await db.execute(project(statement, IDEA_LIST_FIELDS).limit(limit).offset(offset))).all()
 
     # Track API usage
     response_time = int((time.time() - start_time) * 1000)
-    track_api_usage(
-        db=db,
+    await track_api_usage_async(
+        db=usage_db,
         user_id=user.id,
         api_key_id=api_key.id,
-        endpoint="/api/ideas",
+        endpoint="/api/ideas/search",
         method="GET",
         status_code=200,
         response_time_ms=response_time
     )
 
     return {
-        "count": len(ideas),
-        "ideas": [
-            {
-                "id": idea.id,
-                "title": idea.title,
-                "description": idea.description,
-                "category": idea.category,
-                "channel": idea.channel,
-                "overall_score": idea.overall_score,
-                "feasibility_score": idea.feasibility_score,
-                "monetization_score": idea.monetization_score,
-                "market_demand_score": idea.market_demand_score,
-                "target_market": idea.target_market,
-                "revenue_model": idea.revenue_model,
-                "estimated_time_to_build": idea.estimated_time_to_build,
-                "estimated_startup_cost": idea.estimated_startup_cost,
-                "status": idea.status,
-                "favorite": idea.favorite,
-                "created_at": idea.created_at.isoformat()
-            }
-            for idea in ideas
-        ]
+        "query": q,
+        "count": len(rows),
+        "offset": offset,
+        "next_offset": offset + len(rows) if len(rows) == limit else None,
+        "ideas": rows_to_dicts(rows, IDEA_LIST_FIELDS)
     }
 
 
@@ -139,7 +216,8 @@ async def get_idea(
     idea_id: int,
     response: Response,
     user_and_key: Tuple[User, APIKey] = Depends(get_authenticated_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db),
+    usage_db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get detailed information about a specific idea
@@ -149,15 +227,15 @@ async def get_idea(
     start_time = time.time()
     user, api_key = user_and_key
 
-    idea = db.query(Idea).filter(Idea.id == idea_id).first()
+    idea = await db.get(Idea, idea_id)
 
     if not idea:
         raise HTTPException(status_code=404, detail="Idea not found")
 
     # Track API usage
     response_time = int((time.time() - start_time) * 1000)
-    track_api_usage(
-        db=db,
+    await track_api_usage_async(
+        db=usage_db,
         user_id=user.id,
         api_key_id=api_key.id,
         endpoint=f"/api/ideas/{idea_id}",
@@ -207,6 +285,8 @@ def update_idea(idea_id: int, updates: dict, db: Session = Depends(get_db)):
     if not idea:
         raise HTTPException(status_code=404, detail="Idea not found")
 
+    before = stats_snapshot(idea)
+
     # Update allowed fields
     if "status" in updates:
         idea.status = updates["status"]
@@ -216,40 +296,150 @@ def update_idea(idea_id: int, updates: dict, db: Session = Depends(get_db)):
         idea.notes = updates["notes"]
 
     idea.updated_at = datetime.utcnow()
+    record_idea_changes(db, added=[idea], removed=[before])
     db.commit()
+    response_cache.invalidate(IDEAS)
 
     return {"success": True, "message": "Idea updated"}
 
 
 # ===== SCAN ENDPOINTS =====
 
+SCAN_TRIGGER_MESSAGES = {
+    "started": "Scan started in background",
+    "attached": "A matching scan is already running, attached to it",
+    "queued": "Scan queued behind the running scan",
+}
+
+
 @router.post("/scan/now")
-def trigger_scan(
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
-):
-    """Trigger an immediate scan (runs in background)"""
+def trigger_scan(queue: bool = False):
+    """
+    Trigger an immediate scan (runs in background, progress streamed over WebSocket)
+
+    Only one scan runs at a time. Triggers while a scan with the same
+    configuration is running attach to it; with a different configuration
+    they are queued if `queue=true`, otherwise rejected with 409.
+    """
     config = get_scanner_config()
+    submitted = scan_coordinator.submit(config, job_type="manual", queue=queue)
+    job_id = submitted["job_id"]
+
+    if submitted["status"] == "busy":
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Another scan is running", "job_id": job_id}
+        )
+
+    return {
+        "success": True,
+        "message": SCAN_TRIGGER_MESSAGES[submitted["status"]],
+        "scan_status": submitted["status"],
+        "job_id": job_id,
+        "websocket_url": f"/api/scan/ws/{job_id}",
+        "status": "Check /scan/status for progress"
+    }
 
-    def run_scan():
-        db_session = next(get_db())
-        scanner = ShapeXScanner(db=db_session, config=config)
-        scanner.run_full_scan(job_type="manual")
-        db_session.close()
 
-    background_tasks.add_task(run_scan)
+@router.post("/scan/{job_id}/resume")
+def resume_scan(
+    job_id: int,
+    queue: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Resume a failed scan from its first incomplete stage (runs in background)"""
+    job = db.query(ScanJob).filter(ScanJob.id == job_id).first()
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Scan job not found")
+    if job.status != "failed":
+        raise HTTPException(status_code=409, detail=f"Scan job is {job.status}, only failed scans can be resumed")
+
+    completed_stages = [
+        checkpoint.stage
+        for checkpoint in db.query(ScanCheckpoint).filter(ScanCheckpoint.job_id == job_id)
+    ]
+    submitted = scan_coordinator.submit(get_scanner_config(), job_type=job.job_type, queue=queue, resume_job_id=job_id)
+
+    if submitted["status"] == "busy":
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Another scan is running", "job_id": submitted["job_id"]}
+        )
 
     return {
         "success": True,
-        "message": "Scan started in background",
+        "message": "Scan resumed in background" if submitted["status"] == "started" else SCAN_TRIGGER_MESSAGES[submitted["status"]],
+        "scan_status": submitted["status"],
+        "job_id": job_id,
+        "completed_stages": completed_stages,
+        "websocket_url": f"/api/scan/ws/{job_id}",
         "status": "Check /scan/status for progress"
     }
 
 
+@router.websocket("/scan/ws/{job_id}")
+async def scan_progress_websocket(
+    websocket: WebSocket,
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream a scan's progress events.
+
+    Sends a snapshot (job status and events so far) on connect, then each
+    event as it happens until the scan completes or fails.
+    """
+    await websocket.accept()
+
+    job = await db.get(ScanJob, job_id)
+    # Status is all that is needed; don't hold a connection while streaming
+    await db.close()
+    if not job:
+        await websocket.send_json({"type": "error", "message": "Scan job not found"})
+        await websocket.close()
+        return
+
+    queue, events = scan_events.subscribe(job_id)
+    try:
+        await websocket.send_json({
+            "type": "snapshot",
+            "job_id": job_id,
+            "status": job.status,
+            "events": events
+        })
+
+        # Finished scans have nothing to stream
+        finished = job.status not in ("running", "queued") or any(e["type"] in TERMINAL_EVENTS for e in events)
+        last_seq = events[-1]["seq"] if events else 0
+
+        while not finished:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=SCAN_WS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Long stages (Trends, Claude) are quiet; detects dropped clients
+                await websocket.send_json({"type": "heartbeat", "job_id": job_id})
+                continue
+
+            if event["seq"] <= last_seq:
+                continue  # Already in the snapshot
+
+            await websocket.send_json(event)
+            finished = event["type"] in TERMINAL_EVENTS
+
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info(f"Scan progress WebSocket disconnected for job {job_id}")
+
+    finally:
+        scan_events.unsubscribe(job_id, queue)
+
+
 @router.get("/scan/status")
 def get_scan_status(db: Session = Depends(get_db)):
     """Get status of recent scans"""
-    recent_jobs = db.query(ScanJob).order_by(ScanJob.started_at.desc()).limit(10).all()
+    recent_jobs = recent_scans_query(db).limit(10).all()
 
     return {
         "recent_scans": [
@@ -263,6 +453,7 @@ def get_scan_status(db: Session = Depends(get_db)):
                 "started_at": job.started_at.isoformat(),
                 "completed_at": job.completed_at.isoformat() if job.completed_at else None,
                 "duration_seconds": job.duration_seconds,
+                "channel_metrics": job.channel_metrics,
                 "error": job.error_message
             }
             for job in recent_jobs
@@ -276,123 +467,101 @@ def get_scan_status(db: Session = Depends(get_db)):
 def get_trends(
     limit: int = 20,
     min_momentum: Optional[float] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get current market trends"""
-    query = db.query(Trend).filter(Trend.is_active == True)
+    def build():
+        rows = project(active_trends_query(db, min_momentum=min_momentum), TREND_LIST_FIELDS).limit(limit).all()
+        return {
+            "count": len(rows),
+            "trends": rows_to_dicts(rows, TREND_LIST_FIELDS)
+        }
 
-    if min_momentum:
-        query = query.filter(Trend.momentum_score >= min_momentum)
+    return response_cache.respond("/trends", {"limit": limit, "min_momentum": min_momentum}, (TRENDS,), build)
 
-    trends = query.order_by(Trend.momentum_score.desc()).limit(limit).all()
 
-    return {
-        "count": len(trends),
-        "trends": [
-            {
-                "keyword": trend.keyword,
-                "momentum_score": trend.momentum_score,
-                "growth_rate": trend.growth_rate,
-                "category": trend.category,
-                "related_keywords": trend.related_keywords,
-                "detected_at": trend.detected_at.isoformat()
-            }
-            for trend in trends
-        ]
-    }
+@router.get("/trends/movers")
+def get_trend_movers(
+    sort: str = "momentum",
+    limit: int = Query(20, ge=1, le=200),
+    geo: Optional[str] = None,
+    breakouts_only: bool = False,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get the fastest-moving trends over their stored history
+
+    sort: momentum (fast vs slow EWMA), growth_rate, acceleration or z_score
+    breakouts_only: only trends whose latest point is a z-score breakout
+    """
+    if sort not in RANKINGS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(RANKINGS)}")
+
+    def build():
+        movers = rank_movers(db, by=sort, limit=limit, geo=geo, breakouts_only=breakouts_only)
+        return {
+            "count": len(movers),
+            "sort": sort,
+            "movers": movers
+        }
+
+    params = {"sort": sort, "limit": limit, "geo": geo, "breakouts_only": breakouts_only}
+    return response_cache.respond("/trends/movers", params, (TRENDS,), build)
 
 
 @router.get("/stats")
-def get_statistics(db: Session = Depends(get_db)):
+def get_statistics(db: Session = Depends(get_read_db)):
     """Get ShapeX statistics"""
-    total_ideas = db.query(Idea).count()
-    strategic_ideas = db.query(Idea).filter(Idea.channel == "strategic").count()
-    quick_win_ideas = db.query(Idea).filter(Idea.channel == "quick-win").count()
-    favorite_ideas = db.query(Idea).filter(Idea.favorite == True).count()
+    return response_cache.respond("/stats", {}, (IDEAS, SCANS), lambda: _statistics(db))
 
-    # Average scores
-    ideas = db.query(Idea).all()
-    avg_overall_score = sum(i.overall_score for i in ideas) / len(ideas) if ideas else 0
-    avg_feasibility = sum(i.feasibility_score for i in ideas) / len(ideas) if ideas else 0
-    avg_monetization = sum(i.monetization_score for i in ideas) / len(ideas) if ideas else 0
 
-    # Top categories
-    categories = db.query(Idea.category, func.count(Idea.id)).group_by(Idea.category).all()
-    top_categories = sorted(categories, key=lambda x: x[1], reverse=True)[:5]
+def _statistics(db: Session) -> Dict:
+    # Idea counts and averages from the idea_stats summary (a few rows per channel/category)
+    stats = summarize_ideas(load_idea_totals(db))
 
     # Recent scan stats
-    recent_scan = db.query(ScanJob).filter(ScanJob.status == "completed").order_by(ScanJob.completed_at.desc()).first()
+    recent_scan = last_completed_scan_query(db).first()
+    stats["last_scan"] = {
+        "completed_at": recent_scan.completed_at.isoformat() if recent_scan else None,
+        "ideas_generated": recent_scan.ideas_generated if recent_scan else 0,
+        "duration_seconds": recent_scan.duration_seconds if recent_scan else 0
+    } if recent_scan else None
 
-    return {
-        "ideas": {
-            "total": total_ideas,
-            "strategic": strategic_ideas,
-            "quick_wins": quick_win_ideas,
-            "favorites": favorite_ideas
-        },
-        "scores": {
-            "average_overall": round(avg_overall_score, 2),
-            "average_feasibility": round(avg_feasibility, 2),
-            "average_monetization": round(avg_monetization, 2)
-        },
-        "categories": {
-            "top": [{"name": cat, "count": count} for cat, count in top_categories]
-        },
-        "last_scan": {
-            "completed_at": recent_scan.completed_at.isoformat() if recent_scan else None,
-            "ideas_generated": recent_scan.ideas_generated if recent_scan else 0,
-            "duration_seconds": recent_scan.duration_seconds if recent_scan else 0
-        } if recent_scan else None
-    }
+    return stats
 
 
 @router.get("/opportunities/strategic")
-def get_strategic_opportunities(limit: int = 10, db: Session = Depends(get_db)):
+def get_strategic_opportunities(limit: int = 10, db: Session = Depends(get_read_db)):
     """Get top strategic opportunities (VC-backed ideas)"""
-    ideas = db.query(Idea).filter(
-        Idea.channel == "strategic"
-    ).order_by(Idea.overall_score.desc()).limit(limit).all()
+    def build():
+        rows = project(ideas_query(db, channel="strategic"), STRATEGIC_OPPORTUNITY_FIELDS).limit(limit).all()
+        return {
+            "count": len(rows),
+            "opportunities": rows_to_dicts(rows, STRATEGIC_OPPORTUNITY_FIELDS)
+        }
 
-    return {
-        "count": len(ideas),
-        "opportunities": [
-            {
-                "id": idea.id,
-                "title": idea.title,
-                "description": idea.description,
-                "category": idea.category,
-                "overall_score": idea.overall_score,
-                "target_market": idea.target_market,
-                "estimated_time_to_build": idea.estimated_time_to_build
-            }
-            for idea in ideas
-        ]
-    }
+    return response_cache.respond("/opportunities/strategic", {"limit": limit}, (IDEAS,), build)
 
 
 @router.get("/opportunities/quick-wins")
-def get_quick_win_opportunities(limit: int = 10, db: Session = Depends(get_db)):
+def get_quick_win_opportunities(limit: int = 10, db: Session = Depends(get_read_db)):
     """Get top quick-win opportunities (fast monetization)"""
-    ideas = db.query(Idea).filter(
-        Idea.channel == "quick-win"
-    ).order_by(Idea.monetization_score.desc(), Idea.feasibility_score.desc()).limit(limit).all()
+    def build():
+        rows = project(quick_win_query(db), QUICK_WIN_OPPORTUNITY_FIELDS).limit(limit).all()
+        return {
+            "count": len(rows),
+            "opportunities": rows_to_dicts(rows, QUICK_WIN_OPPORTUNITY_FIELDS)
+        }
 
-    return {
-        "count": len(ideas),
-        "opportunities": [
-            {
-                "id": idea.id,
-                "title": idea.title,
-                "description": idea.description,
-                "category": idea.category,
-                "overall_score": idea.overall_score,
-                "monetization_score": idea.monetization_score,
-                "estimated_time_to_build": idea.estimated_time_to_build,
-                "estimated_startup_cost": idea.estimated_startup_cost
-            }
-            for idea in ideas
-        ]
-    }
+    return response_cache.respond("/opportunities/quick-wins", {"limit": limit}, (IDEAS,), build)
+
+
+# ===== RESPONSE CACHE =====
+
+@router.get("/cache/stats")
+def get_cache_stats():
+    """Response cache hit/miss counters per endpoint, entries and generations"""
+    return response_cache.stats()
 
 
 # ===== HEALTH CHECK =====
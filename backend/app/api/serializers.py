@@ -0,0 +1,103 @@
+"""
+Column projections and row serialization for list endpoints
+
+List endpoints return a handful of scalar fields per row. Selecting just
+those columns as tuples skips ORM identity-map bookkeeping and never reads
+JSON or Text columns the response doesn't use.
+
+A field list is [(response key, column), ...]; the same list drives the
+SELECT and the serializer so they cannot drift apart.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Query
+
+from app.models.database import Idea, Trend
+from app.studio.models import StudioSession
+
+Fields = List[Tuple[str, Any]]
+
+IDEA_LIST_FIELDS: Fields = [
+    ("id", Idea.id),
+    ("title", Idea.title),
+    ("description", Idea.description),
+    ("category", Idea.category),
+    ("channel", Idea.channel),
+    ("overall_score", Idea.overall_score),
+    ("feasibility_score", Idea.feasibility_score),
+    ("monetization_score", Idea.monetization_score),
+    ("market_demand_score", Idea.market_demand_score),
+    ("target_market", Idea.target_market),
+    ("revenue_model", Idea.revenue_model),
+    ("estimated_time_to_build", Idea.estimated_time_to_build),
+    ("estimated_startup_cost", Idea.estimated_startup_cost),
+    ("status", Idea.status),
+    ("favorite", Idea.favorite),
+    ("created_at", Idea.created_at),
+]
+
+STRATEGIC_OPPORTUNITY_FIELDS: Fields = [
+    ("id", Idea.id),
+    ("title", Idea.title),
+    ("description", Idea.description),
+    ("category", Idea.category),
+    ("overall_score", Idea.overall_score),
+    ("target_market", Idea.target_market),
+    ("estimated_time_to_build", Idea.estimated_time_to_build),
+]
+
+QUICK_WIN_OPPORTUNITY_FIELDS: Fields = [
+    ("id", Idea.id),
+    ("title", Idea.title),
+    ("description", Idea.description),
+    ("category", Idea.category),
+    ("overall_score", Idea.overall_score),
+    ("monetization_score", Idea.monetization_score),
+    ("estimated_time_to_build", Idea.estimated_time_to_build),
+    ("estimated_startup_cost", Idea.estimated_startup_cost),
+]
+
+TREND_LIST_FIELDS: Fields = [
+    ("keyword", Trend.keyword),
+    ("momentum_score", Trend.momentum_score),
+    ("growth_rate", Trend.growth_rate),
+    ("category", Trend.category),
+    ("related_keywords", Trend.related_keywords),
+    ("detected_at", Trend.detected_at),
+]
+
+STUDIO_SESSION_LIST_FIELDS: Fields = [
+    ("session_id", StudioSession.session_id),
+    ("idea_id", StudioSession.idea_id),
+    ("status", StudioSession.status),
+    ("progress", StudioSession.progress),
+    ("total_cost_usd", StudioSession.total_cost_usd),
+    ("duration_seconds", StudioSession.duration_seconds),
+    ("created_at", StudioSession.created_at),
+]
+
+
+def project(query: Union[Query, Select], fields: Fields) -> Union[Query, Select]:
+    """Replace a query's entity with just the listed columns (filters and order kept)"""
+    columns = [column for _, column in fields]
+    if isinstance(query, Query):
+        return query.with_entities(*columns)
+    return query.with_only_columns(*columns)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def row_to_dict(row: Tuple, fields: Fields) -> Dict[str, Any]:
+    """Response dict for one projected row"""
+    return {key: _jsonable(value) for (key, _), value in zip(fields, row)}
+
+
+def rows_to_dicts(rows: Iterable[Tuple], fields: Fields) -> List[Dict[str, Any]]:
+    """Response dicts for projected rows"""
+    return [row_to_dict(row, fields) for row in rows]
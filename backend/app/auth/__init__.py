@@ -1,6 +1,6 @@
 """
 Authentication module
 """
-from .middleware import validate_api_key, generate_api_key, track_api_usage, get_rate_limit_headers, api_key_header
+from .middleware import validate_api_key, generate_api_key, track_api_usage, track_api_usage_async, get_rate_limit_headers, api_key_header
 
-__all__ = ["validate_api_key", "generate_api_key", "track_api_usage", "get_rate_limit_headers", "api_key_header"]
+__all__ = ["validate_api_key", "generate_api_key", "track_api_usage", "track_api_usage_async", "get_rate_limit_headers", "api_key_header"]
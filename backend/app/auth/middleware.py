@@ -3,11 +3,14 @@ Authentication middleware for API key validation
 """
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 import secrets
 
 from app.models.database import APIKey, User, APIUsage
+from app.api.queries import count_monthly_requests_async, month_bounds
 
 # API key header scheme
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -29,7 +32,7 @@ def generate_api_key() -> str:
 
 async def validate_api_key(
     api_key: str = Security(api_key_header),
-    db: Session = None
+    db: AsyncSession = None
 ) -> tuple:
     """
     Validate API key and return (user, api_key_obj)
@@ -42,10 +45,10 @@ async def validate_api_key(
         )
 
     # Look up API key
-    api_key_obj = db.query(APIKey).filter(
+    api_key_obj = await db.scalar(select(APIKey).where(
         APIKey.key == api_key,
         APIKey.is_active == True
-    ).first()
+    ))
 
     if not api_key_obj:
         raise HTTPException(
@@ -61,7 +64,7 @@ async def validate_api_key(
         )
 
     # Get user
-    user = db.query(User).filter(User.id == api_key_obj.user_id).first()
+    user = await db.get(User, api_key_obj.user_id)
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -73,15 +76,7 @@ async def validate_api_key(
     tier_limit = TIER_LIMITS.get(user.tier, 10)
 
     # Count requests this month
-    from sqlalchemy import func, extract
-    current_month = datetime.utcnow().month
-    current_year = datetime.utcnow().year
-
-    monthly_requests = db.query(func.count(APIUsage.id)).filter(
-        APIUsage.user_id == user.id,
-        extract('month', APIUsage.timestamp) == current_month,
-        extract('year', APIUsage.timestamp) == current_year
-    ).scalar()
+    monthly_requests = await count_monthly_requests_async(db, user.id)
 
     if monthly_requests >= tier_limit:
         raise HTTPException(
@@ -90,29 +85,27 @@ async def validate_api_key(
             headers={
                 "X-RateLimit-Limit": str(tier_limit),
                 "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int((datetime.utcnow().replace(day=1, month=current_month + 1 if current_month < 12 else 1).timestamp())))
+                "X-RateLimit-Reset": str(int(month_bounds()[1].timestamp()))
             }
         )
 
     # Update last used
     api_key_obj.last_used_at = datetime.utcnow()
     api_key_obj.requests_made += 1
-    db.commit()
+    await db.commit()
 
     return user, api_key_obj
 
 
-def track_api_usage(
-    db: Session,
+def _usage_record(
     user_id: int,
     api_key_id: int,
     endpoint: str,
     method: str,
     status_code: int,
     response_time_ms: int = 0
-):
-    """Track API usage for analytics"""
-    usage = APIUsage(
+) -> APIUsage:
+    return APIUsage(
         user_id=user_id,
         api_key_id=api_key_id,
         endpoint=endpoint,
@@ -121,10 +114,36 @@ def track_api_usage(
         response_time_ms=response_time_ms,
         timestamp=datetime.utcnow()
     )
-    db.add(usage)
+
+
+def track_api_usage(
+    db: Session,
+    user_id: int,
+    api_key_id: int,
+    endpoint: str,
+    method: str,
+    status_code: int,
+    response_time_ms: int = 0
+):
+    """Track API usage for analytics"""
+    db.add(_usage_record(user_id, api_key_id, endpoint, method, status_code, response_time_ms))
     db.commit()
 
 
+async def track_api_usage_async(
+    db: AsyncSession,
+    user_id: int,
+    api_key_id: int,
+    endpoint: str,
+    method: str,
+    status_code: int,
+    response_time_ms: int = 0
+):
+    """Track API usage for analytics (AsyncSession)"""
+    db.add(_usage_record(user_id, api_key_id, endpoint, method, status_code, response_time_ms))
+    await db.commit()
+
+
 def get_rate_limit_headers(user_tier: str, requests_used: int) -> dict:
     """Get rate limit headers for response"""
     tier_limit = TIER_LIMITS.get(user_tier, 10)
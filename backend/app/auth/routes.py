@@ -1,17 +1,21 @@
 """
 Authentication and user management routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import List
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.models.database import get_db, User, APIKey, Subscription
-from app.auth.middleware import generate_api_key
+from app.auth.middleware import generate_api_key, api_key_header
+from app.api.queries import count_monthly_requests, usage_report_query
 
 router = APIRouter()
 
+# /usage reads the daily rollup, which is kept after raw rows are purged
+USAGE_REPORT_MAX_DAYS = 365
+
 
 # ===== REQUEST/RESPONSE MODELS =====
 
@@ -111,7 +115,7 @@ def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
 # ===== USER INFO ENDPOINT =====
 
 @router.get("/me")
-def get_current_user(api_key: str = Depends(), db: Session = Depends(get_db)):
+def get_current_user(api_key: str = Depends(api_key_header), db: Session = Depends(get_db)):
     """
     Get current user information based on API key
     Requires: X-API-Key header
@@ -137,16 +141,7 @@ def get_current_user(api_key: str = Depends(), db: Session = Depends(get_db)):
         )
 
     # Get usage stats
-    from sqlalchemy import func, extract
-    current_month = datetime.utcnow().month
-    current_year = datetime.utcnow().year
-
-    from app.models.database import APIUsage
-    monthly_requests = db.query(func.count(APIUsage.id)).filter(
-        APIUsage.user_id == user.id,
-        extract('month', APIUsage.timestamp) == current_month,
-        extract('year', APIUsage.timestamp) == current_year
-    ).scalar()
+    monthly_requests = count_monthly_requests(db, user.id)
 
     tier_limits = {
         "free": 10,
@@ -172,10 +167,58 @@ def get_current_user(api_key: str = Depends(), db: Session = Depends(get_db)):
     }
 
 
+@router.get("/usage")
+def get_usage_report(
+    days: int = Query(30, ge=1, le=USAGE_REPORT_MAX_DAYS),
+    api_key: str = Depends(api_key_header),
+    db: Session = Depends(get_db)
+):
+    """
+    Daily API usage for the current user, per key and endpoint.
+    Read from the daily rollup, so the latest few minutes may not be included yet.
+    Requires: X-API-Key header
+    """
+    api_key_obj = db.query(APIKey).filter(
+        APIKey.key == api_key,
+        APIKey.is_active == True
+    ).first()
+    if not api_key_obj:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key"
+        )
+
+    end_day = datetime.utcnow().date() + timedelta(days=1)
+    rows = usage_report_query(db, api_key_obj.user_id, end_day - timedelta(days=days), end_day).all()
+
+    return {
+        "days": days,
+        "total_requests": sum(row.request_count for row in rows),
+        "daily": [
+            {
+                "day": row.day.isoformat(),
+                "api_key_id": row.api_key_id,
+                "endpoint": row.endpoint,
+                "method": row.method,
+                "requests": row.request_count,
+                "errors": row.error_count,
+                "latency_ms": {
+                    "avg": round(row.avg_response_ms, 1) if row.avg_response_ms is not None else None,
+                    "p50": row.p50_response_ms,
+                    "p95": row.p95_response_ms,
+                    "p99": row.p99_response_ms,
+                    "max": row.max_response_ms
+                }
+            }
+            for row in rows
+        ]
+    }
+
+
 # ===== API KEY MANAGEMENT =====
 
 @router.get("/keys", response_model=List[APIKeyResponse])
-def list_api_keys(api_key: str = Depends(), db: Session = Depends(get_db)):
+def list_api_keys(api_key: str = Depends(api_key_header), db: Session = Depends(get_db)):
     """
     List all API keys for the current user
     Requires: X-API-Key header
@@ -207,7 +250,7 @@ def list_api_keys(api_key: str = Depends(), db: Session = Depends(get_db)):
 @router.post("/keys", response_model=dict)
 def create_api_key(
     key_data: APIKeyCreate,
-    api_key: str = Depends(),
+    api_key: str = Depends(api_key_header),
     db: Session = Depends(get_db)
 ):
     """
@@ -260,7 +303,7 @@ def create_api_key(
 @router.delete("/keys/{key_id}")
 def revoke_api_key(
     key_id: int,
-    api_key: str = Depends(),
+    api_key: str = Depends(api_key_header),
     db: Session = Depends(get_db)
 ):
     """
@@ -1,13 +1,24 @@
 """
 Database models and schema for ShapeX
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import bindparam, event, func, inspect, select, text, Column, Integer, String, Float, Date, DateTime, Text, Boolean, JSON, LargeBinary, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from datetime import datetime
+from typing import List, Tuple
+import argparse
+import json
 import os
 from pathlib import Path
 
+from app.models.engine import build_engine, build_async_engine
+from app.models.types import CompressedText, CompressedJSON, PackedInts
+from app.models.series import decode_series, encode_series
+from app.models.routing import RoutingSession
+from app.models.search import create_idea_search, drop_idea_search, ensure_idea_search
+
 # Create data directory if it doesn't exist
 # Use absolute path to avoid path resolution issues
 data_dir = Path(__file__).resolve().parent.parent.parent.parent / "data"
@@ -17,14 +28,41 @@ data_dir.mkdir(exist_ok=True)
 db_path = str(data_dir / "shapex.db").replace("\\", "/")
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{db_path}")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Optional read replica for read-only endpoints (falls back to the primary)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL") or None
+
+engine = build_engine(DATABASE_URL)
+replica_engine = build_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    primary=engine,
+    replica=replica_engine
+)
+
+# Async engines for async route handlers, created on first use so sync-only
+# processes (scheduler, scripts) never load the async driver
+_async_engine = None
+_async_session_factory = None
+_async_replica_engine = None
+_async_read_session_factory = None
 Base = declarative_base()
 
 
 class Idea(Base):
     """Generated startup ideas"""
     __tablename__ = "ideas"
+    __table_args__ = (
+        # /ideas filters (channel | category | none) ordered by score, newest first;
+        # id ends the keyset so cursors seek within the index
+        Index("ix_ideas_channel_score_created_id", "channel", "overall_score", "created_at", "id"),
+        Index("ix_ideas_category_score_created_id", "category", "overall_score", "created_at", "id"),
+        Index("ix_ideas_score_created_id", "overall_score", "created_at", "id"),
+        # /opportunities/quick-wins ordering
+        Index("ix_ideas_channel_monetization_feasibility", "channel", "monetization_score", "feasibility_score"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -54,7 +92,6 @@ class Idea(Base):
     demand_indicators = Column(JSON)  # Search volume, social mentions, etc.
 
     # AI Analysis
-    ai_reasoning = Column(Text)  # Claude's reasoning
     source_inspiration = Column(String(255))  # YC RFS, A16Z post, Product Hunt product, etc.
     source_url = Column(String(500))
 
@@ -67,14 +104,50 @@ class Idea(Base):
     favorite = Column(Boolean, default=False)
     notes = Column(Text)
 
+    # Heavy payloads live in idea_payloads, loaded only when accessed
+    payload = relationship("IdeaPayload", uselist=False, cascade="all, delete-orphan")
+    ai_reasoning = association_proxy("payload", "ai_reasoning", creator=lambda value: IdeaPayload(ai_reasoning=value))
+
+    # Near-duplicate signature, written with the idea (see app.analyzers.similarity)
+    signature = relationship("IdeaSignature", uselist=False, cascade="all, delete-orphan")
+
+
+# Full-text index over ideas, created and dropped with the table
+event.listen(Idea.__table__, "after_create", lambda target, connection, **kw: create_idea_search(connection))
+event.listen(Idea.__table__, "before_drop", lambda target, connection, **kw: drop_idea_search(connection))
+
+
+class IdeaPayload(Base):
+    """Cold columns of an idea (full Claude response)"""
+    __tablename__ = "idea_payloads"
+
+    idea_id = Column(Integer, ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True)
+    ai_reasoning = Column(CompressedText)  # Claude's reasoning
+
+
+class IdeaSignature(Base):
+    """MinHash signature of an idea's title and description, so scans don't rehash stored ideas"""
+    __tablename__ = "idea_signatures"
+
+    idea_id = Column(Integer, ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True)
+    minhash = Column(LargeBinary, nullable=False)  # Packed 32-bit values, see pack_signature()
+
 
 class Trend(Base):
     """Market trends and signals"""
     __tablename__ = "trends"
+    __table_args__ = (
+        # /trends: active trends by momentum
+        Index("ix_trends_active_momentum", "is_active", "momentum_score"),
+        # Canonical row lookups (one active row per keyword, source and geo)
+        Index("ix_trends_keyword_source_geo", "keyword", "source", "geo", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     keyword = Column(String(255), nullable=False)
     source = Column(String(100))  # "google_trends", "product_hunt", "reddit", etc.
+    timeframe = Column(String(50))  # Timeframe of the latest analysis, e.g. "today 3-m"
+    geo = Column(String(10))  # Query region, e.g. "US"
 
     # Metrics
     search_volume = Column(Integer)
@@ -86,8 +159,9 @@ class Trend(Base):
     related_keywords = Column(JSON)
     context = Column(Text)  # Brief description of the trend
 
-    # Data
-    time_series_data = Column(JSON)  # Historical data points
+    # Data (historical data points live in trend_series)
+    series = relationship("TrendSeries", uselist=False, cascade="all, delete-orphan")
+    time_series_data = association_proxy("series", "time_series_data", creator=lambda value: TrendSeries(time_series_data=value))
 
     # Metadata
     detected_at = Column(DateTime, default=datetime.utcnow)
@@ -95,6 +169,30 @@ class Trend(Base):
     is_active = Column(Boolean, default=True)
 
 
+class TrendSeries(Base):
+    """Cold columns of a trend (interest-over-time points, see app.models.series)"""
+    __tablename__ = "trend_series"
+
+    trend_id = Column(Integer, ForeignKey("trends.id", ondelete="CASCADE"), primary_key=True)
+    start_date = Column(DateTime)  # Date of the first point
+    step_seconds = Column(Integer)  # Spacing of the points
+    points = Column(PackedInts)  # Interest values
+
+    def columns(self) -> dict:
+        """Stored series columns, in the form encode_series() returns"""
+        return {"start_date": self.start_date, "step_seconds": self.step_seconds, "points": self.points}
+
+    @property
+    def time_series_data(self):
+        """Historical data points as [{"date", "value"}, ...]"""
+        return decode_series(self.start_date, self.step_seconds, self.points)
+
+    @time_series_data.setter
+    def time_series_data(self, value):
+        for column, column_value in encode_series(value).items():
+            setattr(self, column, column_value)
+
+
 class Source(Base):
     """Data sources (YC RFS, A16Z posts, etc.)"""
     __tablename__ = "sources"
@@ -102,8 +200,9 @@ class Source(Base):
     id = Column(Integer, primary_key=True, index=True)
     source_type = Column(String(100))  # "yc_rfs", "a16z_blog", "product_hunt", etc.
     title = Column(String(500))
-    url = Column(String(500), unique=True)
+    url = Column(String(500), unique=True)  # Normalized URL (+ #title-slug for multi-item pages)
     content = Column(Text)
+    content_hash = Column(String(64))  # sha256 of title + content, changes flag re-processing
     summary = Column(Text)  # AI-generated summary
 
     # Analysis
@@ -120,16 +219,21 @@ class Source(Base):
 class ScanJob(Base):
     """Tracking for scan jobs"""
     __tablename__ = "scan_jobs"
+    __table_args__ = (
+        Index("ix_scan_jobs_started_at", "started_at"),
+        Index("ix_scan_jobs_status_completed", "status", "completed_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_type = Column(String(50))  # "daily", "weekly", "manual"
-    status = Column(String(50))  # "running", "completed", "failed"
+    status = Column(String(50))  # "queued", "running", "completed", "failed"
 
     # Results
     ideas_generated = Column(Integer, default=0)
     sources_scraped = Column(Integer, default=0)
     trends_analyzed = Column(Integer, default=0)
     error_message = Column(Text)
+    channel_metrics = Column(JSON)  # Per-channel latency, tokens and cost of idea generation
 
     # Metadata
     started_at = Column(DateTime, default=datetime.utcnow)
@@ -137,6 +241,20 @@ class ScanJob(Base):
     duration_seconds = Column(Float)
 
 
+class ScanCheckpoint(Base):
+    """Persisted output of a completed scan stage, used to resume failed scans"""
+    __tablename__ = "scan_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("job_id", "stage", name="uq_scan_checkpoints_job_stage"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey('scan_jobs.id'), nullable=False, index=True)
+    stage = Column(String(50), nullable=False)  # "collect", "generate:strategic", "generate:quick-win", "save"
+    output = Column(JSON)  # Stage result, enough to skip the stage on resume
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class User(Base):
     """User accounts for API access"""
     __tablename__ = "users"
@@ -203,6 +321,10 @@ class Subscription(Base):
 class APIUsage(Base):
     """Track API usage for analytics and rate limiting"""
     __tablename__ = "api_usage"
+    __table_args__ = (
+        # Monthly rate-limit counts per user
+        Index("ix_api_usage_user_timestamp", "user_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False, index=True)
@@ -218,12 +340,393 @@ class APIUsage(Base):
     response_time_ms = Column(Integer)
 
 
+class APIUsageDaily(Base):
+    """Daily API usage per user, key and endpoint, rolled up from api_usage"""
+    __tablename__ = "api_usage_daily"
+    __table_args__ = (
+        UniqueConstraint("day", "user_id", "api_key_id", "endpoint", "method", name="uq_api_usage_daily_group"),
+        # Monthly rate-limit sums and usage reports per user
+        Index("ix_api_usage_daily_user_day", "user_id", "day"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    api_key_id = Column(Integer, nullable=False)
+    endpoint = Column(String(255))
+    method = Column(String(10))
+
+    # Counts
+    request_count = Column(Integer, default=0)
+    error_count = Column(Integer, default=0)  # status_code >= 400
+
+    # Latency (milliseconds)
+    avg_response_ms = Column(Float)
+    p50_response_ms = Column(Integer)
+    p95_response_ms = Column(Integer)
+    p99_response_ms = Column(Integer)
+    max_response_ms = Column(Integer)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RollupWatermark(Base):
+    """Highest raw row id folded into a rollup"""
+    __tablename__ = "rollup_watermarks"
+
+    name = Column(String(50), primary_key=True)  # e.g. "api_usage_daily"
+    last_id = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class IdeaStats(Base):
+    """Idea counts and score sums per channel and category, kept in step with ideas"""
+    __tablename__ = "idea_stats"
+    __table_args__ = (
+        UniqueConstraint("channel", "category", name="uq_idea_stats_group"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel = Column(String(50), nullable=False, default="")  # "" for ideas without one
+    category = Column(String(100), nullable=False, default="")
+
+    idea_count = Column(Integer, default=0)
+    favorite_count = Column(Integer, default=0)
+
+    # Score sums (averages are sum / idea_count)
+    overall_score_sum = Column(Float, default=0.0)
+    feasibility_score_sum = Column(Float, default=0.0)
+    monetization_score_sum = Column(Float, default=0.0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class CacheGeneration(Base):
+    """Response cache generation counter, shared by API workers"""
+    __tablename__ = "cache_generations"
+
+    name = Column(String(50), primary_key=True)  # e.g. "ideas"
+    generation = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 def init_db():
     """Initialize database and create tables"""
     Base.metadata.create_all(bind=engine)
+    migrate_db()
     print("Database initialized successfully")
 
 
+def migrate_db(bind=None):
+    """
+    Bring existing databases up to the current schema.
+    create_all() skips tables that already exist, so columns added to a
+    model later are added here (additive, nullable changes only).
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                column_type = column.type.compile(dialect=bind.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                print(f"Added column {table.name}.{column.name}")
+
+    migrate_payloads(bind)
+    migrate_trend_series(bind)
+    consolidate_trends(bind)
+    ensure_indexes(bind)
+    ensure_idea_search(bind)
+    refresh_idea_stats(bind)
+
+
+def refresh_idea_stats(bind=None, force: bool = False) -> bool:
+    """
+    Build the idea_stats summary if it is missing or outdated (writers keep
+    it in step after that). force=True rebuilds it anyway, correcting drift
+    from writes that bypassed record_idea_changes().
+    Returns:
+        Whether the summary was rebuilt
+    """
+    # Imported here: app.services modules import this one
+    from app.services.idea_stats import idea_stats_outdated, rebuild_idea_stats
+
+    bind = bind or engine
+    inspector = inspect(bind)
+    if not all(inspector.has_table(name) for name in ("ideas", "idea_stats", "rollup_watermarks")):
+        return False
+    db = sessionmaker(bind=bind)()
+    try:
+        if not force and not idea_stats_outdated(db):
+            return False
+        rebuild_idea_stats(db)
+        return True
+    finally:
+        db.close()
+
+
+# Large payload columns moved out of hot tables:
+# (table, side table, side table key, columns)
+PAYLOAD_SPLITS = [
+    ("ideas", "idea_payloads", "idea_id", ("ai_reasoning",)),
+    ("trends", "trend_series", "trend_id", ("time_series_data",)),
+    ("agent_executions", "agent_execution_outputs", "execution_id", ("raw_output", "structured_output")),
+]
+
+
+# Side tables that store a payload in another form than the legacy column
+PAYLOAD_ENCODERS = {
+    "trend_series": lambda payload: {
+        "trend_id": payload["trend_id"], **encode_series(payload["time_series_data"])
+    },
+}
+
+
+def migrate_payloads(bind=None, chunk_size: int = 500):
+    """
+    Copy payload columns of existing databases into their side tables.
+    The legacy columns are left in place; drop them once with
+    drop_legacy_columns() after checking the copy.
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+
+    for table_name, side_name, key, columns in PAYLOAD_SPLITS:
+        side = Base.metadata.tables.get(side_name)
+        if side is None or not inspector.has_table(table_name) or not inspector.has_table(side_name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        legacy = [column for column in columns if column in existing]
+        if not legacy:
+            continue
+
+        moved = 0
+        with bind.begin() as conn:
+            rows = conn.execute(text(
+                f"SELECT id, {', '.join(legacy)} FROM {table_name} "
+                f"WHERE {_unmoved_payload_filter(side_name, key, legacy)}"
+            )).mappings()
+
+            batch = []
+            for row in rows:
+                payload = {key: row["id"]}
+                for column in legacy:
+                    value = row[column]
+                    # JSON columns come back as text from SQLite
+                    json_column = column not in side.c or isinstance(side.c[column].type, CompressedJSON)
+                    if json_column and isinstance(value, str):
+                        value = json.loads(value)
+                    payload[column] = value
+                batch.append(PAYLOAD_ENCODERS.get(side_name, dict)(payload))
+
+                if len(batch) >= chunk_size:
+                    conn.execute(side.insert(), batch)
+                    moved += len(batch)
+                    batch = []
+
+            if batch:
+                conn.execute(side.insert(), batch)
+                moved += len(batch)
+
+        if moved:
+            print(f"Moved {moved} {table_name} payloads to {side_name}")
+
+
+def _unmoved_payload_filter(side_name: str, key: str, legacy: List[str]) -> str:
+    """SQL condition for rows with a legacy payload but no side row"""
+    has_payload = " OR ".join(f"{column} IS NOT NULL" for column in legacy)
+    return f"({has_payload}) AND id NOT IN (SELECT {key} FROM {side_name})"
+
+
+# ALTER TABLE ... DROP COLUMN needs SQLite 3.35
+MIN_SQLITE_DROP_COLUMN = (3, 35, 0)
+
+
+def legacy_columns(bind=None) -> List[Tuple[str, str, int, int]]:
+    """
+    Legacy payload columns still present in the database
+    Returns:
+        [(table, column, rows with a value, rows whose value is migrated), ...]
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    found = []
+
+    with bind.connect() as conn:
+        for table_name, side_name, key, columns in PAYLOAD_SPLITS:
+            if not inspector.has_table(table_name) or not inspector.has_table(side_name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            for column in columns:
+                if column not in existing:
+                    continue
+                with_value = conn.execute(text(f"SELECT count(*) FROM {table_name} WHERE {column} IS NOT NULL")).scalar()
+                unmoved = conn.execute(text(
+                    f"SELECT count(*) FROM {table_name} WHERE {_unmoved_payload_filter(side_name, key, [column])}"
+                )).scalar()
+                found.append((table_name, column, with_value, with_value - unmoved))
+
+        # JSON series converted in place by migrate_trend_series()
+        if inspector.has_table("trend_series") and "time_series_data" in {
+            column["name"] for column in inspector.get_columns("trend_series")
+        }:
+            with_value = conn.execute(text("SELECT count(*) FROM trend_series WHERE time_series_data IS NOT NULL")).scalar()
+            unconverted = conn.execute(text(f"SELECT count(*) FROM trend_series WHERE {UNCONVERTED_SERIES_FILTER}")).scalar()
+            found.append(("trend_series", "time_series_data", with_value, with_value - unconverted))
+
+    return found
+
+
+def drop_legacy_columns(bind=None) -> List[Tuple[str, str]]:
+    """
+    One-shot migration: drop the legacy payload columns migrate_db() copied
+    out of the hot tables. Not run on startup. Refuses to drop anything
+    unless every row with a legacy value has been migrated.
+    Returns:
+        [(table, column), ...] dropped
+    """
+    bind = bind or engine
+    if bind.dialect.name == "sqlite":
+        with bind.connect() as conn:
+            version = conn.execute(text("SELECT sqlite_version()")).scalar()
+        if tuple(int(part) for part in version.split(".")) < MIN_SQLITE_DROP_COLUMN:
+            raise RuntimeError(f"Dropping columns needs SQLite 3.35 or newer (found {version})")
+
+    # Copy anything written to the legacy columns since the last startup
+    migrate_db(bind)
+
+    columns = legacy_columns(bind)
+    unmigrated = [
+        f"{table}.{column} ({migrated} of {with_value} rows migrated)"
+        for table, column, with_value, migrated in columns
+        if migrated != with_value
+    ]
+    if unmigrated:
+        raise RuntimeError(f"Legacy columns not fully migrated, nothing dropped: {', '.join(unmigrated)}")
+
+    with bind.begin() as conn:
+        for table, column, with_value, _ in columns:
+            conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+            print(f"Dropped {table}.{column} ({with_value} rows migrated)")
+
+    return [(table, column) for table, column, _, _ in columns]
+
+
+# JSON trend series not yet converted to the compact columns
+UNCONVERTED_SERIES_FILTER = "time_series_data IS NOT NULL AND points IS NULL"
+
+
+def migrate_trend_series(bind=None, chunk_size: int = 500):
+    """
+    Convert JSON trend series (trend_series.time_series_data) that have no
+    compact columns yet. The JSON column is dropped by drop_legacy_columns().
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    if not inspector.has_table("trend_series"):
+        return
+    if "time_series_data" not in {column["name"] for column in inspector.get_columns("trend_series")}:
+        return
+
+    series = TrendSeries.__table__
+    converted = 0
+    with bind.begin() as conn:
+        rows = conn.execute(text(
+            f"SELECT trend_id, time_series_data FROM trend_series WHERE {UNCONVERTED_SERIES_FILTER}"
+        )).all()
+        batch = []
+        for trend_id, stored in rows:
+            points = CompressedJSON().process_result_value(stored, bind.dialect)
+            batch.append({"b_trend_id": trend_id, **encode_series(points)})
+            if len(batch) >= chunk_size:
+                conn.execute(series.update().where(series.c.trend_id == bindparam("b_trend_id")), batch)
+                converted += len(batch)
+                batch = []
+
+        if batch:
+            conn.execute(series.update().where(series.c.trend_id == bindparam("b_trend_id")), batch)
+            converted += len(batch)
+
+    if converted:
+        print(f"Converted {converted} trend series to compact storage")
+
+
+def consolidate_trends(bind=None):
+    """
+    Keep one active trend row per (keyword, source, geo): the most recently
+    updated. Older duplicates (one row per scan, from before trends were
+    updated in place) are marked inactive.
+    """
+    bind = bind or engine
+    if not inspect(bind).has_table("trends"):
+        return
+
+    trends = Trend.__table__
+    key = (trends.c.keyword, trends.c.source, trends.c.geo)
+    with bind.begin() as conn:
+        duplicated = conn.execute(
+            select(*key).where(trends.c.is_active == True).group_by(*key).having(func.count() > 1)
+        ).all()
+
+        deactivated = 0
+        for keyword, source, geo in duplicated:
+            ids = conn.execute(
+                select(trends.c.id).where(
+                    trends.c.keyword == keyword,
+                    trends.c.source == source if source is not None else trends.c.source.is_(None),
+                    trends.c.geo == geo if geo is not None else trends.c.geo.is_(None),
+                    trends.c.is_active == True
+                ).order_by(trends.c.last_updated.desc(), trends.c.id.desc())
+            ).scalars().all()
+            conn.execute(trends.update().where(trends.c.id.in_(ids[1:])).values(is_active=False))
+            deactivated += len(ids) - 1
+
+    if deactivated:
+        print(f"Deactivated {deactivated} duplicate trend rows")
+
+
+# Indexes replaced by a declared one: (table, index name)
+REPLACED_INDEXES = [
+    ("trends", "ix_trends_keyword_timeframe_geo"),
+    ("ideas", "ix_ideas_channel_score_created"),
+    ("ideas", "ix_ideas_category_score_created"),
+    ("ideas", "ix_ideas_score_created"),
+    ("studio_sessions", "ix_studio_sessions_status_created"),
+    ("studio_sessions", "ix_studio_sessions_created_at"),
+]
+
+
+def ensure_indexes(bind=None):
+    """Create indexes declared on the models that existing tables are missing, drop replaced ones"""
+    bind = bind or engine
+    inspector = inspect(bind)
+
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for table_name, name in REPLACED_INDEXES:
+            if table_name == table.name and name in existing:
+                with bind.begin() as conn:
+                    conn.execute(text(f"DROP INDEX {name}"))
+                print(f"Dropped index {name}")
+
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind, checkfirst=True)
+                print(f"Created index {index.name}")
+
+
 def get_db():
     """Get database session"""
     db = SessionLocal()
@@ -233,5 +736,83 @@ def get_db():
         db.close()
 
 
+def get_async_engine():
+    """Get the async engine (created on first call)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = build_async_engine(DATABASE_URL)
+    return _async_engine
+
+
+def get_async_sessionmaker():
+    """Get the AsyncSession factory bound to the async engine"""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db():
+    """Get async database session (for async def route handlers)"""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def get_read_db():
+    """Get database session for read-only endpoints (replica when configured)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_async_read_sessionmaker():
+    """Get the AsyncSession factory that routes reads to the replica"""
+    global _async_replica_engine, _async_read_session_factory
+    if _async_read_session_factory is None:
+        if DATABASE_REPLICA_URL:
+            _async_replica_engine = build_async_engine(DATABASE_REPLICA_URL)
+        primary = get_async_engine()
+        _async_read_session_factory = async_sessionmaker(
+            primary,
+            sync_session_class=RoutingSession,
+            autoflush=False,
+            expire_on_commit=False,
+            # Routing picks between the sync engines the async engines wrap
+            primary=primary.sync_engine,
+            replica=_async_replica_engine.sync_engine if _async_replica_engine else None
+        )
+    return _async_read_session_factory
+
+
+async def get_async_read_db():
+    """Get async database session for read-only endpoints (replica when configured)"""
+    async with get_async_read_sessionmaker()() as db:
+        yield db
+
+
 if __name__ == "__main__":
-    init_db()
+    parser = argparse.ArgumentParser(description="Initialize or migrate the ShapeX database")
+    parser.add_argument(
+        "--drop-legacy-columns",
+        action="store_true",
+        help="Drop payload columns already migrated to side tables (one-shot, needs SQLite 3.35+)"
+    )
+    parser.add_argument(
+        "--rebuild-idea-stats",
+        action="store_true",
+        help="Recompute the /stats summary from the ideas table"
+    )
+    args = parser.parse_args()
+
+    if args.drop_legacy_columns:
+        drop_legacy_columns()
+    elif args.rebuild_idea_stats:
+        refresh_idea_stats(force=True)
+    else:
+        init_db()
@@ -0,0 +1,141 @@
+"""
+Database engine profiles
+
+SQLite files run in WAL mode with tuned pragmas applied on every new
+connection, so readers never wait on the scan writer and writers wait
+(busy_timeout) instead of failing with "database is locked".
+Postgres gets a pre-pinged, recycled connection pool.
+Async engines (aiosqlite / asyncpg) share the same profiles.
+"""
+import logging
+import os
+from typing import Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+def sqlite_pragmas() -> Dict[str, str]:
+    """PRAGMAs applied to each new SQLite file connection (env configurable)"""
+    pragmas = {
+        "journal_mode": "WAL" if os.getenv("SQLITE_WAL", "true").lower() == "true" else "DELETE",
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": str(_env_int("DB_BUSY_TIMEOUT_MS", 5000)),
+        "cache_size": str(-_env_int("SQLITE_CACHE_SIZE_KB", 65536)),  # Negative = KiB
+        "mmap_size": str(_env_int("SQLITE_MMAP_SIZE", 268435456)),
+        "temp_store": "MEMORY",
+    }
+    return pragmas
+
+
+def engine_options(url: str) -> Dict:
+    """create_engine() keyword arguments for a database URL"""
+    backend = make_url(url).get_backend_name()
+
+    if backend == "sqlite":
+        database = make_url(url).database
+        if not database or database == ":memory:":
+            # One shared connection, or every thread would see its own empty database
+            return {
+                "connect_args": {"check_same_thread": False},
+                "poolclass": StaticPool,
+            }
+
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                # Seconds the driver waits on a locked database
+                "timeout": _env_int("DB_BUSY_TIMEOUT_MS", 5000) / 1000,
+            },
+            "poolclass": QueuePool,
+            # WAL allows many readers next to the single writer
+            "pool_size": _env_int("DB_POOL_SIZE", 10),
+            "max_overflow": _env_int("DB_MAX_OVERFLOW", 20),
+            "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        }
+
+    return {
+        "pool_size": _env_int("DB_POOL_SIZE", 10),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 20),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": True,
+    }
+
+
+# Async drivers for each sync database backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_url(url: str) -> str:
+    """Database URL rewritten to the backend's async driver"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    if parsed.get_driver_name() == driver:
+        return url
+
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+def _apply_sqlite_pragmas(engine: Engine):
+    """Run the SQLite pragmas on every new connection of a file database"""
+    if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return
+
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    logger.info(f"SQLite engine profile: {pragmas}")
+
+
+def build_engine(url: str) -> Engine:
+    """
+    Create an engine with the profile for its backend
+    Args:
+        url: Database URL
+    Returns:
+        Configured engine
+    """
+    engine = create_engine(url, **engine_options(url))
+    _apply_sqlite_pragmas(engine)
+    return engine
+
+
+def build_async_engine(url: str) -> AsyncEngine:
+    """
+    Create an async engine with the profile for its backend
+    Args:
+        url: Database URL (sync or async driver)
+    Returns:
+        Configured async engine
+    """
+    options = engine_options(url)
+    if options.get("poolclass") is QueuePool:
+        options["poolclass"] = AsyncAdaptedQueuePool
+
+    engine = create_async_engine(async_url(url), **options)
+    # Pool events are registered on the sync engine the async engine wraps
+    _apply_sqlite_pragmas(engine.sync_engine)
+    return engine
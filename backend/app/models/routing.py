@@ -0,0 +1,136 @@
+"""
+Read-replica routing
+
+RoutingSession sends writes (flushes and DML) to the primary and plain
+reads to a replica when one is configured. Reads stay on the primary when
+they touch a table that:
+  - this session has written (read-your-writes within a request), or
+  - any session in this process wrote within the replica lag window
+    (read-your-writes across requests, e.g. PATCH then GET).
+Reads of unrelated tables still go to the replica, so usage tracking
+writes don't pin idea listings to the primary.
+"""
+import logging
+import os
+import threading
+import time
+from itertools import chain
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPLICA_LAG_SECONDS = 5.0
+
+
+def replica_lag_seconds() -> float:
+    """How long after a write its tables are read from the primary"""
+    return float(os.getenv("DB_REPLICA_LAG_SECONDS", DEFAULT_REPLICA_LAG_SECONDS))
+
+
+class WriteTracker:
+    """Last commit time of each table written in this process"""
+
+    def __init__(self):
+        self._written_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tables: Iterable[str]):
+        now = time.monotonic()
+        with self._lock:
+            for table in tables:
+                self._written_at[table] = now
+
+    def written_within(self, tables: Iterable[str], seconds: float) -> bool:
+        """Whether any of the tables was written in the last `seconds`"""
+        cutoff = time.monotonic() - seconds
+        with self._lock:
+            return any(self._written_at.get(table, float("-inf")) > cutoff for table in tables)
+
+    def clear(self):
+        with self._lock:
+            self._written_at.clear()
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica unless that could miss recent writes"""
+
+    def __init__(
+        self,
+        primary: Optional[Engine] = None,
+        replica: Optional[Engine] = None,
+        lag_seconds: Optional[float] = None,
+        **kw
+    ):
+        kw.setdefault("bind", primary)
+        super().__init__(**kw)
+        self.primary = primary
+        self.replica = replica
+        self.lag_seconds = replica_lag_seconds() if lag_seconds is None else lag_seconds
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.primary is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        if self.replica is None or self._flushing or (clause is not None and clause.is_dml):
+            return self.primary
+
+        tables = self._tables(mapper, clause)
+        if not tables:
+            return self.primary  # text() and other untracked statements
+
+        if tables & self.info.get("written_tables", set()):
+            return self.primary
+        if write_tracker.written_within(tables, self.lag_seconds):
+            return self.primary
+
+        return self.replica
+
+    @staticmethod
+    def _tables(mapper, clause) -> Set[str]:
+        tables = set()
+        if mapper is not None:
+            tables.update(table.name for table in mapper.tables)
+        if clause is not None:
+            tables.update(table.name for table in find_tables(clause, include_joins=True, include_crud=True))
+        return tables
+
+
+def _mark_written(session: Session, tables: Iterable[str]):
+    tables = set(tables)
+    session.info.setdefault("written_tables", set()).update(tables)
+    session.info.setdefault("uncommitted_tables", set()).update(tables)
+
+
+# Registered on Session itself so scanner and request sessions are all tracked
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    objects = chain(session.new, session.dirty, session.deleted)
+    _mark_written(session, (table.name for obj in objects for table in inspect(obj).mapper.tables))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_written(orm_execute_state.session, [orm_execute_state.statement.table.name])
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_writes(session):
+    tables = session.info.pop("uncommitted_tables", None)
+    if tables:
+        write_tracker.record(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_writes(session):
+    session.info.pop("uncommitted_tables", None)
+
+
+# Global tracker instance
+write_tracker = WriteTracker()
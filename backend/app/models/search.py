@@ -0,0 +1,151 @@
+"""
+Full-text search index over ideas
+
+SQLite: an external-content FTS5 table (ideas_fts) kept in sync by
+triggers on ideas, so inserts, updates and deletes (ORM, bulk or raw SQL)
+reindex only the rows they touch.
+Postgres: a generated tsvector column (ideas.search_vector) with a GIN
+index, recomputed by the database whenever a row changes.
+
+The index is created with the ideas table (create_all) and added to
+existing databases by ensure_idea_search() from migrate_db().
+"""
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, func, inspect, literal_column, table, text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+IDEA_SEARCH_COLUMNS = ("title", "description", "target_market", "differentiation", "key_features")
+
+# bm25 weight per column (same order), so title matches rank first
+IDEA_SEARCH_WEIGHTS = (10.0, 1.0, 4.0, 2.0, 2.0)
+
+IDEA_FTS_TABLE = "ideas_fts"
+
+# FTS5 table as a lightweight construct for joins (rowid = ideas.id)
+ideas_fts = table(IDEA_FTS_TABLE, column("rowid"), column(IDEA_FTS_TABLE))
+
+# Postgres text search configuration
+TS_CONFIG = "english"
+
+
+def _sqlite_ddl() -> List[str]:
+    columns = ", ".join(IDEA_SEARCH_COLUMNS)
+    new = ", ".join(f"new.{name}" for name in IDEA_SEARCH_COLUMNS)
+    old = ", ".join(f"old.{name}" for name in IDEA_SEARCH_COLUMNS)
+    delete_old = f"INSERT INTO {IDEA_FTS_TABLE}({IDEA_FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old});"
+    insert_new = f"INSERT INTO {IDEA_FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {IDEA_FTS_TABLE} USING fts5("
+        f"{columns}, content='ideas', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS ideas_fts_insert AFTER INSERT ON ideas BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS ideas_fts_delete AFTER DELETE ON ideas BEGIN {delete_old} END",
+        # Only changes to indexed columns reindex the row
+        f"CREATE TRIGGER IF NOT EXISTS ideas_fts_update AFTER UPDATE OF {columns} ON ideas "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def _postgres_ddl() -> List[str]:
+    weighted = " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({expression}, '')), '{weight}')"
+        for expression, weight in [
+            ("title", "A"),
+            ("target_market", "B"),
+            ("differentiation", "C"),
+            ("key_features::text", "C"),
+            ("description", "D"),
+        ]
+    )
+    return [
+        f"ALTER TABLE ideas ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({weighted}) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_ideas_search_vector ON ideas USING GIN (search_vector)",
+    ]
+
+
+def has_idea_search(bind) -> bool:
+    """Whether the full-text index exists"""
+    inspector = inspect(bind)
+    if bind.dialect.name == "sqlite":
+        return inspector.has_table(IDEA_FTS_TABLE)
+    if bind.dialect.name == "postgresql":
+        return "search_vector" in {column["name"] for column in inspector.get_columns("ideas")}
+    return False
+
+
+def create_idea_search(connection: Connection):
+    """Create the full-text index (no-op for databases without one)"""
+    if connection.dialect.name == "sqlite":
+        statements = _sqlite_ddl()
+    elif connection.dialect.name == "postgresql":
+        statements = _postgres_ddl()
+    else:
+        return
+
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def drop_idea_search(connection: Connection):
+    """Drop the SQLite FTS table (triggers go with the ideas table)"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {IDEA_FTS_TABLE}"))
+
+
+def ensure_idea_search(bind):
+    """Add the full-text index to an existing database and index its ideas"""
+    if not inspect(bind).has_table("ideas") or has_idea_search(bind):
+        return
+
+    with bind.begin() as conn:
+        create_idea_search(conn)
+        if conn.dialect.name == "sqlite":
+            conn.execute(text(f"INSERT INTO {IDEA_FTS_TABLE}({IDEA_FTS_TABLE}) VALUES ('rebuild')"))
+
+    if has_idea_search(bind):
+        logger.info("✓ Created full-text index over ideas")
+
+
+def fts5_query(search: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression for free text: every word must match, the last
+    one as a prefix. Words are quoted so operators and punctuation in user
+    input can't cause syntax errors. None if there is nothing to search.
+    """
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def apply_idea_search(query, dialect: str, search: str):
+    """
+    Restrict an ideas Query/Select to full-text matches, best match first.
+    Returns None when the search has no words to match.
+    """
+    if dialect == "sqlite":
+        expression = fts5_query(search)
+        if expression is None:
+            return None
+        # bm25() is lower for better matches
+        rank = func.bm25(literal_column(IDEA_FTS_TABLE), *IDEA_SEARCH_WEIGHTS)
+        return query.join(ideas_fts, ideas_fts.c.rowid == literal_column("ideas.id")).filter(
+            ideas_fts.c[IDEA_FTS_TABLE].match(expression)
+        ).order_by(rank, literal_column("ideas.id"))
+
+    if dialect == "postgresql":
+        if not re.search(r"\w", search):
+            return None
+        vector = literal_column("ideas.search_vector")
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, search)
+        return query.filter(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank_cd(vector, tsquery).desc(), literal_column("ideas.id")
+        )
+
+    raise ValueError(f"No full-text search for {dialect} databases")
@@ -0,0 +1,194 @@
+"""
+Compact trend time series
+
+Google Trends returns evenly spaced points, so a series is stored as its
+first date, the step between points and the packed values rather than a
+JSON list of {"date", "value"} dicts:
+    start_date    2026-07-01 00:00:00
+    step_seconds  86400 (or STEP_MONTH for the monthly "all" timeframe)
+    points        [40, 42, 39, ...]
+
+Series that are not evenly spaced (or have no dates) keep their values
+only, with start_date and step_seconds left empty.
+"""
+import calendar
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# step_seconds for series with one point per calendar month
+STEP_MONTH = -1
+
+DEFAULT_MAX_SERIES_POINTS = 1000
+
+
+def max_series_points() -> int:
+    """Points kept per trend when merged series grow (newest kept)"""
+    return int(os.getenv("TREND_SERIES_MAX_POINTS", DEFAULT_MAX_SERIES_POINTS))
+
+
+def parse_date(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def format_date(value: datetime) -> str:
+    """Same format as str(pandas.Timestamp), which TrendsAnalyzer emits"""
+    return str(value)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month = value.month - 1 + months
+    return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+
+
+def step_date(start: datetime, step_seconds: int, index: int) -> datetime:
+    """Date of the index-th point of a series"""
+    if step_seconds == STEP_MONTH:
+        return _add_months(start, index)
+    return start + timedelta(seconds=step_seconds * index)
+
+
+def _months_before(value: datetime, months: int) -> datetime:
+    """Same day months earlier, clamped to the end of shorter months"""
+    first = _add_months(value.replace(day=1), -months)
+    return first.replace(day=min(value.day, calendar.monthrange(first.year, first.month)[1]))
+
+
+def timeframe_window(timeframe: str, now: datetime) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    (start, end) of a Google Trends timeframe as of now, None for an open end.
+    Handles "today 3-m", "today 5-y", "now 7-d", "now 4-H", "all" and
+    "YYYY-MM-DD YYYY-MM-DD"; other values leave both ends open.
+    """
+    parts = (timeframe or "").split()
+    if len(parts) != 2:
+        return None, None
+
+    anchor, span = parts
+    try:
+        if anchor in ("today", "now"):
+            count, unit = span.split("-")
+            count = int(count)
+            if unit == "m":
+                return _months_before(now, count), None
+            if unit == "y":
+                return _months_before(now, 12 * count), None
+            if unit == "d":
+                return now - timedelta(days=count), None
+            if unit == "H":
+                return now - timedelta(hours=count), None
+            return None, None
+        return parse_date(anchor), parse_date(span) + timedelta(days=1)
+    except ValueError:
+        return None, None
+
+
+def trim_series(time_series: Optional[List], timeframe: str, now: datetime) -> Optional[List]:
+    """
+    Points of a decoded series that fall in a timeframe (see timeframe_window).
+    The point whose period contains the window start is kept; undated
+    series are returned as they are.
+    """
+    if not time_series or not all(isinstance(point, dict) for point in time_series):
+        return time_series
+
+    start, end = timeframe_window(timeframe, now)
+    dates = [parse_date(point["date"]) for point in time_series]
+    first = 0
+    if start is not None:
+        for index, date in enumerate(dates):
+            if date > start:
+                break
+            first = index
+    return [
+        point for point, date in zip(time_series[first:], dates[first:])
+        if end is None or date < end
+    ]
+
+
+def _regular_step(dates: List[datetime]) -> Optional[int]:
+    """step_seconds if the dates are evenly spaced, else None"""
+    if len(dates) < 2:
+        return 0
+
+    step = (dates[1] - dates[0]).total_seconds()
+    if step > 0 and step.is_integer() and all(
+        (later - earlier).total_seconds() == step for earlier, later in zip(dates, dates[1:])
+    ):
+        return int(step)
+
+    if dates[0].day == 1 and all(dates[i] == _add_months(dates[0], i) for i in range(len(dates))):
+        return STEP_MONTH
+    return None
+
+
+def encode_series(time_series: Optional[List]) -> Dict:
+    """
+    TrendSeries column values for a list of {"date", "value"} points.
+    Lists of bare numbers are stored as values only.
+    """
+    if not time_series:
+        return {"start_date": None, "step_seconds": None, "points": [] if time_series is not None else None}
+
+    if not all(isinstance(point, dict) for point in time_series):
+        return {"start_date": None, "step_seconds": None, "points": [int(value) for value in time_series]}
+
+    dates = [parse_date(point["date"]) for point in time_series]
+    values = [int(point["value"]) for point in time_series]
+    step = _regular_step(dates)
+    if step is None:
+        return {"start_date": None, "step_seconds": None, "points": values}
+    return {"start_date": dates[0], "step_seconds": step, "points": values}
+
+
+def decode_series(start_date: Optional[datetime], step_seconds: Optional[int], points: Optional[List[int]]) -> Optional[List]:
+    """The {"date", "value"} points of stored columns (bare values when undated)"""
+    if points is None:
+        return None
+    if start_date is None or step_seconds is None:
+        return list(points)
+    return [
+        {"date": format_date(step_date(start_date, step_seconds, index)), "value": value}
+        for index, value in enumerate(points)
+    ]
+
+
+def _dated(series: Dict) -> Optional[Dict[datetime, int]]:
+    if not series or series.get("points") is None or series.get("start_date") is None or series.get("step_seconds") is None:
+        return None
+    start, step = series["start_date"], series["step_seconds"]
+    return {step_date(start, step, index): value for index, value in enumerate(series["points"])}
+
+
+def merge_series(stored: Optional[Dict], new: Dict, max_points: int = None) -> Dict:
+    """
+    Merge a newly fetched series into the stored one.
+
+    New points replace stored points on the same dates. Google Trends scales
+    each fetch to its own window, so the stored points that are kept are
+    rescaled by the ratio of the two series where they overlap. Without a
+    (non-zero) overlap there is no common scale, and when the merged points
+    aren't evenly spaced (different steps, a gap, undated values) there is
+    no common grid; either way the new series replaces the stored one.
+    """
+    max_points = max_points or max_series_points()
+    old_points, new_points = _dated(stored), _dated(new)
+    if old_points is None or new_points is None or not new_points:
+        return new
+
+    overlap = [date for date in new_points if date in old_points]
+    old_total = sum(old_points[date] for date in overlap)
+    if not old_total:
+        return new
+    ratio = sum(new_points[date] for date in overlap) / old_total
+
+    merged = {date: int(round(value * ratio)) for date, value in old_points.items()}
+    merged.update(new_points)
+    dates = sorted(merged)[-max_points:]
+
+    step = _regular_step(dates)
+    if step is None:
+        return new
+    return {"start_date": dates[0], "step_seconds": step, "points": [merged[date] for date in dates]}
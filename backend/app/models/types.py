@@ -0,0 +1,100 @@
+"""
+Column types for large payloads
+
+Payloads are stored as bytes with a one-byte marker so compression can be
+switched on or off without rewriting existing rows:
+    b"z" + zlib(data)  compressed
+    b"r" + data        stored as-is (small values, or compression disabled)
+"""
+import json
+import os
+import sys
+import zlib
+from array import array
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+COMPRESSED = b"z"
+RAW = b"r"
+
+
+def compression_enabled() -> bool:
+    return os.getenv("BLOB_COMPRESSION", "true").lower() == "true"
+
+
+def compression_min_bytes() -> int:
+    """Values smaller than this are not worth compressing"""
+    return int(os.getenv("BLOB_COMPRESSION_MIN_BYTES", 512))
+
+
+def pack(data: bytes) -> bytes:
+    """Marker-prefixed, compressed when enabled and large enough"""
+    if compression_enabled() and len(data) >= compression_min_bytes():
+        return COMPRESSED + zlib.compress(data, 6)
+    return RAW + data
+
+
+def unpack(stored: bytes) -> bytes:
+    """Original bytes of a packed value"""
+    marker, body = stored[:1], stored[1:]
+    if marker == COMPRESSED:
+        return zlib.decompress(body)
+    return body
+
+
+class CompressedText(TypeDecorator):
+    """Text stored as (optionally) zlib-compressed bytes"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return pack(value.encode("utf-8"))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return unpack(bytes(value)).decode("utf-8")
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as (optionally) zlib-compressed bytes"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return pack(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return json.loads(unpack(bytes(value)))
+
+
+class PackedInts(TypeDecorator):
+    """List of ints stored as little-endian int32 bytes, packed like the rest"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        values = array("i", value)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return pack(values.tobytes())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        values = array("i")
+        values.frombytes(unpack(bytes(value)))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
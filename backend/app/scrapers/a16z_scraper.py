@@ -1,12 +1,15 @@
 """
 Andreessen Horowitz (a16z) Blog and Insights Scraper
 """
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict
 from datetime import datetime
+import asyncio
 import logging
 
+from app.scrapers.http_client import FetchEngine
+from app.scrapers.parsing import article_summary
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,14 +18,12 @@ class A16ZScraper:
 
     BASE_URL = "https://a16z.com"
     BLOG_URL = f"{BASE_URL}/blog"
+    FOCUS_URL = f"{BASE_URL}/portfolio"
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+    def __init__(self, engine: FetchEngine = None):
+        self.engine = engine or FetchEngine()
 
-    def scrape_blog(self, category: str = None) -> List[Dict]:
+    async def scrape_blog(self, category: str = None) -> List[Dict]:
         """
         Scrape a16z blog posts
         Args:
@@ -36,54 +37,8 @@ class A16ZScraper:
                 url = f"{url}/{category}"
 
             logger.info(f"Scraping a16z blog: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
-            posts = []
-
-            # Find article cards (a16z uses various structures)
-            articles = (
-                soup.find_all("article") or
-                soup.find_all("div", class_=lambda x: x and "post" in x.lower()) or
-                soup.find_all("div", class_=lambda x: x and "card" in x.lower())
-            )
-
-            for article in articles[:15]:  # Limit to recent 15 posts
-                # Extract title
-                title_elem = article.find(["h2", "h3", "h4", "a"])
-                if not title_elem:
-                    continue
-
-                title = title_elem.get_text(strip=True)
-
-                # Extract link
-                link_elem = article.find("a", href=True)
-                link = link_elem["href"] if link_elem else None
-                if link and not link.startswith("http"):
-                    link = f"{self.BASE_URL}{link}"
-
-                # Extract excerpt/description
-                desc_elem = article.find("p")
-                description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-                # Extract date if available
-                date_elem = article.find("time") or article.find(class_=lambda x: x and "date" in x.lower())
-                published_date = date_elem.get("datetime") if date_elem and date_elem.has_attr("datetime") else None
-
-                # Extract category/tags
-                category_elem = article.find(class_=lambda x: x and ("category" in x.lower() or "tag" in x.lower()))
-                post_category = category_elem.get_text(strip=True) if category_elem else "general"
-
-                posts.append({
-                    "title": title,
-                    "description": description,
-                    "url": link,
-                    "category": post_category,
-                    "source_type": "a16z_blog",
-                    "published_at": published_date,
-                    "scraped_at": datetime.utcnow().isoformat()
-                })
+            posts = await self.engine.fetch_parsed(url, self._parse_blog, "a16z_blog", source="a16z")
+            await self._enrich_posts(posts)
 
             logger.info(f"✓ Scraped {len(posts)} posts from a16z blog")
             return posts
@@ -92,53 +47,119 @@ class A16ZScraper:
             logger.error(f"Error scraping a16z blog: {e}")
             return []
 
-    def scrape_focus_areas(self) -> List[Dict]:
+    def _parse_blog(self, html: str) -> List[Dict]:
+        """Parse article cards out of a blog listing"""
+        soup = BeautifulSoup(html, "lxml")
+        posts = []
+
+        # Find article cards (a16z uses various structures)
+        articles = (
+            soup.find_all("article") or
+            soup.find_all("div", class_=lambda x: x and "post" in x.lower()) or
+            soup.find_all("div", class_=lambda x: x and "card" in x.lower())
+        )
+
+        for article in articles[:15]:  # Limit to recent 15 posts
+            # Extract title
+            title_elem = article.find(["h2", "h3", "h4", "a"])
+            if not title_elem:
+                continue
+
+            title = title_elem.get_text(strip=True)
+
+            # Extract link
+            link_elem = article.find("a", href=True)
+            link = link_elem["href"] if link_elem else None
+            if link and not link.startswith("http"):
+                link = f"{self.BASE_URL}{link}"
+
+            # Extract excerpt/description
+            desc_elem = article.find("p")
+            description = desc_elem.get_text(strip=True) if desc_elem else ""
+
+            # Extract date if available
+            date_elem = article.find("time") or article.find(class_=lambda x: x and "date" in x.lower())
+            published_date = date_elem.get("datetime") if date_elem and date_elem.has_attr("datetime") else None
+
+            # Extract category/tags
+            category_elem = article.find(class_=lambda x: x and ("category" in x.lower() or "tag" in x.lower()))
+            post_category = category_elem.get_text(strip=True) if category_elem else "general"
+
+            posts.append({
+                "title": title,
+                "description": description,
+                "url": link,
+                "category": post_category,
+                "source_type": "a16z_blog",
+                "published_at": published_date,
+                "scraped_at": datetime.utcnow().isoformat()
+            })
+
+        return posts
+
+    async def _enrich_posts(self, posts: List[Dict]):
+        """Fetch article pages in parallel for posts listed without an excerpt"""
+        missing = [post for post in posts if not post["description"] and post["url"]]
+        if not missing:
+            return
+
+        summaries = await self.engine.fetch_many_parsed(
+            [post["url"] for post in missing], article_summary, "article_summary", source="a16z"
+        )
+        for post, summary in zip(missing, summaries):
+            if summary:
+                post["description"] = summary
+
+    async def scrape_focus_areas(self) -> List[Dict]:
         """
         Scrape a16z's investment focus areas and theses
         Returns strategic themes and focus areas
         """
         try:
-            focus_url = f"{self.BASE_URL}/portfolio"
             logger.info("Scraping a16z focus areas...")
+            focus_areas = await self.engine.fetch_parsed(self.FOCUS_URL, self._parse_focus_areas, "a16z_focus", source="a16z")
 
-            response = self.session.get(focus_url, timeout=10)
-            response.raise_for_status()
+            logger.info(f"✓ Scraped {len(focus_areas)} focus areas from a16z")
+            return focus_areas
 
-            soup = BeautifulSoup(response.text, "lxml")
-            focus_areas = []
+        except Exception as e:
+            logger.error(f"Error scraping a16z focus areas: {e}")
+            return []
 
-            # Find sections describing focus areas
-            sections = soup.find_all(["section", "div"], class_=lambda x: x and "focus" in x.lower())
+    def _parse_focus_areas(self, html: str) -> List[Dict]:
+        """Parse focus area sections out of the portfolio page"""
+        soup = BeautifulSoup(html, "lxml")
+        focus_areas = []
 
-            for section in sections:
-                heading = section.find(["h2", "h3"])
-                if not heading:
-                    continue
+        # Find sections describing focus areas
+        sections = soup.find_all(["section", "div"], class_=lambda x: x and "focus" in x.lower())
 
-                title = heading.get_text(strip=True)
-                description_parts = [p.get_text(strip=True) for p in section.find_all("p")]
-                description = " ".join(description_parts)
+        for section in sections:
+            heading = section.find(["h2", "h3"])
+            if not heading:
+                continue
 
-                if description:
-                    focus_areas.append({
-                        "title": f"a16z Focus: {title}",
-                        "description": description,
-                        "url": focus_url,
-                        "source_type": "a16z_focus",
-                        "scraped_at": datetime.utcnow().isoformat()
-                    })
+            title = heading.get_text(strip=True)
+            description_parts = [p.get_text(strip=True) for p in section.find_all("p")]
+            description = " ".join(description_parts)
 
-            logger.info(f"✓ Scraped {len(focus_areas)} focus areas from a16z")
-            return focus_areas
+            if description:
+                focus_areas.append({
+                    "title": f"a16z Focus: {title}",
+                    "description": description,
+                    "url": self.FOCUS_URL,
+                    "source_type": "a16z_focus",
+                    "scraped_at": datetime.utcnow().isoformat()
+                })
 
-        except Exception as e:
-            logger.error(f"Error scraping a16z focus areas: {e}")
-            return []
+        return focus_areas
 
-    def get_all_sources(self) -> List[Dict]:
+    async def get_all_sources(self) -> List[Dict]:
         """Get all a16z sources (blog + focus areas)"""
-        blog_posts = self.scrape_blog()
-        focus_areas = self.scrape_focus_areas()
+        blog_posts, focus_areas = await asyncio.gather(
+            self.scrape_blog(),
+            self.scrape_focus_areas()
+        )
         all_sources = blog_posts + focus_areas
 
         # If scraping failed completely, use fallback data
@@ -194,7 +215,7 @@ if __name__ == "__main__":
     # Test scraper
     logging.basicConfig(level=logging.INFO)
     scraper = A16ZScraper()
-    sources = scraper.get_all_sources()
+    sources = scraper.engine.run(scraper.get_all_sources())
     print(f"\nFound {len(sources)} a16z sources")
     for source in sources[:3]:
         print(f"\n{source['title'][:80]}...")
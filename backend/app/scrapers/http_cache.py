@@ -0,0 +1,85 @@
+"""
+On-disk conditional-GET cache for scraped pages
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "http_cache"
+
+
+def body_hash(body: str) -> str:
+    """Stable hash of a response body"""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class HTTPCache:
+    """
+    Stores validators (ETag / Last-Modified), the body hash, the body and
+    parsed results per URL, one JSON file per URL.
+
+    Parsed results are keyed by parser so a page whose body has not changed
+    can be served without running BeautifulSoup again.
+    """
+
+    def __init__(self, cache_dir: Path = None):
+        self.cache_dir = Path(cache_dir or os.getenv("HTTP_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Load the cache entry for a URL"""
+        path = self._path(url)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def save(self, url: str, entry: Dict):
+        """Write the cache entry for a URL atomically"""
+        path = self._path(url)
+        tmp_path = path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def new_entry(url: str, body: str, etag: str = None, last_modified: str = None) -> Dict:
+        """Build a fresh entry for a changed body"""
+        return {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash(body),
+            "body": body,
+            "parsed": {},
+            "fetched_at": datetime.utcnow().isoformat()
+        }
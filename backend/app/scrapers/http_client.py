@@ -0,0 +1,246 @@
+"""
+Shared async HTTP fetch engine for all scrapers
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.scrapers.http_cache import HTTPCache, body_hash
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+def restamp(parsed: Any, scraped_at: str) -> Any:
+    """Cached parse result with its items' scraped_at set to the current fetch"""
+    if isinstance(parsed, list):
+        return [restamp(item, scraped_at) for item in parsed]
+    if isinstance(parsed, dict) and "scraped_at" in parsed:
+        return {**parsed, "scraped_at": scraped_at}
+    return parsed
+
+
+class RetryPolicy:
+    """Retry and backoff settings for one source"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        retry_statuses: tuple = (429, 500, 502, 503, 504)
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.retry_statuses = retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before the next attempt (honours a numeric Retry-After)"""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+
+
+# Retry/backoff policy per source
+SOURCE_POLICIES = {
+    "default": RetryPolicy(),
+    "yc": RetryPolicy(max_attempts=3, backoff_base=1.0, timeout=10.0),
+    "a16z": RetryPolicy(max_attempts=3, backoff_base=1.5, timeout=15.0),
+    "product_hunt": RetryPolicy(max_attempts=2, backoff_base=2.0, timeout=10.0),
+}
+
+
+class FetchEngine:
+    """
+    Pooled keep-alive HTTP client shared by every scraper.
+
+    Requests to the same host are capped by a per-host semaphore and retried
+    according to the source's RetryPolicy. The underlying client is bound to
+    the running event loop and recreated when a new loop starts using it.
+    With an HTTPCache, fetch_parsed() revalidates pages with conditional GETs
+    and skips parsing when the page has not changed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        per_host_limit: int = 4,
+        policies: Dict[str, RetryPolicy] = None,
+        transport: httpx.AsyncBaseTransport = None,
+        cache: HTTPCache = None
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self.per_host_limit = per_host_limit
+        self.policies = policies or SOURCE_POLICIES
+        self.transport = transport
+        self.cache = cache
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the client for the running loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                transport=self.transport,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True
+            )
+            self._loop = loop
+            self._host_limits = {}
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Per-host concurrency limit"""
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    def policy(self, source: str) -> RetryPolicy:
+        """Retry policy for a source"""
+        return self.policies.get(source, self.policies["default"])
+
+    async def request(self, method: str, url: str, source: str = "default", **kwargs) -> httpx.Response:
+        """
+        Send a request with the source's retry policy.
+        Raises the last error once attempts are exhausted.
+        """
+        client = self._get_client()
+        policy = self.policy(source)
+        kwargs.setdefault("timeout", policy.timeout)
+
+        for attempt in range(1, policy.max_attempts + 1):
+            try:
+                async with self._host_limit(url):
+                    response = await client.request(method, url, **kwargs)
+
+                if response.status_code in policy.retry_statuses and attempt < policy.max_attempts:
+                    delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                    logger.warning(f"{url} returned {response.status_code}, retrying in {delay}s...")
+                    await asyncio.sleep(delay)
+                    continue
+
+                # 304 Not Modified is an answer to a conditional GET, not an error
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if attempt >= policy.max_attempts:
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning(f"{url} failed ({e}), retrying in {delay}s...")
+                await asyncio.sleep(delay)
+
+    async def get_text(self, url: str, source: str = "default") -> str:
+        """GET a page and return its body"""
+        response = await self.request("GET", url, source=source)
+        return response.text
+
+    async def fetch_many(self, urls: List[str], source: str = "default") -> List[Optional[str]]:
+        """
+        GET many pages concurrently (bounded by the per-host limit).
+        Failed pages come back as None.
+        """
+        results = await asyncio.gather(
+            *(self.get_text(url, source=source) for url in urls),
+            return_exceptions=True
+        )
+
+        pages = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {url}: {result}")
+                pages.append(None)
+            else:
+                pages.append(result)
+        return pages
+
+    async def fetch_parsed(self, url: str, parse: Callable[[str], Any], parser_key: str, source: str = "default") -> Any:
+        """
+        GET a page and return parse(body).
+
+        With a cache, sends If-None-Match / If-Modified-Since. On a 304 or an
+        unchanged body hash the previous parse result is returned and parse()
+        is not called; its scraped_at timestamps are set to this fetch.
+        """
+        if self.cache is None:
+            return parse(await self.get_text(url, source=source))
+
+        entry = self.cache.load(url)
+        response = await self.request(
+            "GET", url, source=source, headers=HTTPCache.conditional_headers(entry)
+        )
+
+        if response.status_code == 304 and entry:
+            body = entry["body"]
+        else:
+            body = response.text
+            if not entry or entry["body_hash"] != body_hash(body):
+                entry = HTTPCache.new_entry(url, body)
+
+        # Keep the latest validators for the next conditional GET
+        entry["etag"] = response.headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = response.headers.get("Last-Modified") or entry.get("last_modified")
+        entry["fetched_at"] = datetime.utcnow().isoformat()
+
+        if parser_key in entry["parsed"]:
+            logger.info(f"{url} unchanged, reusing parsed {parser_key}")
+            self.cache.save(url, entry)
+            return restamp(entry["parsed"][parser_key], entry["fetched_at"])
+
+        entry["parsed"][parser_key] = parse(body)
+        self.cache.save(url, entry)
+        return entry["parsed"][parser_key]
+
+    async def fetch_many_parsed(self, urls: List[str], parse: Callable[[str], Any], parser_key: str, source: str = "default") -> List[Any]:
+        """
+        fetch_parsed() many pages concurrently (bounded by the per-host limit).
+        Failed pages come back as None.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_parsed(url, parse, parser_key, source=source) for url in urls),
+            return_exceptions=True
+        )
+
+        parsed = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {url}: {result}")
+                parsed.append(None)
+            else:
+                parsed.append(result)
+        return parsed
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    def run(self, coro):
+        """Run a coroutine from sync code and close the pool afterwards"""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(runner())
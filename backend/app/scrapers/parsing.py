@@ -0,0 +1,23 @@
+"""
+Shared HTML parsing helpers for scrapers
+"""
+from bs4 import BeautifulSoup
+
+
+def article_summary(html: str, max_length: int = 500) -> str:
+    """
+    Extract a short summary from an article page.
+    Prefers the meta description, then the first substantial paragraph.
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    meta = soup.find("meta", attrs={"name": "description"}) or soup.find("meta", attrs={"property": "og:description"})
+    if meta and meta.get("content"):
+        return meta["content"].strip()[:max_length]
+
+    for paragraph in soup.find_all("p"):
+        text = paragraph.get_text(strip=True)
+        if len(text) >= 80:
+            return text[:max_length]
+
+    return ""
@@ -1,11 +1,13 @@
 """
 Product Hunt Scraper for trending products and market insights
 """
-import requests
+from bs4 import BeautifulSoup
 from typing import List, Dict
 from datetime import datetime
 import logging
 
+from app.scrapers.http_client import FetchEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,15 +19,13 @@ class ProductHuntScraper:
     # https://api.producthunt.com/v2/oauth/applications
 
     BASE_URL = "https://www.producthunt.com"
+    API_URL = "https://api.producthunt.com/v2/api/graphql"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, engine: FetchEngine = None):
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        self.engine = engine or FetchEngine()
 
-    def get_trending_products(self, limit: int = 20) -> List[Dict]:
+    async def get_trending_products(self, limit: int = 20) -> List[Dict]:
         """
         Get trending products from Product Hunt
         Note: Without API key, this scrapes the public page
@@ -35,10 +35,10 @@ class ProductHuntScraper:
 
             if self.api_key:
                 # Use GraphQL API if key is available
-                products = self._get_trending_via_api(limit)
+                products = await self._get_trending_via_api(limit)
             else:
                 # Fallback to scraping
-                products = self._get_trending_via_scraping(limit)
+                products = await self._get_trending_via_scraping(limit)
 
             # If all methods failed, use fallback data
             if not products:
@@ -51,64 +51,68 @@ class ProductHuntScraper:
             logger.error(f"Error fetching Product Hunt data: {e}")
             return self._get_fallback_trending_products()[:limit]
 
-    def _get_trending_via_scraping(self, limit: int) -> List[Dict]:
+    async def _get_trending_via_scraping(self, limit: int) -> List[Dict]:
         """Scrape Product Hunt homepage for trending products"""
         try:
-            response = self.session.get(self.BASE_URL, timeout=10)
-            response.raise_for_status()
+            products = await self.engine.fetch_parsed(
+                self.BASE_URL,
+                lambda html: self._parse_homepage(html, limit),
+                f"product_hunt:{limit}",
+                source="product_hunt"
+            )
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, "lxml")
+            logger.info(f"✓ Scraped {len(products)} products from Product Hunt")
+            return products
 
-            products = []
+        except Exception as e:
+            logger.error(f"Error scraping Product Hunt: {e}")
+            return []
 
-            # Product Hunt uses dynamic content, so this is a simplified example
-            # In production, consider using Selenium or Playwright for JS-rendered content
+    def _parse_homepage(self, html: str, limit: int) -> List[Dict]:
+        """Parse product cards out of the homepage"""
+        soup = BeautifulSoup(html, "lxml")
 
-            # Look for product cards
-            product_items = soup.find_all("div", {"data-test": "post-item"}) or soup.find_all("article")
+        products = []
 
-            for item in product_items[:limit]:
-                # Extract product name
-                name_elem = item.find("h3") or item.find("a")
-                name = name_elem.get_text(strip=True) if name_elem else "Unknown Product"
+        # Product Hunt uses dynamic content, so this is a simplified example
+        # In production, consider using Selenium or Playwright for JS-rendered content
 
-                # Extract tagline/description
-                tagline_elem = item.find("p") or item.find(class_="tagline")
-                tagline = tagline_elem.get_text(strip=True) if tagline_elem else ""
+        # Look for product cards
+        product_items = soup.find_all("div", {"data-test": "post-item"}) or soup.find_all("article")
 
-                # Extract upvotes
-                votes_elem = item.find(class_=lambda x: x and "vote" in x.lower())
-                votes = votes_elem.get_text(strip=True) if votes_elem else "0"
+        for item in product_items[:limit]:
+            # Extract product name
+            name_elem = item.find("h3") or item.find("a")
+            name = name_elem.get_text(strip=True) if name_elem else "Unknown Product"
 
-                # Extract URL
-                link_elem = item.find("a", href=True)
-                url = link_elem["href"] if link_elem else None
-                if url and not url.startswith("http"):
-                    url = f"{self.BASE_URL}{url}"
+            # Extract tagline/description
+            tagline_elem = item.find("p") or item.find(class_="tagline")
+            tagline = tagline_elem.get_text(strip=True) if tagline_elem else ""
 
-                products.append({
-                    "name": name,
-                    "tagline": tagline,
-                    "votes": votes,
-                    "url": url,
-                    "source_type": "product_hunt",
-                    "scraped_at": datetime.utcnow().isoformat()
-                })
+            # Extract upvotes
+            votes_elem = item.find(class_=lambda x: x and "vote" in x.lower())
+            votes = votes_elem.get_text(strip=True) if votes_elem else "0"
 
-            logger.info(f"✓ Scraped {len(products)} products from Product Hunt")
-            return products
+            # Extract URL
+            link_elem = item.find("a", href=True)
+            url = link_elem["href"] if link_elem else None
+            if url and not url.startswith("http"):
+                url = f"{self.BASE_URL}{url}"
 
-        except Exception as e:
-            logger.error(f"Error scraping Product Hunt: {e}")
-            return []
+            products.append({
+                "name": name,
+                "tagline": tagline,
+                "votes": votes,
+                "url": url,
+                "source_type": "product_hunt",
+                "scraped_at": datetime.utcnow().isoformat()
+            })
 
-    def _get_trending_via_api(self, limit: int) -> List[Dict]:
+        return products
+
+    async def _get_trending_via_api(self, limit: int) -> List[Dict]:
         """Use Product Hunt GraphQL API (requires authentication)"""
         try:
-            # GraphQL endpoint
-            api_url = "https://api.producthunt.com/v2/api/graphql"
-
             # GraphQL query for top posts
             query = """
             query {
@@ -142,13 +146,13 @@ class ProductHuntScraper:
                 "Content-Type": "application/json"
             }
 
-            response = self.session.post(
-                api_url,
+            response = await self.engine.request(
+                "POST",
+                self.API_URL,
+                source="product_hunt",
                 json={"query": query},
-                headers=headers,
-                timeout=10
+                headers=headers
             )
-            response.raise_for_status()
 
             data = response.json()
             products = []
@@ -297,7 +301,7 @@ if __name__ == "__main__":
     # Test scraper
     logging.basicConfig(level=logging.INFO)
     scraper = ProductHuntScraper()
-    products = scraper.get_trending_products(limit=10)
+    products = scraper.engine.run(scraper.get_trending_products(limit=10))
     print(f"\nFound {len(products)} trending products")
     for product in products[:5]:
         print(f"\n{product['name']}")
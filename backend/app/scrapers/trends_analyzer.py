@@ -2,26 +2,32 @@
 Google Trends and Market Trend Analyzer
 """
 from pytrends.request import TrendReq
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import logging
 import time
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 class TrendsAnalyzer:
     """Analyzes market trends using Google Trends"""
 
+    # Google Trends accepts at most 5 terms per payload: the anchor + 4 keywords
+    MAX_TERMS_PER_PAYLOAD = 5
+
     def __init__(self):
         self.pytrends = TrendReq(hl='en-US', tz=360)
 
-    def analyze_keyword(self, keyword: str, timeframe: str = "today 3-m") -> Dict:
+    def analyze_keyword(self, keyword: str, timeframe: str = "today 3-m", geo: str = "US") -> Dict:
         """
         Analyze a single keyword on Google Trends
         Args:
             keyword: Search term
             timeframe: Time period (e.g., "today 3-m", "today 12-m", "now 7-d")
+            geo: Region
         Returns:
             Trend data with metrics
         """
@@ -33,7 +39,7 @@ class TrendsAnalyzer:
                 [keyword],
                 cat=0,
                 timeframe=timeframe,
-                geo='US',
+                geo=geo,
                 gprop=''
             )
 
@@ -183,12 +189,20 @@ class TrendsAnalyzer:
             logger.error(f"Error discovering trending topics: {e}")
             return []
 
-    def batch_analyze(self, keywords: List[str], delay: float = 1.0) -> List[Dict]:
+    def batch_analyze(
+        self,
+        keywords: List[str],
+        delay: float = 1.0,
+        timeframe: str = "today 3-m",
+        geo: str = "US"
+    ) -> List[Dict]:
         """
         Analyze multiple keywords with rate limiting
         Args:
             keywords: List of keywords to analyze
             delay: Delay between requests (seconds)
+            timeframe: Time period
+            geo: Region
         Returns:
             List of trend analyses
         """
@@ -198,27 +212,15 @@ class TrendsAnalyzer:
         current_delay = delay
 
         for keyword in keywords:
-            for attempt in range(max_retries):
-                result = self.analyze_keyword(keyword)
-
-                # Check if we hit rate limit
-                if "error" in result and "429" in str(result["error"]):
-                    retry_count += 1
-                    if attempt < max_retries - 1:
-                        # Exponential backoff
-                        backoff_delay = current_delay * (2 ** (attempt + 1))
-                        logger.warning(f"Rate limited, waiting {backoff_delay}s before retry...")
-                        time.sleep(backoff_delay)
-                        continue
-                    else:
-                        logger.warning(f"Max retries reached for '{keyword}', using fallback data")
-                        result = self._get_fallback_trend(keyword)
-                else:
-                    # Success, reset delay
-                    retry_count = 0
-
-                results.append(result)
-                break
+            result = self._analyze_with_backoff(keyword, current_delay, timeframe, geo, max_retries)
+            if self._is_rate_limited(result):
+                retry_count += max_retries
+                logger.warning(f"Max retries reached for '{keyword}', using fallback data")
+                result = self._get_fallback_trend(keyword)
+            else:
+                # Success, reset delay
+                retry_count = 0
+            results.append(result)
 
             # Increase delay if we're getting rate limited frequently
             if retry_count > 2:
@@ -236,6 +238,187 @@ class TrendsAnalyzer:
 
         return results
 
+    def batch_analyze_grouped(
+        self,
+        keywords: List[str],
+        anchor: Optional[str] = None,
+        timeframe: str = "today 3-m",
+        geo: str = "US",
+        delay: float = 1.0
+    ) -> List[Dict]:
+        """
+        Analyze keywords in payloads of five around a shared anchor term.
+
+        Google Trends scales every payload to its own 0-100 range, so each
+        group is rescaled by the anchor's mean relative to the first group.
+        Growth and momentum are then computed for the whole batch at once.
+        Keywords from payloads that fail, or whose anchor has no interest
+        (so can't be rescaled), are analyzed one at a time instead; those
+        results are on their own scale and carry no "anchor".
+        Args:
+            keywords: Keywords to analyze
+            anchor: Term included in every payload (defaults to the first keyword)
+            timeframe: Time period
+            geo: Region
+            delay: Delay between payloads (seconds)
+        Returns:
+            List of trend analyses, one per keyword, in input order
+        """
+        if not keywords:
+            return []
+
+        anchor = anchor or keywords[0]
+        others = [k for k in dict.fromkeys(keywords) if k != anchor]
+        group_size = self.MAX_TERMS_PER_PAYLOAD - 1
+        groups = [others[i:i + group_size] for i in range(0, len(others), group_size)] or [[]]
+
+        series = {}
+        related = {}
+        scales = {}
+        dates = None
+        reference = None
+
+        for index, group in enumerate(groups):
+            terms = [anchor] + group
+            fetched = self._fetch_group(terms, timeframe, geo, delay)
+
+            if fetched is not None:
+                interest_df, group_related = fetched
+                anchor_mean = float(interest_df[anchor].mean()) if anchor in interest_df else 0.0
+                if anchor_mean <= 0:
+                    logger.warning(f"Anchor '{anchor}' has no interest alongside {group}, can't rescale them")
+                    fetched = None
+
+            if fetched is not None:
+                if reference is None:
+                    reference = anchor_mean
+                    dates = [str(date) for date in interest_df.index]
+                scale = reference / anchor_mean
+
+                for term in terms:
+                    if term in series or term not in interest_df:
+                        continue
+                    series[term] = interest_df[term].values.astype(float) * scale
+                    related[term] = group_related.get(term, [])
+                    scales[term] = round(scale, 4)
+
+            if index < len(groups) - 1:
+                time.sleep(delay)  # Rate limiting
+
+        # Length must match across groups for the vectorized pass
+        length = min((len(values) for values in series.values()), default=0)
+        analyzed = [k for k in keywords if k in series and length > 0]
+        results = {}
+
+        if analyzed:
+            matrix = np.vstack([series[k][-length:] for k in analyzed])
+            average, recent, growth, momentum = self._batch_metrics(matrix)
+            dates = dates[-length:]
+
+            for row, keyword in enumerate(analyzed):
+                results[keyword] = {
+                    "keyword": keyword,
+                    "average_interest": round(float(average[row]), 2),
+                    "recent_interest": round(float(recent[row]), 2),
+                    "growth_rate": round(float(growth[row]), 2),
+                    "momentum_score": round(float(momentum[row]), 2),
+                    "related_keywords": related[keyword],
+                    "time_series": [
+                        {
+                            "date": date,
+                            "value": int(round(value))
+                        }
+                        for date, value in zip(dates, matrix[row])
+                    ],
+                    "anchor": anchor,
+                    "scale_factor": scales[keyword],
+                    "analyzed_at": datetime.utcnow().isoformat()
+                }
+
+        failed = list(dict.fromkeys(k for k in keywords if k not in results))
+        if failed:
+            logger.warning(f"No batched Trends data for {failed}, analyzing them individually")
+        for keyword in failed:
+            time.sleep(delay)  # Rate limiting
+            results[keyword] = self._analyze_with_backoff(keyword, delay, timeframe, geo)
+
+        return [results[k] for k in keywords]
+
+    def _analyze_with_backoff(self, keyword: str, delay: float, timeframe: str, geo: str, max_retries: int = 3) -> Dict:
+        """
+        analyze_keyword() with exponential backoff on rate limiting.
+        Returns the last (rate-limited) error if every attempt hit a 429.
+        """
+        for attempt in range(max_retries):
+            result = self.analyze_keyword(keyword, timeframe=timeframe, geo=geo)
+            if not self._is_rate_limited(result) or attempt == max_retries - 1:
+                return result
+
+            # Exponential backoff
+            backoff_delay = delay * (2 ** (attempt + 1))
+            logger.warning(f"Rate limited, waiting {backoff_delay}s before retry...")
+            time.sleep(backoff_delay)
+
+    @staticmethod
+    def _is_rate_limited(result: Dict) -> bool:
+        """Whether an analysis failed on a 429"""
+        return "error" in result and "429" in str(result["error"])
+
+    def _fetch_group(self, terms: List[str], timeframe: str, geo: str, delay: float, max_retries: int = 3):
+        """
+        Fetch interest over time and related queries for one payload.
+        Returns (interest_df, {term: [related]}) or None if unavailable.
+        """
+        for attempt in range(max_retries):
+            try:
+                logger.info(f"Analyzing trend group: {terms}")
+                self.pytrends.build_payload(terms, cat=0, timeframe=timeframe, geo=geo, gprop='')
+
+                interest_df = self.pytrends.interest_over_time()
+                if interest_df.empty:
+                    return None
+
+                group_related = {}
+                try:
+                    for term, queries in self.pytrends.related_queries().items():
+                        if queries and queries.get("top") is not None:
+                            group_related[term] = queries["top"]["query"].head(5).tolist()
+                except Exception as e:
+                    logger.error(f"Error getting related queries: {e}")
+
+                return interest_df, group_related
+
+            except Exception as e:
+                if "429" in str(e) and attempt < max_retries - 1:
+                    # Exponential backoff
+                    backoff_delay = delay * (2 ** (attempt + 1))
+                    logger.warning(f"Rate limited, waiting {backoff_delay}s before retry...")
+                    time.sleep(backoff_delay)
+                    continue
+
+                logger.error(f"Error analyzing trend group {terms}: {e}")
+                return None
+
+        return None
+
+    @staticmethod
+    def _batch_metrics(matrix: np.ndarray):
+        """
+        Average, recent/older 4-period means, growth and momentum for every
+        row of a keywords x periods matrix in one pass.
+        """
+        average = matrix.mean(axis=1)
+        recent = matrix[:, -4:].mean(axis=1)  # Last 4 periods
+        older = matrix[:, :4].mean(axis=1)  # First 4 periods
+
+        growth = np.zeros_like(recent)
+        np.divide((recent - older) * 100, older, out=growth, where=older > 0)
+
+        # Weighted toward recent data
+        momentum = recent * (1 + growth / 100)
+
+        return average, recent, growth, momentum
+
     def _get_fallback_trend(self, keyword: str) -> Dict:
         """Get fallback trend data for a single keyword"""
         # Assign reasonable momentum scores based on keyword type
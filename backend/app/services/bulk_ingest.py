@@ -0,0 +1,277 @@
+"""
+Bulk ingestion: multi-row INSERT ... RETURNING and executemany UPDATEs
+
+The scan path saves a handful of rows per run, but backfills and imports
+write thousands. Building ORM objects one at a time and flushing them
+through the unit of work costs a round trip and object bookkeeping per
+row; these helpers send plain dicts in chunks instead.
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import delete, insert, inspect, update
+from sqlalchemy.orm import Session, selectinload
+
+from app.analyzers.similarity import idea_text, pack_signature, signature
+from app.models.database import Idea, IdeaPayload, IdeaSignature, Trend, TrendSeries
+from app.models.series import encode_series, merge_series
+from app.services.idea_stats import record_idea_changes
+
+logger = logging.getLogger(__name__)
+
+# Rows per statement; keeps multi-row VALUES under SQLite's bound parameter limit
+BULK_CHUNK_SIZE = 500
+
+
+def _chunks(rows: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def bulk_insert(db: Session, model, rows: List[Dict], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """
+    Insert rows with multi-row INSERT ... RETURNING the primary key.
+    Args:
+        db: Database session (not committed here)
+        model: Mapped class with a single-column primary key
+        rows: Column dicts, all with the same keys
+    Returns:
+        New primary keys, in the order of rows
+    """
+    primary_key = inspect(model).primary_key[0]
+    statement = insert(model).returning(primary_key, sort_by_parameter_order=True)
+    ids = []
+    for chunk in _chunks(rows, chunk_size):
+        ids.extend(db.scalars(statement, chunk).all())
+    return ids
+
+
+def bulk_update(db: Session, model, rows: List[Dict], chunk_size: int = BULK_CHUNK_SIZE):
+    """
+    UPDATE rows by primary key with executemany.
+    Args:
+        db: Database session (not committed here)
+        model: Mapped class
+        rows: Column dicts including "id"
+    """
+    for chunk in _chunks(rows, chunk_size):
+        db.execute(update(model), chunk)
+
+
+def filter_ideas(ideas: List[Dict], min_feasibility: float, min_monetization: float) -> List[Dict]:
+    """Ideas that clear the feasibility and monetization thresholds"""
+    kept = []
+
+    for idea_data in ideas:
+        if idea_data["feasibility_score"] < min_feasibility:
+            logger.info(f"Filtered out (low feasibility {idea_data['feasibility_score']}): {idea_data['title']}")
+            continue
+
+        if idea_data["monetization_score"] < min_monetization:
+            logger.info(f"Filtered out (low monetization {idea_data['monetization_score']}): {idea_data['title']}")
+            continue
+
+        kept.append(idea_data)
+
+    return kept
+
+
+def idea_row(idea_data: Dict, now: datetime) -> Dict:
+    """Column values for a generated idea"""
+    return {
+        "title": idea_data["title"],
+        "description": idea_data["description"],
+        "category": idea_data["category"],
+        "channel": idea_data["channel"],
+        "feasibility_score": idea_data["feasibility_score"],
+        "market_demand_score": idea_data["market_demand_score"],
+        "monetization_score": idea_data["monetization_score"],
+        "competition_score": idea_data["competition_score"],
+        "risk_score": idea_data["risk_score"],
+        "overall_score": idea_data["overall_score"],
+        "target_market": idea_data["target_market"],
+        "revenue_model": idea_data["revenue_model"],
+        "estimated_time_to_build": idea_data["estimated_time_to_build"],
+        "estimated_startup_cost": idea_data["estimated_startup_cost"],
+        "key_features": idea_data["key_features"],
+        "competitors": idea_data["competitors"],
+        "differentiation": idea_data["differentiation"],
+        "status": "new",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def insert_ideas(db: Session, ideas: List[Dict], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """Insert generated ideas and their payloads, returning their ids (not committed, idea_stats updated)"""
+    now = datetime.utcnow()
+    rows = [idea_row(idea_data, now) for idea_data in ideas]
+    idea_ids = bulk_insert(db, Idea, rows, chunk_size)
+    record_idea_changes(db, added=rows)
+    bulk_insert(db, IdeaPayload, [
+        {"idea_id": idea_id, "ai_reasoning": idea_data.get("ai_reasoning")}
+        for idea_id, idea_data in zip(idea_ids, ideas)
+        if idea_data.get("ai_reasoning") is not None
+    ], chunk_size)
+    store_idea_signatures(db, {
+        idea_id: signature(idea_text(row["title"], row["description"]))
+        for idea_id, row in zip(idea_ids, rows)
+    }, chunk_size)
+    return idea_ids
+
+
+def store_idea_signatures(db: Session, signatures: Dict, chunk_size: int = BULK_CHUNK_SIZE):
+    """Replace the near-duplicate signatures of ideas, keyed by idea id (not committed)"""
+    idea_ids = list(signatures)
+    for i in range(0, len(idea_ids), chunk_size):
+        chunk = idea_ids[i:i + chunk_size]
+        db.execute(delete(IdeaSignature).where(IdeaSignature.idea_id.in_(chunk)))
+
+    bulk_insert(db, IdeaSignature, [
+        {"idea_id": idea_id, "minhash": pack_signature(sig)}
+        for idea_id, sig in signatures.items()
+    ], chunk_size)
+
+
+def trend_values(result: Dict, now: datetime) -> Dict:
+    """Analysis columns of a trend row"""
+    return {
+        "growth_rate": result.get("growth_rate", 0),
+        "momentum_score": result.get("momentum_score", 0),
+        "related_keywords": result.get("related_keywords", []),
+        "last_updated": now,
+        "is_active": True,
+    }
+
+
+def store_trend_series(db: Session, series: Dict[int, Dict], chunk_size: int = BULK_CHUNK_SIZE):
+    """Replace the time series of trends, keyed by trend id, with encoded series columns (not committed)"""
+    trend_ids = list(series)
+    for i in range(0, len(trend_ids), chunk_size):
+        chunk = trend_ids[i:i + chunk_size]
+        db.execute(delete(TrendSeries).where(TrendSeries.trend_id.in_(chunk)))
+
+    bulk_insert(db, TrendSeries, [
+        {"trend_id": trend_id, **columns}
+        for trend_id, columns in series.items()
+    ], chunk_size)
+
+
+def is_storable_trend(result: Dict) -> bool:
+    """Real analyses only; failures and fallback estimates are never stored"""
+    return bool(result) and "error" not in result and not result.get("is_fallback")
+
+
+def insert_trends(
+    db: Session,
+    results: List[Dict],
+    timeframe: str,
+    geo: str,
+    source: str = "google_trends",
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> List[int]:
+    """Insert trend analyses and their series, returning their ids (not committed)"""
+    now = datetime.utcnow()
+    results = [result for result in results if is_storable_trend(result)]
+    rows = [
+        {
+            "keyword": result["keyword"],
+            "source": source,
+            "timeframe": timeframe,
+            "geo": geo,
+            "detected_at": now,
+            **trend_values(result, now),
+        }
+        for result in results
+    ]
+    trend_ids = bulk_insert(db, Trend, rows, chunk_size)
+    bulk_insert(db, TrendSeries, [
+        {"trend_id": trend_id, **encode_series(result.get("time_series", []))}
+        for trend_id, result in zip(trend_ids, results)
+    ], chunk_size)
+    return trend_ids
+
+
+def canonical_trends_query(db: Session, keywords: List[str], source: str, geo: str):
+    """Active rows for keywords, newest first (ix_trends_keyword_source_geo)"""
+    return (
+        db.query(Trend)
+        .filter(
+            Trend.keyword.in_(keywords),
+            Trend.source == source,
+            Trend.geo == geo,
+            Trend.is_active == True
+        )
+        .order_by(Trend.last_updated.desc(), Trend.id.desc())
+    )
+
+
+def load_canonical_trends(
+    db: Session,
+    keywords: List[str],
+    source: str,
+    geo: str,
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> Dict[str, Trend]:
+    """
+    Canonical (newest active) row per keyword, with its series loaded.
+    Any other active rows for the key are marked inactive (not committed).
+    """
+    rows = {}
+    duplicates = []
+    for i in range(0, len(keywords), chunk_size):
+        query = canonical_trends_query(db, keywords[i:i + chunk_size], source, geo)
+        for row in query.options(selectinload(Trend.series)):
+            if row.keyword in rows:
+                duplicates.append({"id": row.id, "is_active": False})
+            else:
+                rows[row.keyword] = row
+
+    if duplicates:
+        bulk_update(db, Trend, duplicates, chunk_size)
+        logger.info(f"Deactivated {len(duplicates)} duplicate trend rows")
+    return rows
+
+
+def upsert_trends(
+    db: Session,
+    results: List[Dict],
+    timeframe: str,
+    geo: str,
+    source: str = "google_trends",
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> List[int]:
+    """
+    Store trend analyses on the canonical row of each (keyword, source, geo),
+    merging new time series points into the stored series. Keywords without
+    a row get one.
+    Returns:
+        Trend ids, one per stored keyword (not committed)
+    """
+    # Last analysis wins when a keyword appears twice
+    results = list({result["keyword"]: result for result in results if is_storable_trend(result)}.values())
+    rows = load_canonical_trends(db, [result["keyword"] for result in results], source, geo, chunk_size)
+    now = datetime.utcnow()
+    new_results = []
+    updates = []
+    series = {}
+
+    for result in results:
+        row = rows.get(result["keyword"])
+        if row is None:
+            new_results.append(result)
+            continue
+
+        updates.append({"id": row.id, "timeframe": timeframe, **trend_values(result, now)})
+        stored = row.series.columns() if row.series is not None else None
+        series[row.id] = merge_series(stored, encode_series(result.get("time_series", [])))
+
+    new_ids = iter(insert_trends(db, new_results, timeframe, geo, source=source, chunk_size=chunk_size))
+    bulk_update(db, Trend, updates, chunk_size)
+    store_trend_series(db, series, chunk_size)
+
+    return [
+        rows[result["keyword"]].id if result["keyword"] in rows else next(new_ids)
+        for result in results
+    ]
@@ -0,0 +1,104 @@
+"""
+Concurrent source collection stage for scans
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_TIMEOUT_SECONDS = 60.0
+
+
+class SourceCollector:
+    """
+    Fans out all registered sources at once and gathers partial results.
+
+    Each source runs with its own timeout. A source that fails or times out
+    contributes an empty result and an entry in ``errors``; it never fails
+    the other sources, so scan latency is bounded by the slowest source.
+    """
+
+    def __init__(self, default_timeout: float = DEFAULT_SOURCE_TIMEOUT_SECONDS):
+        self.default_timeout = default_timeout
+        self.sources: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, name: str, fetch: Callable, timeout: Optional[float] = None):
+        """
+        Register a source.
+
+        Args:
+            name: Source name (e.g. "yc_rfs", "google_trends")
+            fetch: Blocking callable or coroutine function returning a list
+            timeout: Seconds to wait for this source (default_timeout if None)
+        """
+        self.sources[name] = {
+            "fetch": fetch,
+            "timeout": timeout or self.default_timeout
+        }
+
+    def collect(self) -> Dict[str, Dict]:
+        """Run all sources concurrently from synchronous code"""
+        return asyncio.run(self.collect_async())
+
+    async def collect_async(self) -> Dict[str, Dict]:
+        """
+        Run all sources concurrently.
+
+        Returns:
+            {"results": {name: list}, "errors": {name: str}, "durations": {name: float}}
+        """
+        collected = {"results": {}, "errors": {}, "durations": {}}
+        if not self.sources:
+            return collected
+
+        # Blocking scrapers get a dedicated pool that is not joined on exit,
+        # so a hung request past its timeout cannot hold the scan open.
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.sources),
+            thread_name_prefix="shapex-collector"
+        )
+        try:
+            outcomes = await asyncio.gather(*(
+                self._run_source(name, source, executor)
+                for name, source in self.sources.items()
+            ))
+        finally:
+            executor.shutdown(wait=False)
+
+        for name, result, error, duration in outcomes:
+            collected["results"][name] = result
+            collected["durations"][name] = round(duration, 2)
+            if error:
+                collected["errors"][name] = error
+
+        return collected
+
+    async def _run_source(self, name: str, source: Dict, executor: ThreadPoolExecutor):
+        """Run a single source with its timeout, never raising"""
+        fetch = source["fetch"]
+        timeout = source["timeout"]
+        start = time.monotonic()
+
+        try:
+            if asyncio.iscoroutinefunction(fetch):
+                pending = fetch()
+            else:
+                pending = asyncio.get_running_loop().run_in_executor(executor, fetch)
+
+            result = await asyncio.wait_for(pending, timeout=timeout)
+            duration = time.monotonic() - start
+            logger.info(f"✓ Source {name}: {len(result or [])} items in {duration:.1f}s")
+            return name, result or [], None, duration
+
+        except asyncio.TimeoutError:
+            duration = time.monotonic() - start
+            logger.error(f"Source {name} timed out after {timeout}s")
+            return name, [], f"timed out after {timeout}s", duration
+
+        except Exception as e:
+            duration = time.monotonic() - start
+            logger.error(f"Source {name} failed: {e}")
+            return name, [], str(e), duration
@@ -0,0 +1,171 @@
+"""
+Materialized idea statistics for /stats
+
+idea_stats holds, per (channel, category), the idea count, favorites and
+the sums of the three averaged scores. Writers apply deltas in the same
+transaction as their change (inserted ideas, dedupe merges, PATCH
+/ideas/{id}), so /stats reads a handful of summary rows however many
+ideas there are.
+
+The same numbers come from one GROUP BY pass over ideas
+(idea_totals_select), which builds the summary from migrate_db() when it is
+missing or outdated, and answers /stats while it hasn't been built.
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import case, delete, func, insert, select, Select
+from sqlalchemy.orm import Session
+
+from app.models.database import Idea, IdeaStats, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+# Summed score columns: (Idea column, IdeaStats column)
+SCORE_SUMS = [
+    ("overall_score", "overall_score_sum"),
+    ("feasibility_score", "feasibility_score_sum"),
+    ("monetization_score", "monetization_score_sum"),
+]
+
+TOP_CATEGORIES = 5
+
+# Bump when the summary's definition changes so migrate_db() rebuilds it.
+# The version it was built with is kept in a rollup_watermarks row.
+IDEA_STATS_VERSION = 1
+IDEA_STATS_MARKER = "idea_stats_version"
+
+
+def idea_totals_select() -> Select:
+    """IdeaStats rows computed from ideas in one aggregate pass"""
+    return select(
+        func.coalesce(Idea.channel, "").label("channel"),
+        func.coalesce(Idea.category, "").label("category"),
+        func.count(Idea.id).label("idea_count"),
+        func.sum(case((Idea.favorite == True, 1), else_=0)).label("favorite_count"),
+        *[func.sum(func.coalesce(getattr(Idea, column), 0.0)).label(total) for column, total in SCORE_SUMS]
+    ).group_by(func.coalesce(Idea.channel, ""), func.coalesce(Idea.category, ""))
+
+
+# Idea columns the summary depends on
+STATS_COLUMNS = ("channel", "category", "favorite", *[column for column, _ in SCORE_SUMS])
+
+
+def stats_snapshot(idea: Idea) -> Dict:
+    """An idea's summarized column values, e.g. before it is updated"""
+    return {column: getattr(idea, column) for column in STATS_COLUMNS}
+
+
+def _contribution(idea) -> Tuple[Tuple[str, str], Dict[str, float]]:
+    """Summary group and values of an Idea or a dict of its column values"""
+    get = idea.get if isinstance(idea, dict) else lambda name: getattr(idea, name)
+    group = (get("channel") or "", get("category") or "")
+    values = {
+        "idea_count": 1,
+        "favorite_count": 1 if get("favorite") else 0,
+        **{total: get(column) or 0.0 for column, total in SCORE_SUMS},
+    }
+    return group, values
+
+
+def record_idea_changes(db: Session, added: Iterable = (), removed: Iterable = ()):
+    """
+    Apply ideas' contributions to idea_stats (not committed).
+    Args:
+        db: Session of the write being recorded
+        added: Ideas (or dicts of their column values, e.g. idea_row()) inserted,
+            or updated ones as they are now
+        removed: Ideas deleted, or stats_snapshot() of updated ones from before the update
+    """
+    deltas = defaultdict(lambda: defaultdict(float))
+    for sign, ideas in ((1, added), (-1, removed)):
+        for idea in ideas:
+            group, values = _contribution(idea)
+            for name, value in values.items():
+                deltas[group][name] += sign * value
+
+    for (channel, category), delta in deltas.items():
+        if not any(delta.values()):
+            continue
+        updated = db.execute(
+            IdeaStats.__table__.update().where(
+                IdeaStats.channel == channel, IdeaStats.category == category
+            ).values({
+                name: getattr(IdeaStats, name) + (int(value) if name.endswith("_count") else value)
+                for name, value in delta.items()
+            })
+        ).rowcount
+        if not updated:
+            db.execute(insert(IdeaStats).values(
+                channel=channel,
+                category=category,
+                **{name: int(value) if name.endswith("_count") else value for name, value in delta.items()}
+            ))
+
+
+def rebuild_idea_stats(db: Session) -> int:
+    """
+    Recompute idea_stats from ideas (committed here).
+    Returns:
+        Number of summary rows
+    """
+    db.execute(delete(IdeaStats))
+    columns = ["channel", "category", "idea_count", "favorite_count", *[total for _, total in SCORE_SUMS]]
+    db.execute(insert(IdeaStats).from_select(columns, idea_totals_select()))
+    marker = db.get(RollupWatermark, IDEA_STATS_MARKER) or RollupWatermark(name=IDEA_STATS_MARKER)
+    marker.last_id = IDEA_STATS_VERSION
+    db.add(marker)
+    db.commit()
+    groups = db.query(func.count(IdeaStats.id)).scalar()
+    logger.info(f"✓ Rebuilt idea stats ({groups} channel/category groups)")
+    return groups
+
+
+def idea_stats_outdated(db: Session) -> bool:
+    """Whether the summary was built by another IDEA_STATS_VERSION, or is empty while ideas exist"""
+    marker = db.get(RollupWatermark, IDEA_STATS_MARKER)
+    if marker is None or marker.last_id != IDEA_STATS_VERSION:
+        return True
+    return db.query(IdeaStats.id).first() is None and db.query(Idea.id).first() is not None
+
+
+def load_idea_totals(db: Session) -> List:
+    """Summary rows, or the same rows aggregated from ideas if there is no summary yet"""
+    columns = [IdeaStats.channel, IdeaStats.category, IdeaStats.idea_count, IdeaStats.favorite_count,
+               *[getattr(IdeaStats, total) for _, total in SCORE_SUMS]]
+    rows = db.execute(select(*columns).where(IdeaStats.idea_count > 0)).all()
+    if rows or db.query(IdeaStats.id).first() is not None:
+        return rows
+    return db.execute(idea_totals_select()).all()
+
+
+def summarize_ideas(rows: List) -> Dict:
+    """The ideas, scores and categories sections of /stats from summary rows"""
+    total = sum(row.idea_count for row in rows)
+    by_channel = defaultdict(int)
+    by_category = defaultdict(int)
+    for row in rows:
+        by_channel[row.channel] += row.idea_count
+        by_category[row.category or None] += row.idea_count
+
+    def average(total_name: str) -> float:
+        return round(sum(getattr(row, total_name) for row in rows) / total, 2) if total else 0
+
+    top = sorted(by_category.items(), key=lambda item: (-item[1], item[0] or ""))[:TOP_CATEGORIES]
+    return {
+        "ideas": {
+            "total": total,
+            "strategic": by_channel["strategic"],
+            "quick_wins": by_channel["quick-win"],
+            "favorites": sum(row.favorite_count for row in rows)
+        },
+        "scores": {
+            "average_overall": average("overall_score_sum"),
+            "average_feasibility": average("feasibility_score_sum"),
+            "average_monetization": average("monetization_score_sum")
+        },
+        "categories": {
+            "top": [{"name": name, "count": count} for name, count in top]
+        }
+    }
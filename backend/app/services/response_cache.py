@@ -0,0 +1,265 @@
+"""
+Read-through response cache for list and stats endpoints
+
+Responses are cached as encoded JSON, keyed by endpoint and normalized
+query params, so a hit skips both the queries and serialization.
+
+Each entry is stamped with the generation of the data it was built from
+(IDEAS, TRENDS, SCANS). Writers bump a generation after they commit (a
+scan saving ideas, PATCH /ideas/{id}, trend refreshes); entries with an
+older stamp are treated as misses and rebuilt. A TTL bounds the age of
+any entry regardless.
+
+Entries live in process memory. With RESPONSE_CACHE_SHARED=true the
+generation counters live in the cache_generations table instead
+(DatabaseGenerations), so a write in one API worker or scheduler process
+invalidates every worker's entries; each worker re-reads the counters at
+most every poll_seconds.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.database import SessionLocal, CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+# Generations (what a cached response was built from)
+IDEAS = "ideas"
+TRENDS = "trends"
+SCANS = "scans"
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_POLL_SECONDS = 1.0
+
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Key for an endpoint and its query params (unset params dropped, order ignored)"""
+    items = sorted((name, value) for name, value in params.items() if value is not None)
+    return endpoint + "?" + "&".join(f"{name}={value!r}" for name, value in items)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Response body FastAPI would send for a payload"""
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+class LocalGenerations:
+    """Generation counters for a single process"""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def current(self, names: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self.counters.get(name, 0) for name in names)
+
+    def bump(self, names: Iterable[str]):
+        with self._lock:
+            for name in names:
+                self.counters[name] = self.counters.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self.counters)
+
+
+class DatabaseGenerations:
+    """Generation counters in the cache_generations table, shared by processes"""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal, poll_seconds: float = DEFAULT_POLL_SECONDS):
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds
+        self.counters: Dict[str, int] = {}
+        self._read_at = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        if self._read_at is not None and time.monotonic() - self._read_at < self.poll_seconds:
+            return
+        db = self.session_factory()
+        try:
+            counters = dict(db.query(CacheGeneration.name, CacheGeneration.generation).all())
+        finally:
+            db.close()
+        with self._lock:
+            self.counters = counters
+            self._read_at = time.monotonic()
+
+    def current(self, names: Iterable[str]) -> Tuple[int, ...]:
+        self._refresh()
+        return tuple(self.counters.get(name, 0) for name in names)
+
+    def _increment(self, db: Session, name: str) -> int:
+        return db.query(CacheGeneration).filter(CacheGeneration.name == name).update(
+            {CacheGeneration.generation: CacheGeneration.generation + 1}, synchronize_session=False
+        )
+
+    def bump(self, names: Iterable[str]):
+        db = self.session_factory()
+        try:
+            for name in names:
+                if not self._increment(db, name):
+                    db.add(CacheGeneration(name=name, generation=1))
+                try:
+                    db.commit()
+                except IntegrityError:
+                    # Another process created the counter first
+                    db.rollback()
+                    self._increment(db, name)
+                    db.commit()
+        finally:
+            db.close()
+        # This process sees its own writes immediately
+        with self._lock:
+            self._read_at = None
+
+    def snapshot(self) -> Dict[str, int]:
+        self._refresh()
+        return dict(self.counters)
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded responses, invalidated by generation counters.
+
+    Handlers take a stamp of their generations before querying, so a write
+    that lands mid-query leaves the entry stale instead of caching old data
+    under the new generation:
+        key = response_cache.key("/trends", {"limit": limit})
+        stamp = response_cache.stamp((TRENDS,))
+        body = response_cache.get(key, stamp)
+        if body is None:
+            body = response_cache.put(key, stamp, build_payload())
+    respond() does all of this for sync handlers. Async handlers use
+    `await response_cache.stamp_async(...)`, which reads shared counters
+    off the event loop.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        generations=None
+    ):
+        """
+        Args:
+            enabled: When False every lookup misses and nothing is stored
+            ttl_seconds: Maximum age of an entry
+            max_entries: Entries kept (least recently used evicted first)
+            generations: LocalGenerations (default) or DatabaseGenerations
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generations = generations or LocalGenerations()
+        self.entries: "OrderedDict[str, Tuple[Tuple, float, bytes]]" = OrderedDict()
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    key = staticmethod(cache_key)
+
+    def stamp(self, names: Iterable[str]) -> Tuple:
+        """Current generations of the data a response is built from"""
+        names = tuple(names)
+        return names, self.generations.current(names)
+
+    async def stamp_async(self, names: Iterable[str]) -> Tuple:
+        """stamp() for async handlers; shared counters are queried in the threadpool"""
+        if isinstance(self.generations, DatabaseGenerations):
+            return await run_in_threadpool(self.stamp, names)
+        return self.stamp(names)
+
+    def _count(self, key: str, outcome: str):
+        endpoint = key.split("?", 1)[0]
+        counts = self.counts.setdefault(endpoint, {"hits": 0, "misses": 0, "stale": 0})
+        counts[outcome] += 1
+
+    def get(self, key: str, stamp: Tuple) -> Optional[bytes]:
+        """Cached body for a key if it was built at this stamp and hasn't expired"""
+        with self._lock:
+            entry = self.entries.get(key) if self.enabled else None
+            if entry is None:
+                self._count(key, "misses")
+                return None
+
+            entry_stamp, stored_at, body = entry
+            if entry_stamp != stamp or time.monotonic() - stored_at > self.ttl_seconds:
+                del self.entries[key]
+                self._count(key, "stale")
+                return None
+
+            self.entries.move_to_end(key)
+            self._count(key, "hits")
+            return body
+
+    def put(self, key: str, stamp: Tuple, payload: Any) -> bytes:
+        """Encode a payload, cache it under a key and stamp, and return the body"""
+        body = encode_json(payload)
+        if not self.enabled:
+            return body
+
+        with self._lock:
+            self.entries[key] = (stamp, time.monotonic(), body)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return body
+
+    def respond(self, endpoint: str, params: Dict[str, Any], names: Iterable[str], build: Callable[[], Any]) -> Response:
+        """JSON response from the cache, calling build() for the payload on a miss"""
+        key = self.key(endpoint, params)
+        stamp = self.stamp(names)
+        body = self.get(key, stamp)
+        if body is None:
+            body = self.put(key, stamp, build())
+        return Response(content=body, media_type="application/json")
+
+    def invalidate(self, *names: str):
+        """Bump generations after a committed write; entries built from them go stale"""
+        self.generations.bump(names)
+        logger.debug(f"Response cache invalidated: {', '.join(names)}")
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self.entries.clear()
+            self.counts.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters per endpoint, for tuning TTL and size"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, counts in sorted(self.counts.items()):
+                lookups = counts["hits"] + counts["misses"] + counts["stale"]
+                endpoints[endpoint] = dict(counts, hit_rate=round(counts["hits"] / lookups, 3) if lookups else None)
+            entries = len(self.entries)
+
+        return {
+            "enabled": self.enabled,
+            "shared": isinstance(self.generations, DatabaseGenerations),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "generations": self.generations.snapshot(),
+            "endpoints": endpoints
+        }
+
+
+# Global response cache
+response_cache = ResponseCache(
+    enabled=os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true",
+    ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    generations=DatabaseGenerations() if os.getenv("RESPONSE_CACHE_SHARED", "false").lower() == "true" else None
+)
@@ -0,0 +1,246 @@
+"""
+Single-flight coordination of scan triggers
+"""
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.database import SessionLocal, ScanJob
+from app.services.scan_events import ScanEventManager, scan_events, TERMINAL_EVENTS
+from app.services.scanner import ShapeXScanner
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCOPE = "full"
+
+# Finished runs kept so late wait() calls still get their result
+MAX_FINISHED_RUNS = 20
+
+# Config keys that change what a scan produces. Anything else in a config
+# (API keys, schedule, rollup and notification settings) is left out so a
+# scheduled scan and a manual one with the same settings are interchangeable.
+SCAN_CONFIG_KEYS = (
+    "min_feasibility_score",
+    "min_monetization_score",
+    "ideas_per_scan",
+    "max_ideas_per_channel",
+    "enable_yc_scraper",
+    "enable_a16z_scraper",
+    "enable_product_hunt",
+    "enable_google_trends",
+    "parallel_generation",
+    "enable_http_cache",
+    "enable_idea_dedupe",
+    "idea_dedupe_threshold",
+    "trends_batch_mode",
+    "trends_anchor",
+    "trends_timeframe",
+    "trends_geo",
+    "trends_cache_ttl_hours",
+    "source_timeout_seconds",
+    "trends_timeout_seconds",
+)
+
+
+def config_fingerprint(config: Dict) -> str:
+    """Hash of the scan-relevant config, equal for interchangeable scans"""
+    relevant = {k: v for k, v in (config or {}).items() if k in SCAN_CONFIG_KEYS}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class ScanRun:
+    """A scan started or queued by the coordinator"""
+
+    def __init__(self, job_id: int, scope: str, fingerprint: str, config: Dict, job_type: str, resume: bool = False):
+        self.job_id = job_id
+        self.scope = scope
+        self.fingerprint = fingerprint
+        self.config = config
+        self.job_type = job_type
+        self.resume = resume
+        self.result: Optional[Dict] = None
+        self.done = threading.Event()
+
+
+class ScanCoordinator:
+    """
+    Allows one in-flight scan per scope.
+
+    A trigger whose config matches the running scan attaches to it and gets
+    its job_id instead of starting a duplicate. A trigger with a different
+    config is queued behind it when queueing is requested (and attaches to
+    an identical queued scan), otherwise it is turned away as busy.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        scanner_factory: Callable[[Session, Dict], ShapeXScanner] = None,
+        events: ScanEventManager = None
+    ):
+        self.session_factory = session_factory
+        self.events = events or scan_events
+        self.scanner_factory = scanner_factory or (
+            lambda db, config: ShapeXScanner(db=db, config=config, events=self.events)
+        )
+
+        self.running: Dict[str, ScanRun] = {}
+        self.queued: Dict[str, List[ScanRun]] = {}
+        self.runs: Dict[int, ScanRun] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        config: Dict,
+        job_type: str = "manual",
+        scope: str = DEFAULT_SCOPE,
+        queue: bool = False,
+        resume_job_id: int = None
+    ) -> Dict:
+        """
+        Start a scan, or attach to / queue behind the scope's running scan
+        Args:
+            config: Scanner config
+            job_type: "manual", "daily", or "weekly"
+            scope: Scans in the same scope never overlap
+            queue: Queue the scan if a scan with a different config is running
+            resume_job_id: Resume this failed job instead of starting a new one
+        Returns:
+            {"status": "started" | "attached" | "queued" | "busy", "job_id": int}
+        """
+        fingerprint = f"resume:{resume_job_id}" if resume_job_id else config_fingerprint(config)
+
+        with self._lock:
+            running = self.running.get(scope)
+
+            if running and running.fingerprint == fingerprint:
+                logger.info(f"Scan trigger attached to running job {running.job_id}")
+                return {"status": "attached", "job_id": running.job_id}
+
+            if running:
+                for pending in self.queued.get(scope, []):
+                    if pending.fingerprint == fingerprint:
+                        return {"status": "attached", "job_id": pending.job_id}
+
+                if not queue:
+                    logger.info(f"Scan trigger rejected, job {running.job_id} is running in scope {scope}")
+                    return {"status": "busy", "job_id": running.job_id}
+
+            run = ScanRun(
+                job_id=resume_job_id or self._create_job(job_type, "queued" if running else "running"),
+                scope=scope,
+                fingerprint=fingerprint,
+                config=config,
+                job_type=job_type,
+                resume=resume_job_id is not None
+            )
+            self.runs[run.job_id] = run
+
+            if running:
+                self.queued.setdefault(scope, []).append(run)
+                logger.info(f"Scan job {run.job_id} queued behind job {running.job_id}")
+                return {"status": "queued", "job_id": run.job_id}
+
+            self._start(run)
+            return {"status": "started", "job_id": run.job_id}
+
+    def wait(self, job_id: int, timeout: float = None) -> Optional[Dict]:
+        """
+        Block until a coordinated scan finishes
+        Returns:
+            The scan result, or None if unknown or still running at timeout
+        """
+        run = self.runs.get(job_id)
+        if run is None or not run.done.wait(timeout):
+            return None
+        return run.result
+
+    def run_and_wait(self, config: Dict, job_type: str = "manual", scope: str = DEFAULT_SCOPE, queue: bool = True) -> Dict:
+        """Submit a scan and block until it (or the scan it attached to) finishes"""
+        submitted = self.submit(config, job_type=job_type, scope=scope, queue=queue)
+        if submitted["status"] == "busy":
+            return {"success": False, "job_id": submitted["job_id"], "error": "Another scan is running"}
+
+        return self.wait(submitted["job_id"])
+
+    def get_running(self, scope: str = DEFAULT_SCOPE) -> Optional[int]:
+        """ID of the scope's running job"""
+        with self._lock:
+            run = self.running.get(scope)
+            return run.job_id if run else None
+
+    def _create_job(self, job_type: str, status: str) -> int:
+        db = self.session_factory()
+        try:
+            return ShapeXScanner.create_job(db, job_type, status=status).id
+        finally:
+            db.close()
+
+    def _start(self, run: ScanRun):
+        """Mark the run as the scope's scan and start it (lock held)"""
+        self.running[run.scope] = run
+        threading.Thread(
+            target=self._execute,
+            args=(run,),
+            name=f"shapex-scan-{run.job_id}",
+            daemon=True
+        ).start()
+
+    def _execute(self, run: ScanRun):
+        """Run the scan, then start the scope's next queued scan"""
+        history = self.events.snapshot(run.job_id)
+        last_seq = history[-1]["seq"] if history else 0
+
+        db = self.session_factory()
+        try:
+            scanner = self.scanner_factory(db, run.config)
+            if run.resume:
+                run.result = scanner.resume_scan(run.job_id)
+            else:
+                run.result = scanner.run_full_scan(job_type=run.job_type, job_id=run.job_id)
+        except Exception as e:
+            logger.error(f"Coordinated scan {run.job_id} crashed: {e}")
+            run.result = {"success": False, "job_id": run.job_id, "error": str(e)}
+            self._mark_failed(db, run.job_id, str(e))
+        finally:
+            db.close()
+
+        # A crash or a refused resume never reaches the scanner's scan_failed
+        # event; end the job's stream so progress subscribers are released
+        ended = any(e["type"] in TERMINAL_EVENTS and e["seq"] > last_seq for e in self.events.snapshot(run.job_id))
+        if not run.result.get("success") and not ended:
+            self.events.publish(run.job_id, "scan_failed", error=run.result.get("error"))
+
+        with self._lock:
+            self.running.pop(run.scope, None)
+            pending = self.queued.get(run.scope)
+            if pending:
+                self._start(pending.pop(0))
+
+            run.done.set()
+            finished = [job_id for job_id, r in self.runs.items() if r.done.is_set()]
+            for job_id in finished[:-MAX_FINISHED_RUNS]:
+                del self.runs[job_id]
+
+    @staticmethod
+    def _mark_failed(db: Session, job_id: int, error: str):
+        """Fail a job whose scanner never got to run it"""
+        try:
+            db.rollback()
+            job = db.query(ScanJob).filter(ScanJob.id == job_id).first()
+            if job and job.status in ("queued", "running"):
+                job.status = "failed"
+                job.error_message = error
+                job.completed_at = datetime.utcnow()
+                db.commit()
+        except Exception as e:
+            logger.error(f"Could not mark scan {job_id} failed: {e}")
+
+
+# Global scan coordinator instance
+scan_coordinator = ScanCoordinator()
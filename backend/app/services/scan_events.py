@@ -0,0 +1,146 @@
+"""
+Scan progress events for live dashboards
+Fans out stage events from scan threads to WebSocket subscribers
+"""
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Events that end a scan's stream
+TERMINAL_EVENTS = {"scan_completed", "scan_failed"}
+
+
+class ScanEventManager:
+    """
+    Manages scan progress subscriptions.
+
+    Scans run in worker threads and publish events with publish(); every
+    subscriber gets them on its own event loop. Recent events are kept per
+    job so a late subscriber can be sent a snapshot first.
+    """
+
+    def __init__(self, max_jobs: int = 20, max_events_per_job: int = 200):
+        """
+        Initialize scan event manager
+
+        Args:
+            max_jobs: Number of jobs whose event history is kept
+            max_events_per_job: Events kept per job
+        """
+        self.max_jobs = max_jobs
+        self.max_events_per_job = max_events_per_job
+        self.history: "OrderedDict[int, List[dict]]" = OrderedDict()
+        self.subscribers: Dict[int, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def publish(self, job_id: int, event_type: str, **data) -> dict:
+        """
+        Record an event and deliver it to the job's subscribers.
+        Safe to call from any thread.
+
+        Args:
+            job_id: Scan job ID
+            event_type: e.g. "stage_started", "stage_finished", "scan_completed"
+            **data: Event payload
+
+        Returns:
+            The published event
+        """
+        with self._lock:
+            self._sequence += 1
+            event = {
+                "type": event_type,
+                "job_id": job_id,
+                "seq": self._sequence,
+                "timestamp": datetime.utcnow().isoformat(),
+                **data
+            }
+
+            events = self.history.setdefault(job_id, [])
+            events.append(event)
+            del events[:-self.max_events_per_job]
+            self.history.move_to_end(job_id)
+            while len(self.history) > self.max_jobs:
+                self.history.popitem(last=False)
+
+            subscribers = list(self.subscribers.get(job_id, []))
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                self.unsubscribe(job_id, queue)
+
+        return event
+
+    def subscribe(self, job_id: int) -> Tuple[asyncio.Queue, List[dict]]:
+        """
+        Subscribe the running event loop to a job's events.
+
+        Args:
+            job_id: Scan job ID
+
+        Returns:
+            (queue of future events, snapshot of events so far)
+        """
+        queue = asyncio.Queue()
+        with self._lock:
+            self.subscribers.setdefault(job_id, []).append((asyncio.get_running_loop(), queue))
+            snapshot = list(self.history.get(job_id, []))
+
+        logger.info(f"Scan events subscriber added for job {job_id}")
+        return queue, snapshot
+
+    def unsubscribe(self, job_id: int, queue: asyncio.Queue):
+        """
+        Remove a subscriber.
+
+        Args:
+            job_id: Scan job ID
+            queue: Queue returned by subscribe()
+        """
+        with self._lock:
+            remaining = [s for s in self.subscribers.get(job_id, []) if s[1] is not queue]
+            if remaining:
+                self.subscribers[job_id] = remaining
+            else:
+                self.subscribers.pop(job_id, None)
+
+    def snapshot(self, job_id: int) -> List[dict]:
+        """
+        Get events recorded so far for a job.
+
+        Args:
+            job_id: Scan job ID
+
+        Returns:
+            Events in publish order
+        """
+        with self._lock:
+            return list(self.history.get(job_id, []))
+
+    def get_subscriber_count(self, job_id: Optional[int] = None) -> int:
+        """
+        Get number of subscribers.
+
+        Args:
+            job_id: Count only this job's subscribers (all jobs if None)
+
+        Returns:
+            Number of subscribers
+        """
+        with self._lock:
+            if job_id is not None:
+                return len(self.subscribers.get(job_id, []))
+            return sum(len(s) for s in self.subscribers.values())
+
+
+# Global scan event manager instance
+scan_events = ScanEventManager()
@@ -2,16 +2,27 @@
 Core scanning service that orchestrates data collection and idea generation
 """
 import logging
+from functools import partial
 from typing import List, Dict
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from app.models.database import Idea, Trend, Source, ScanJob
+from app.models.database import Idea, IdeaSignature, ScanJob, ScanCheckpoint
+from app.scrapers.http_client import FetchEngine
+from app.scrapers.http_cache import HTTPCache
 from app.scrapers.yc_scraper import YCombinatorScraper
 from app.scrapers.a16z_scraper import A16ZScraper
 from app.scrapers.product_hunt_scraper import ProductHuntScraper
 from app.scrapers.trends_analyzer import TrendsAnalyzer
 from app.analyzers.idea_generator import IdeaGenerator
+from app.analyzers.similarity import SimilarityIndex, DEFAULT_DEDUPE_THRESHOLD, idea_text, signature, unpack_signature
+from app.services.collector import SourceCollector, DEFAULT_SOURCE_TIMEOUT_SECONDS
+from app.services.sources import upsert_sources
+from app.services.bulk_ingest import filter_ideas, idea_row, insert_ideas, store_idea_signatures, upsert_trends
+from app.services.trend_cache import TrendCache, DEFAULT_TREND_TTL_HOURS
+from app.services.scan_events import ScanEventManager, scan_events
+from app.services.response_cache import response_cache, IDEAS, TRENDS, SCANS
+from app.services.idea_stats import record_idea_changes, stats_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -19,17 +30,42 @@ logger = logging.getLogger(__name__)
 class ShapeXScanner:
     """Main scanner orchestrating all data collection and analysis"""
 
-    def __init__(self, db: Session, config: Dict = None):
+    # Keywords to track (can be expanded or made dynamic)
+    TREND_KEYWORDS = [
+        "AI automation",
+        "no-code tools",
+        "SaaS",
+        "productivity tools",
+        "remote work",
+        "API integration",
+        "developer tools",
+        "fintech",
+        "healthtech",
+        "climate tech"
+    ]
+
+    def __init__(self, db: Session, config: Dict = None, events: ScanEventManager = None):
         self.db = db
         self.config = config or {}
+        self.events = events or scan_events
 
-        # Initialize scrapers
-        self.yc_scraper = YCombinatorScraper()
-        self.a16z_scraper = A16ZScraper()
+        # Initialize scrapers on one shared fetch engine
+        self.fetch_engine = FetchEngine(
+            per_host_limit=int(self.config.get("per_host_concurrency", 4)),
+            cache=HTTPCache() if self.config.get("enable_http_cache", True) else None
+        )
+        self.yc_scraper = YCombinatorScraper(engine=self.fetch_engine)
+        self.a16z_scraper = A16ZScraper(engine=self.fetch_engine)
         self.ph_scraper = ProductHuntScraper(
-            api_key=self.config.get("product_hunt_api_key")
+            api_key=self.config.get("product_hunt_api_key"),
+            engine=self.fetch_engine
         )
         self.trends_analyzer = TrendsAnalyzer()
+        self.trend_cache = TrendCache(
+            fetch=self._analyze_trends,
+            ttl_hours=float(self.config.get("trends_cache_ttl_hours", DEFAULT_TREND_TTL_HOURS)),
+            session_factory=lambda: Session(bind=self.db.get_bind())
+        )
         self.idea_generator = IdeaGenerator(
             api_key=self.config.get("anthropic_api_key")
         )
@@ -39,57 +75,124 @@ class ShapeXScanner:
         self.min_monetization = float(self.config.get("min_monetization_score", 7.0))
         self.ideas_per_scan = int(self.config.get("ideas_per_scan", 10))
         self.max_per_channel = int(self.config.get("max_ideas_per_channel", 5))
-
-    def run_full_scan(self, job_type: str = "manual") -> Dict:
+        self.source_timeout = float(self.config.get("source_timeout_seconds", DEFAULT_SOURCE_TIMEOUT_SECONDS))
+        self.trends_timeout = float(self.config.get("trends_timeout_seconds", 120))
+        self.parallel_generation = self.config.get("parallel_generation", True)
+        self.trends_timeframe = self.config.get("trends_timeframe", "today 3-m")
+        self.trends_geo = self.config.get("trends_geo", "US")
+        self.dedupe_ideas = self.config.get("enable_idea_dedupe", True)
+        self.dedupe_threshold = float(self.config.get("idea_dedupe_threshold", DEFAULT_DEDUPE_THRESHOLD))
+
+        # Near-duplicate index of stored ideas, built on first save
+        self._similarity_index = None
+        self._similarity_loaded_id = 0
+
+    def run_full_scan(self, job_type: str = "manual", job_id: int = None) -> Dict:
         """
         Run a complete scan: collect data, analyze trends, generate ideas
         Args:
             job_type: "manual", "daily", or "weekly"
+            job_id: Run an already created "running" or "queued" ScanJob (see create_job)
         Returns:
             Scan results summary
         """
         logger.info(f"Starting {job_type} scan...")
 
-        # Create scan job
+        if job_id is not None:
+            job = self.db.query(ScanJob).filter(ScanJob.id == job_id).first()
+            if not job:
+                return {"success": False, "error": f"Scan job {job_id} not found"}
+            if job.status == "queued":
+                job.status = "running"
+                job.started_at = datetime.utcnow()
+                self.db.commit()
+        else:
+            job = self.create_job(self.db, job_type)
+
+        return self._run_stages(job)
+
+    @staticmethod
+    def create_job(db: Session, job_type: str = "manual", status: str = "running") -> ScanJob:
+        """Create a ScanJob ("running" or "queued") so callers know its ID before the scan starts"""
         job = ScanJob(
             job_type=job_type,
-            status="running",
+            status=status,
             started_at=datetime.utcnow()
         )
-        self.db.add(job)
+        db.add(job)
+        db.commit()
+        return job
+
+    def resume_scan(self, job_id: int) -> Dict:
+        """
+        Resume a failed scan from its first incomplete stage
+        Args:
+            job_id: ID of the failed ScanJob
+        Returns:
+            Scan results summary
+        """
+        job = self.db.query(ScanJob).filter(ScanJob.id == job_id).first()
+        if not job:
+            return {"success": False, "error": f"Scan job {job_id} not found"}
+        if job.status != "failed":
+            return {"success": False, "error": f"Scan job {job_id} is {job.status}, only failed scans can be resumed"}
+
+        logger.info(f"Resuming scan {job_id}...")
+        job.status = "running"
+        job.error_message = None
+        job.completed_at = None
         self.db.commit()
 
+        return self._run_stages(job)
+
+    def _run_stages(self, job: ScanJob) -> Dict:
+        """
+        Run every stage without a checkpoint for the job, checkpointing each
+        stage's output as it completes
+        """
+        checkpoints = self._load_checkpoints(job.id)
+        if checkpoints:
+            logger.info(f"Skipping checkpointed stages: {list(checkpoints)}")
+        self._emit(job, "scan_started", job_type=job.job_type, resumed_stages=list(checkpoints))
+
         try:
-            # Step 1: Collect data from sources
-            logger.info("Step 1: Collecting data from sources...")
-            vc_sources = self._collect_vc_sources()
-            product_hunt_data = self._collect_product_hunt_data()
-
-            # Step 2: Analyze trends
-            logger.info("Step 2: Analyzing market trends...")
-            trends = self._analyze_trends()
-
-            # Step 3: Generate strategic ideas
-            logger.info("Step 3: Generating strategic ideas...")
-            strategic_ideas = self.idea_generator.generate_strategic_ideas(
-                vc_sources=vc_sources,
-                trends=trends,
-                count=self.max_per_channel
+            # Step 1: Collect data from all sources concurrently
+            collected = checkpoints.get("collect")
+            if collected is None:
+                logger.info("Step 1: Collecting data from sources and market trends...")
+                self._emit(job, "stage_started", stage="collect")
+                collected = self._checkpoint(job, "collect", self._collect_sources())
+            self._emit(
+                job, "stage_finished", stage="collect",
+                checkpointed="collect" in checkpoints,
+                vc_sources=len(collected["vc_sources"]),
+                product_hunt=len(collected["product_hunt_data"]),
+                trends=len(collected["trends"]),
+                source_errors=collected["errors"]
             )
-
-            # Step 4: Generate quick-win ideas
-            logger.info("Step 4: Generating quick-win ideas...")
-            quick_win_ideas = self.idea_generator.generate_quick_win_ideas(
-                product_hunt_data=product_hunt_data,
-                trends=trends,
-                count=self.max_per_channel
+            vc_sources = collected["vc_sources"]
+            product_hunt_data = collected["product_hunt_data"]
+            trends = collected["trends"]
+
+            # Steps 2-3: Generate strategic and quick-win ideas
+            channels = self._run_generation(job, checkpoints, vc_sources, product_hunt_data, trends)
+
+            # Step 4: Filter and save ideas
+            saved = checkpoints.get("save")
+            if saved is None:
+                logger.info("Step 4: Filtering and saving ideas...")
+                self._emit(job, "stage_started", stage="save")
+                all_ideas = channels["strategic"]["ideas"] + channels["quick-win"]["ideas"]
+                saved_ideas = self._save_ideas(all_ideas)
+                self._checkpoint(job, "save", {"idea_ids": [idea.id for idea in saved_ideas]})
+            else:
+                saved_ideas = self.db.query(Idea).filter(Idea.id.in_(saved["idea_ids"])).all()
+            self._emit(
+                job, "stage_finished", stage="save",
+                checkpointed=saved is not None,
+                ideas_saved=len(saved_ideas)
             )
 
-            # Step 5: Filter and save ideas
-            logger.info("Step 5: Filtering and saving ideas...")
-            all_ideas = strategic_ideas + quick_win_ideas
-            saved_ideas = self._save_ideas(all_ideas)
-
             # Update job status
             job.status = "completed"
             job.ideas_generated = len(saved_ideas)
@@ -98,8 +201,16 @@ class ShapeXScanner:
             job.completed_at = datetime.utcnow()
             job.duration_seconds = (job.completed_at - job.started_at).total_seconds()
             self.db.commit()
+            response_cache.invalidate(SCANS)
 
             logger.info(f"✓ Scan completed: {len(saved_ideas)} ideas generated")
+            self._emit(
+                job, "scan_completed",
+                ideas_generated=job.ideas_generated,
+                sources_scraped=job.sources_scraped,
+                trends_analyzed=job.trends_analyzed,
+                duration_seconds=job.duration_seconds
+            )
 
             return {
                 "success": True,
@@ -108,6 +219,10 @@ class ShapeXScanner:
                 "sources_scraped": job.sources_scraped,
                 "trends_analyzed": job.trends_analyzed,
                 "duration_seconds": job.duration_seconds,
+                "source_errors": collected["errors"],
+                "source_changes": collected["source_changes"],
+                "channel_metrics": job.channel_metrics,
+                "resumed_stages": list(checkpoints),
                 "top_ideas": [
                     {
                         "id": idea.id,
@@ -121,159 +236,376 @@ class ShapeXScanner:
 
         except Exception as e:
             logger.error(f"Scan failed: {e}")
+            self.db.rollback()
             job.status = "failed"
             job.error_message = str(e)
             job.completed_at = datetime.utcnow()
             self.db.commit()
 
+            completed_stages = list(self._load_checkpoints(job.id))
+            self._emit(job, "scan_failed", error=str(e), completed_stages=completed_stages)
+
             return {
                 "success": False,
-                "error": str(e)
+                "job_id": job.id,
+                "error": str(e),
+                "completed_stages": completed_stages
             }
 
-    def _collect_vc_sources(self) -> List[Dict]:
-        """Collect data from YC and A16Z"""
-        sources = []
-
-        # YC data
-        if self.config.get("enable_yc_scraper", True):
-            try:
-                yc_sources = self.yc_scraper.get_all_sources()
-                sources.extend(yc_sources)
-                logger.info(f"✓ Collected {len(yc_sources)} YC sources")
-            except Exception as e:
-                logger.error(f"YC scraper failed: {e}")
-
-        # A16Z data
-        if self.config.get("enable_a16z_scraper", True):
-            try:
-                a16z_sources = self.a16z_scraper.get_all_sources()
-                sources.extend(a16z_sources)
-                logger.info(f"✓ Collected {len(a16z_sources)} A16Z sources")
-            except Exception as e:
-                logger.error(f"A16Z scraper failed: {e}")
-
-        # Save to database
-        for source_data in sources:
-            source = Source(
-                source_type=source_data.get("source_type"),
-                title=source_data.get("title"),
-                url=source_data.get("url"),
-                content=source_data.get("description"),
-                scraped_at=datetime.utcnow()
+    def _run_generation(
+        self,
+        job: ScanJob,
+        checkpoints: Dict[str, Dict],
+        vc_sources: List[Dict],
+        product_hunt_data: List[Dict],
+        trends: List[Dict]
+    ) -> Dict[str, Dict]:
+        """
+        Generate ideas for channels without a checkpoint.
+        Only successful channels are checkpointed. A failed channel (API error
+        or unparseable response) contributes no ideas and is recorded in
+        channel_metrics; the scan fails only if no channel succeeded, so a
+        resume repeats just the failed channels.
+        """
+        channels = {
+            channel: checkpoints[f"generate:{channel}"]
+            for channel in IdeaGenerator.CHANNELS
+            if f"generate:{channel}" in checkpoints
+        }
+        pending = [channel for channel in IdeaGenerator.CHANNELS if channel not in channels]
+
+        for channel, output in channels.items():
+            self._emit(
+                job, "stage_finished", stage=f"generate:{channel}",
+                checkpointed=True, ideas=len(output["ideas"])
             )
-            self.db.add(source)
 
+        failed = {}
+        if pending:
+            for channel in pending:
+                self._emit(job, "stage_started", stage=f"generate:{channel}")
+
+            generated = self._generate_ideas(pending, vc_sources, product_hunt_data, trends)
+            for channel, output in generated.items():
+                if "error" in output["metrics"]:
+                    failed[channel] = output["metrics"]["error"]
+                    self._emit(job, "stage_failed", stage=f"generate:{channel}", error=failed[channel])
+                else:
+                    channels[channel] = self._checkpoint(job, f"generate:{channel}", output)
+                    self._emit(
+                        job, "stage_finished", stage=f"generate:{channel}",
+                        checkpointed=False, ideas=len(output["ideas"]), metrics=output["metrics"]
+                    )
+
+            job.channel_metrics = {
+                **{channel: output["metrics"] for channel, output in channels.items()},
+                **{channel: generated[channel]["metrics"] for channel in failed}
+            }
+        else:
+            job.channel_metrics = {channel: output["metrics"] for channel, output in channels.items()}
         self.db.commit()
-        return sources
 
-    def _collect_product_hunt_data(self) -> List[Dict]:
-        """Collect trending products from Product Hunt"""
-        if not self.config.get("enable_product_hunt", True):
-            return []
+        if failed and not channels:
+            raise RuntimeError(
+                "Idea generation failed for " +
+                ", ".join(f"{channel} ({error})" for channel, error in failed.items())
+            )
+
+        for channel, error in failed.items():
+            logger.warning(f"Continuing without {channel} ideas: {error}")
+            channels[channel] = {"ideas": [], "metrics": job.channel_metrics[channel]}
+
+        return channels
+
+    def _generate_ideas(
+        self,
+        channels: List[str],
+        vc_sources: List[Dict],
+        product_hunt_data: List[Dict],
+        trends: List[Dict]
+    ) -> Dict[str, Dict]:
+        """
+        Generate ideas for the given channels, in parallel unless disabled
+        Returns:
+            Channel name -> {"ideas": [...], "metrics": {...}}
+        """
+        if not self.parallel_generation:
+            results = {}
+            if "strategic" in channels:
+                logger.info("Step 2: Generating strategic ideas...")
+                ideas = self.idea_generator.generate_strategic_ideas(
+                    vc_sources=vc_sources,
+                    trends=trends,
+                    count=self.max_per_channel
+                )
+                results["strategic"] = {"ideas": ideas, "metrics": self.idea_generator.channel_metrics["strategic"]}
+
+            if "quick-win" in channels:
+                logger.info("Step 3: Generating quick-win ideas...")
+                ideas = self.idea_generator.generate_quick_win_ideas(
+                    product_hunt_data=product_hunt_data,
+                    trends=trends,
+                    count=self.max_per_channel
+                )
+                results["quick-win"] = {"ideas": ideas, "metrics": self.idea_generator.channel_metrics["quick-win"]}
+            return results
+
+        logger.info(f"Steps 2-3: Generating {', '.join(channels)} ideas in parallel...")
+        prompts = {}
+        if "strategic" in channels:
+            prompts["strategic"] = self.idea_generator.build_strategic_prompt(vc_sources, trends, self.max_per_channel)
+        if "quick-win" in channels:
+            prompts["quick-win"] = self.idea_generator.build_quick_win_prompt(product_hunt_data, trends, self.max_per_channel)
 
+        return self.idea_generator.generate_channels(prompts, count=self.max_per_channel)
+
+    def _emit(self, job: ScanJob, event_type: str, **data):
+        """Publish a progress event for the job (never fails the scan)"""
         try:
-            products = self.ph_scraper.get_trending_products(limit=20)
-            logger.info(f"✓ Collected {len(products)} Product Hunt products")
-            return products
+            self.events.publish(job.id, event_type, **data)
         except Exception as e:
-            logger.error(f"Product Hunt scraper failed: {e}")
-            return []
+            logger.warning(f"Could not publish {event_type} for scan {job.id}: {e}")
 
-    def _analyze_trends(self) -> List[Dict]:
-        """Analyze market trends using Google Trends"""
-        if not self.config.get("enable_google_trends", True):
-            return []
+    def _load_checkpoints(self, job_id: int) -> Dict[str, Dict]:
+        """Stage name -> output for a job's completed stages"""
+        rows = self.db.query(ScanCheckpoint).filter(ScanCheckpoint.job_id == job_id).all()
+        return {row.stage: row.output for row in rows}
 
-        trends = []
+    def _checkpoint(self, job: ScanJob, stage: str, output: Dict) -> Dict:
+        """Persist a completed stage's output and return it"""
+        self.db.add(ScanCheckpoint(job_id=job.id, stage=stage, output=output))
+        self.db.commit()
+        logger.info(f"✓ Checkpointed stage {stage} for scan {job.id}")
+        return output
 
-        try:
-            # Keywords to track (can be expanded or made dynamic)
-            keywords = [
-                "AI automation",
-                "no-code tools",
-                "SaaS",
-                "productivity tools",
-                "remote work",
-                "API integration",
-                "developer tools",
-                "fintech",
-                "healthtech",
-                "climate tech"
-            ]
-
-            # Analyze trends
-            trend_results = self.trends_analyzer.batch_analyze(keywords, delay=2.0)
-
-            for trend_data in trend_results:
-                if "error" in trend_data:
-                    continue
-
-                # Save to database
-                trend = Trend(
-                    keyword=trend_data["keyword"],
-                    source="google_trends",
-                    growth_rate=trend_data.get("growth_rate", 0),
-                    momentum_score=trend_data.get("momentum_score", 0),
-                    related_keywords=trend_data.get("related_keywords", []),
-                    time_series_data=trend_data.get("time_series", []),
-                    detected_at=datetime.utcnow()
-                )
-                self.db.add(trend)
-                trends.append(trend_data)
+    def _collect_sources(self) -> Dict:
+        """
+        Fan out every enabled scraper at once and persist what came back.
+        Failed or timed-out sources contribute empty results.
+        """
+        collector = SourceCollector(default_timeout=self.source_timeout)
 
-            self.db.commit()
-            logger.info(f"✓ Analyzed {len(trends)} trends")
+        if self.config.get("enable_yc_scraper", True):
+            collector.add("yc_rfs", self.yc_scraper.scrape_rfs)
+            collector.add("yc_blog", self.yc_scraper.scrape_ycombinator_blog)
 
-        except Exception as e:
-            logger.error(f"Trends analysis failed: {e}")
+        if self.config.get("enable_a16z_scraper", True):
+            collector.add("a16z_blog", self.a16z_scraper.scrape_blog)
+            collector.add("a16z_focus", self.a16z_scraper.scrape_focus_areas)
+
+        if self.config.get("enable_product_hunt", True):
+            collector.add("product_hunt", partial(self.ph_scraper.get_trending_products, limit=20))
+
+        if self.config.get("enable_google_trends", True):
+            collector.add("google_trends", self._fetch_trends, timeout=self.trends_timeout)
+
+        outcome = self.fetch_engine.run(collector.collect_async())
+        results = outcome["results"]
+
+        if outcome["errors"]:
+            logger.warning(f"Partial collection, failed sources: {outcome['errors']}")
+
+        # VC sources (YC + A16Z)
+        vc_sources = results.get("yc_rfs", []) + results.get("yc_blog", [])
+        a16z_sources = results.get("a16z_blog", []) + results.get("a16z_focus", [])
+        if self.config.get("enable_a16z_scraper", True) and not a16z_sources:
+            logger.warning("A16Z scraping failed, using fallback a16z focus areas")
+            a16z_sources = self.a16z_scraper._get_fallback_focus_areas()
+        vc_sources.extend(a16z_sources)
+        source_changes = self._save_sources(vc_sources)
+
+        trends = self._save_trends(results.get("google_trends", []))
+
+        return {
+            "vc_sources": vc_sources,
+            "product_hunt_data": results.get("product_hunt", []),
+            "trends": trends,
+            "source_changes": source_changes,
+            "errors": outcome["errors"],
+            "durations": outcome["durations"]
+        }
+
+    def _save_sources(self, sources: List[Dict]) -> Dict[str, int]:
+        """Upsert collected VC sources, flagging only new or changed ones for processing"""
+        stats = upsert_sources(self.db, sources)
+        logger.info(f"✓ Collected {len(sources)} VC sources")
+        return stats
+
+    def _fetch_trends(self) -> List[Dict]:
+        """Get trends for the tracked keywords through the cache (runs off the scan thread)"""
+        return self.trend_cache.get(self.TREND_KEYWORDS, self.trends_timeframe, self.trends_geo)
+
+    def _analyze_trends(self, keywords: List[str], timeframe: str, geo: str) -> List[Dict]:
+        """Query Google Trends for keywords missing from or stale in the cache"""
+        if self.config.get("trends_batch_mode", True):
+            return self.trends_analyzer.batch_analyze_grouped(
+                keywords,
+                anchor=self.config.get("trends_anchor"),
+                timeframe=timeframe,
+                geo=geo,
+                delay=2.0
+            )
+        return self.trends_analyzer.batch_analyze(keywords, delay=2.0, timeframe=timeframe, geo=geo)
 
+    def _save_trends(self, trend_results: List[Dict]) -> List[Dict]:
+        """Keep usable trends; the trend cache has already persisted them"""
+        trends = [trend_data for trend_data in trend_results if "error" not in trend_data]
+        logger.info(f"✓ Analyzed {len(trends)} trends")
         return trends
 
-    def _save_ideas(self, ideas: List[Dict]) -> List[Idea]:
-        """Filter and save generated ideas to database"""
-        saved_ideas = []
-
+    def _filter_ideas(self, ideas: List[Dict]) -> List[Dict]:
+        """Ideas that clear this scanner's feasibility and monetization thresholds"""
         logger.info(f"Filtering {len(ideas)} generated ideas (min_feasibility={self.min_feasibility}, min_monetization={self.min_monetization})")
+        return filter_ideas(ideas, self.min_feasibility, self.min_monetization)
 
-        for idea_data in ideas:
-            # Apply filters
-            if idea_data["feasibility_score"] < self.min_feasibility:
-                logger.info(f"Filtered out (low feasibility {idea_data['feasibility_score']}): {idea_data['title']}")
-                continue
+    def _load_similarity_index(self) -> SimilarityIndex:
+        """
+        Similarity index of stored ideas, topped up with ideas saved since the
+        last call. Signatures are read from idea_signatures; only ideas stored
+        without one (before signatures were kept) are hashed, and theirs saved.
+        """
+        if self._similarity_index is None:
+            self._similarity_index = SimilarityIndex(self.dedupe_threshold)
+
+        unsigned = self.db.query(Idea.id, Idea.title, Idea.description).outerjoin(
+            IdeaSignature, IdeaSignature.idea_id == Idea.id
+        ).filter(Idea.id > self._similarity_loaded_id, IdeaSignature.idea_id.is_(None))
+        backfill = {idea_id: signature(idea_text(title, description)) for idea_id, title, description in unsigned}
+        if backfill:
+            store_idea_signatures(self.db, backfill)
+            self.db.commit()
+            logger.info(f"✓ Stored near-duplicate signatures for {len(backfill)} ideas")
+
+        rows = self.db.query(IdeaSignature.idea_id, IdeaSignature.minhash).join(
+            Idea, Idea.id == IdeaSignature.idea_id
+        ).filter(IdeaSignature.idea_id > self._similarity_loaded_id).order_by(IdeaSignature.idea_id)
+        for idea_id, minhash in rows:
+            self._similarity_index.add(idea_id, unpack_signature(minhash))
+            self._similarity_loaded_id = idea_id
 
-            if idea_data["monetization_score"] < self.min_monetization:
-                logger.info(f"Filtered out (low monetization {idea_data['monetization_score']}): {idea_data['title']}")
+        return self._similarity_index
+
+    def _dedupe_ideas(self, ideas: List[Dict]) -> List[Dict]:
+        """
+        Drop ideas that are near-duplicates of stored ideas or of each other.
+        A duplicate that outscores the stored idea refreshes it in place
+        (status, favorite and notes are kept).
+        Returns:
+            Ideas to insert, in input order
+        """
+        index = self._load_similarity_index()
+        batch = SimilarityIndex(self.dedupe_threshold)
+        kept = []
+        skipped = merged = 0
+        now = datetime.utcnow()
+
+        # Best score first, so the strongest of a set of paraphrases survives
+        for position in sorted(range(len(ideas)), key=lambda i: ideas[i]["overall_score"], reverse=True):
+            idea_data = ideas[position]
+            sig = signature(idea_text(idea_data["title"], idea_data["description"]))
+
+            if batch.query(sig) is not None:
+                skipped += 1
+                continue
+            batch.add(position, sig)
+
+            existing = None
+            match = index.query(sig)
+            while match is not None:
+                existing = self.db.get(Idea, match[0])
+                if existing is not None:
+                    break
+                index.remove(match[0])  # Deleted since it was indexed
+                match = index.query(sig)
+
+            if existing is None:
+                kept.append(position)
                 continue
 
-            # Create Idea object
-            idea = Idea(
-                title=idea_data["title"],
-                description=idea_data["description"],
-                category=idea_data["category"],
-                channel=idea_data["channel"],
-                feasibility_score=idea_data["feasibility_score"],
-                market_demand_score=idea_data["market_demand_score"],
-                monetization_score=idea_data["monetization_score"],
-                competition_score=idea_data["competition_score"],
-                risk_score=idea_data["risk_score"],
-                overall_score=idea_data["overall_score"],
-                target_market=idea_data["target_market"],
-                revenue_model=idea_data["revenue_model"],
-                estimated_time_to_build=idea_data["estimated_time_to_build"],
-                estimated_startup_cost=idea_data["estimated_startup_cost"],
-                key_features=idea_data["key_features"],
-                competitors=idea_data["competitors"],
-                differentiation=idea_data["differentiation"],
-                ai_reasoning=idea_data["ai_reasoning"],
-                status="new",
-                created_at=datetime.utcnow()
-            )
+            if idea_data["overall_score"] > (existing.overall_score or 0):
+                row = idea_row(idea_data, now)
+                for column in ("status", "created_at"):
+                    row.pop(column)
+                before = stats_snapshot(existing)
+                for column, value in row.items():
+                    setattr(existing, column, value)
+                record_idea_changes(self.db, added=[existing], removed=[before])
+                if idea_data.get("ai_reasoning") is not None:
+                    existing.ai_reasoning = idea_data["ai_reasoning"]
+                store_idea_signatures(self.db, {existing.id: sig})
+                index.add(existing.id, sig)
+                merged += 1
+                logger.info(f"Merged near-duplicate ({match[1]:.2f}) into idea {existing.id}: {idea_data['title']}")
+            else:
+                skipped += 1
+                logger.info(f"Skipped near-duplicate ({match[1]:.2f}) of idea {existing.id}: {idea_data['title']}")
+
+        if skipped or merged:
+            logger.info(f"✓ Dedupe: {skipped} near-duplicates skipped, {merged} merged into existing ideas")
+        return [ideas[position] for position in sorted(kept)]
+
+    def _save_ideas(self, ideas: List[Dict]) -> List[Idea]:
+        """Filter, dedupe and save generated ideas to database"""
+        ideas = self._filter_ideas(ideas)
+        if self.dedupe_ideas:
+            ideas = self._dedupe_ideas(ideas)
+
+        idea_ids = insert_ideas(self.db, ideas)
+        self.db.commit()
+        # Dedupe merges may have updated stored ideas even when none were inserted
+        response_cache.invalidate(IDEAS)
+        logger.info(f"✓ Saved {len(idea_ids)} ideas to database")
 
-            self.db.add(idea)
-            saved_ideas.append(idea)
+        if not idea_ids:
+            return []
+        by_id = {idea.id: idea for idea in self.db.query(Idea).filter(Idea.id.in_(idea_ids))}
+        return [by_id[idea_id] for idea_id in idea_ids]
+
+    # ===== BULK INGEST (backfills and imports) =====
 
+    def bulk_ingest_ideas(self, ideas: List[Dict], apply_filters: bool = True, dedupe: bool = True) -> List[int]:
+        """
+        Insert many ideas with multi-row INSERT ... RETURNING.
+        Args:
+            ideas: Idea dicts in the IdeaGenerator format
+            apply_filters: Apply the same thresholds as a scan
+            dedupe: Skip or merge near-duplicates like a scan
+        Returns:
+            Ids of the inserted ideas, in input order
+        """
+        if apply_filters:
+            ideas = self._filter_ideas(ideas)
+        if dedupe and self.dedupe_ideas:
+            ideas = self._dedupe_ideas(ideas)
+
+        idea_ids = insert_ideas(self.db, ideas)
+        self.db.commit()
+        response_cache.invalidate(IDEAS)
+        logger.info(f"✓ Bulk ingested {len(idea_ids)} ideas")
+        return idea_ids
+
+    def bulk_ingest_trends(self, trend_results: List[Dict], timeframe: str = None, geo: str = None) -> List[int]:
+        """
+        Store many trend analyses on their canonical rows (errors and fallback
+        estimates are skipped).
+        Args:
+            trend_results: Results in the TrendsAnalyzer format
+            timeframe: Query timeframe (defaults to the scanner's)
+            geo: Query region (defaults to the scanner's)
+        Returns:
+            Ids of the stored trends, one per keyword
+        """
+        trend_ids = upsert_trends(
+            self.db,
+            trend_results,
+            timeframe or self.trends_timeframe,
+            geo or self.trends_geo
+        )
         self.db.commit()
-        logger.info(f"✓ Saved {len(saved_ideas)} ideas to database")
+        response_cache.invalidate(TRENDS)
+        logger.info(f"✓ Bulk ingested {len(trend_ids)} trends")
+        return trend_ids
 
-        return saved_ideas
+    def bulk_ingest_sources(self, sources: List[Dict]) -> Dict[str, int]:
+        """Upsert many VC sources (executemany inserts and updates)"""
+        return self._save_sources(sources)
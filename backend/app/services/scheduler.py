@@ -3,12 +3,14 @@ Scheduled task manager for ShapeX
 """
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import logging
 import os
 
 from app.models.database import SessionLocal
-from app.services.scanner import ShapeXScanner
+from app.services.scan_coordinator import ScanCoordinator, scan_coordinator
+from app.services.usage_rollup import rollup_api_usage
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +18,27 @@ logger = logging.getLogger(__name__)
 class ShapeXScheduler:
     """Manages scheduled scans and reports"""
 
-    def __init__(self, config: dict = None):
+    def __init__(self, config: dict = None, coordinator: ScanCoordinator = None):
         self.config = config or {}
+        self.coordinator = coordinator or scan_coordinator
         self.scheduler = BackgroundScheduler()
         self.enabled = self.config.get("enable_scheduled_scans", True)
 
     def start(self):
         """Start the scheduler"""
+        # API usage rollup runs whether or not scans are scheduled
+        rollup_minutes = self.config.get("usage_rollup_interval_minutes", 15)
+        self.scheduler.add_job(
+            self._run_usage_rollup,
+            IntervalTrigger(minutes=rollup_minutes),
+            id="usage_rollup",
+            name="API Usage Rollup",
+            replace_existing=True
+        )
+
         if not self.enabled:
             logger.info("Scheduled scans are disabled")
+            self.scheduler.start()
             return
 
         # Daily scan (default: 9 AM)
@@ -69,11 +83,10 @@ class ShapeXScheduler:
     def _run_daily_scan(self):
         """Execute daily scan"""
         logger.info("Running scheduled daily scan...")
-        db = SessionLocal()
 
         try:
-            scanner = ShapeXScanner(db=db, config=self.config)
-            result = scanner.run_full_scan(job_type="daily")
+            # Attaches to a manual scan already in flight instead of duplicating it
+            result = self.coordinator.run_and_wait(self.config, job_type="daily")
 
             if result["success"]:
                 logger.info(f"✓ Daily scan completed: {result['ideas_generated']} ideas generated")
@@ -86,18 +99,25 @@ class ShapeXScheduler:
 
         except Exception as e:
             logger.error(f"Error in daily scan: {e}")
+
+    def _run_usage_rollup(self):
+        """Fold raw API usage into daily aggregates and purge old raw rows"""
+        db = SessionLocal()
+        try:
+            rollup_api_usage(db, retention_days=self.config.get("usage_retention_days"))
+        except Exception as e:
+            logger.error(f"API usage rollup failed: {e}")
+            db.rollback()
         finally:
             db.close()
 
     def _run_weekly_report(self):
         """Generate and send weekly report"""
         logger.info("Generating weekly report...")
-        db = SessionLocal()
 
         try:
-            # Run a full scan
-            scanner = ShapeXScanner(db=db, config=self.config)
-            result = scanner.run_full_scan(job_type="weekly")
+            # Run a full scan (or wait for the one in flight)
+            result = self.coordinator.run_and_wait(self.config, job_type="weekly")
 
             if result["success"]:
                 logger.info(f"✓ Weekly report generated: {result['ideas_generated']} ideas")
@@ -110,8 +130,6 @@ class ShapeXScheduler:
 
         except Exception as e:
             logger.error(f"Error in weekly report: {e}")
-        finally:
-            db.close()
 
     def _send_telegram_notification(self, scan_result: dict, scan_type: str):
         """Send Telegram notification about scan results"""
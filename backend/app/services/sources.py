@@ -0,0 +1,142 @@
+"""
+Source ingestion: URL normalization and content-hash upserts
+"""
+import hashlib
+import logging
+import re
+from datetime import datetime
+from typing import Dict, List
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from sqlalchemy.orm import Session
+
+from app.models.database import Source
+from app.services.bulk_ingest import bulk_insert, bulk_update
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change the page content
+VOLATILE_PARAMS = {"ts", "ref", "source", "fbclid", "gclid", "mc_cid", "mc_eid"}
+
+# Pages that yield several items under the same URL (one per heading)
+MULTI_ITEM_SOURCE_TYPES = {"yc_rfs", "a16z_focus"}
+
+# Keep IN (...) lists under SQLite's bound parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL: lowercase scheme and host, no default port,
+    fragment, tracking or cache-busting parameters, sorted query and no
+    trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80) and not (scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in VOLATILE_PARAMS and not key.lower().startswith("utm_")
+    )
+
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def slugify(text: str) -> str:
+    """Lowercase hyphenated slug"""
+    return re.sub(r"[^a-z0-9]+", "-", (text or "").lower()).strip("-")[:120]
+
+
+def source_key(item: Dict) -> str:
+    """
+    Identity of a scraped item, stored in Source.url.
+    Items sharing one page (RFS sections, focus areas) or without a URL are
+    told apart by a title slug fragment.
+    """
+    source_type = item.get("source_type") or "unknown"
+    url = item.get("url")
+    base = normalize_url(url) if url else f"{source_type}:"
+
+    if not url or source_type in MULTI_ITEM_SOURCE_TYPES:
+        return f"{base}#{slugify(item.get('title'))}"
+    return base
+
+
+def content_hash(title: str, content: str) -> str:
+    """Hash of the fields that make a source worth re-processing"""
+    normalized = f"{(title or '').strip()}\n{(content or '').strip()}"
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def upsert_sources(db: Session, items: List[Dict]) -> Dict[str, int]:
+    """
+    Insert new sources, update changed ones and touch unchanged ones.
+    Only new or changed sources are flagged is_processed=False.
+
+    Returns:
+        Counts of inserted, updated and unchanged sources
+    """
+    now = datetime.utcnow()
+
+    # Last occurrence wins for duplicates within a batch
+    by_key = {source_key(item): item for item in items}
+    keys = list(by_key)
+
+    existing = {}
+    for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+        for source_id, url, digest in db.query(Source.id, Source.url, Source.content_hash).filter(Source.url.in_(chunk)):
+            existing[url] = (source_id, digest)
+
+    inserts = []
+    changed = []
+    touched = []
+
+    for key, item in by_key.items():
+        title = item.get("title")
+        content = item.get("description")
+        digest = content_hash(title, content)
+
+        if key not in existing:
+            inserts.append({
+                "source_type": item.get("source_type"),
+                "title": title,
+                "url": key,
+                "content": content,
+                "content_hash": digest,
+                "scraped_at": now,
+                "last_analyzed": now,
+                "is_processed": False
+            })
+            continue
+
+        source_id, stored_digest = existing[key]
+        if stored_digest != digest:
+            changed.append({
+                "id": source_id,
+                "source_type": item.get("source_type"),
+                "title": title,
+                "content": content,
+                "content_hash": digest,
+                "scraped_at": now,
+                "last_analyzed": now,
+                "is_processed": False
+            })
+        else:
+            touched.append({"id": source_id, "last_analyzed": now})
+
+    bulk_insert(db, Source, inserts)
+    bulk_update(db, Source, changed)
+    bulk_update(db, Source, touched)
+    stats = {"inserted": len(inserts), "updated": len(changed), "unchanged": len(touched)}
+
+    db.commit()
+    logger.info(
+        f"✓ Sources upserted: {stats['inserted']} new, "
+        f"{stats['updated']} changed, {stats['unchanged']} unchanged"
+    )
+    return stats
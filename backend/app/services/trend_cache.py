@@ -0,0 +1,182 @@
+"""
+Read-through TTL cache for trend analyses, backed by the Trend table
+"""
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.database import SessionLocal, Trend
+from app.models.series import trim_series
+from app.services.bulk_ingest import canonical_trends_query, is_storable_trend, upsert_trends
+from app.services.response_cache import response_cache, TRENDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TREND_TTL_HOURS = 24.0
+
+TREND_SOURCE = "google_trends"
+
+
+class TrendCache:
+    """
+    Serves trend analyses from the canonical Trend row of each
+    (keyword, source, geo).
+
+    Fresh keywords are served from the database without touching Google
+    Trends. Stale keywords are served from their row while a background
+    thread refreshes them. Keywords never analyzed, or last analyzed over a
+    different timeframe, are fetched synchronously. Refreshes update the row
+    in place and merge the new points into its time series.
+    """
+
+    # Keys being refreshed, shared by every cache so concurrent scans don't
+    # refresh the same keyword twice
+    _refreshing = set()
+    _refreshing_lock = threading.Lock()
+
+    # pytrends sessions are not thread-safe
+    _fetch_lock = threading.Lock()
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str], str, str], List[Dict]],
+        ttl_hours: float = DEFAULT_TREND_TTL_HOURS,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        """
+        Args:
+            fetch: fetch(keywords, timeframe, geo) returning one analysis per keyword
+            ttl_hours: Age after which a cached analysis is refreshed
+            session_factory: Creates the sessions used for reads and writes
+        """
+        self.fetch = fetch
+        self.ttl = timedelta(hours=ttl_hours)
+        self.session_factory = session_factory
+
+    def get(self, keywords: List[str], timeframe: str = "today 3-m", geo: str = "US") -> List[Dict]:
+        """
+        Get analyses for keywords, in input order.
+
+        Returns:
+            Trend analyses; cached ones carry "cached": True and "stale" when a
+            background refresh was scheduled
+        """
+        db = self.session_factory()
+        try:
+            rows = self._load(db, keywords, geo)
+            cutoff = datetime.utcnow() - self.ttl
+
+            # The row holds the latest analysis, which may be for another timeframe
+            rows = {k: row for k, row in rows.items() if row.timeframe == timeframe}
+            missing = [k for k in keywords if k not in rows]
+            stale = [k for k in keywords if k in rows and rows[k].last_updated < cutoff]
+
+            results = {
+                keyword: self._to_result(row, timeframe, stale=keyword in stale)
+                for keyword, row in rows.items()
+            }
+
+            if missing:
+                logger.info(f"Trend cache miss for {missing}, fetching now")
+                for result in self._fetch(missing, timeframe, geo):
+                    results[result["keyword"]] = result
+                self._store(db, results, missing, timeframe, geo)
+        finally:
+            db.close()
+
+        if stale:
+            self.refresh_in_background(stale, timeframe, geo)
+
+        logger.info(
+            f"✓ Trend cache: {len(keywords) - len(missing) - len(stale)} fresh, "
+            f"{len(stale)} stale, {len(missing)} fetched"
+        )
+        return [results[k] for k in keywords if k in results]
+
+    def refresh_in_background(self, keywords: List[str], timeframe: str, geo: str) -> Optional[threading.Thread]:
+        """Refresh keywords on a daemon thread, skipping keys already in flight"""
+        with self._refreshing_lock:
+            claimed = [k for k in keywords if (k, timeframe, geo) not in self._refreshing]
+            self._refreshing.update((k, timeframe, geo) for k in claimed)
+
+        if not claimed:
+            return None
+
+        thread = threading.Thread(
+            target=self._refresh,
+            args=(claimed, timeframe, geo),
+            name="shapex-trend-refresh",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _refresh(self, keywords: List[str], timeframe: str, geo: str):
+        """Fetch and store keywords with a dedicated session"""
+        db = self.session_factory()
+        try:
+            logger.info(f"Refreshing stale trends in background: {keywords}")
+            results = {r["keyword"]: r for r in self._fetch(keywords, timeframe, geo)}
+            self._store(db, results, keywords, timeframe, geo)
+        except Exception as e:
+            logger.error(f"Background trend refresh failed: {e}")
+        finally:
+            db.close()
+            with self._refreshing_lock:
+                self._refreshing.difference_update((k, timeframe, geo) for k in keywords)
+
+    def _fetch(self, keywords: List[str], timeframe: str, geo: str) -> List[Dict]:
+        with self._fetch_lock:
+            return self.fetch(keywords, timeframe, geo)
+
+    @staticmethod
+    def lookup_query(db: Session, keywords: List[str], geo: str):
+        """Canonical rows for the keywords, newest first (ix_trends_keyword_source_geo)"""
+        return canonical_trends_query(db, keywords, TREND_SOURCE, geo)
+
+    def _load(self, db: Session, keywords: List[str], geo: str) -> Dict[str, Trend]:
+        """Canonical row per keyword"""
+        rows = {}
+        # Served results include the series, so load them in one extra query
+        for row in self.lookup_query(db, keywords, geo).options(selectinload(Trend.series)):
+            rows.setdefault(row.keyword, row)
+        return rows
+
+    def _store(self, db: Session, results: Dict[str, Dict], keywords: List[str], timeframe: str, geo: str):
+        """
+        Upsert real analyses for keywords. Failures and fallback estimates are
+        not cached so the next request tries Google Trends again.
+        """
+        stored = upsert_trends(
+            db,
+            [{**results[keyword], "keyword": keyword} for keyword in keywords if is_storable_trend(results.get(keyword))],
+            timeframe,
+            geo,
+            source=TREND_SOURCE
+        )
+
+        db.commit()
+        if stored:
+            response_cache.invalidate(TRENDS)
+        logger.info(f"✓ Cached {len(stored)} trend analyses ({timeframe}, {geo})")
+
+    @staticmethod
+    def _to_result(row: Trend, timeframe: str, stale: bool = False) -> Dict:
+        """
+        Trend row in the TrendsAnalyzer result format. The row's merged series
+        may reach back past the timeframe, so only the points in the window
+        (as of the row's last update) are returned.
+        """
+        return {
+            "keyword": row.keyword,
+            "growth_rate": row.growth_rate,
+            "momentum_score": row.momentum_score,
+            "related_keywords": row.related_keywords or [],
+            "time_series": trim_series(row.time_series_data, timeframe, row.last_updated) or [],
+            "analyzed_at": row.last_updated.isoformat(),
+            "cached": True,
+            "stale": stale
+        }
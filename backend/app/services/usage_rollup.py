@@ -0,0 +1,156 @@
+"""
+API usage rollup and retention
+
+Folds raw api_usage rows into api_usage_daily aggregates (per day, user,
+key, endpoint and method, with latency percentiles) and purges raw rows
+older than the retention window once they are rolled up.
+
+A watermark (highest rolled-up api_usage.id) splits the data: rows at or
+below it are counted through the aggregates, rows above it are the raw
+tail that rate limiting still counts directly. Groups touched by new rows
+are recomputed from their raw rows, so percentiles stay exact.
+"""
+import logging
+import math
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.models.database import APIUsage, APIUsageDaily, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+USAGE_ROLLUP_NAME = "api_usage_daily"
+
+DEFAULT_USAGE_RETENTION_DAYS = 30
+
+# A day's raw rows must survive until the day can no longer receive rows
+MIN_USAGE_RETENTION_DAYS = 2
+
+
+def usage_retention_days() -> int:
+    return max(MIN_USAGE_RETENTION_DAYS, int(os.getenv("USAGE_RETENTION_DAYS", DEFAULT_USAGE_RETENTION_DAYS)))
+
+
+def percentile(sorted_values: List[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(rows: List[Tuple[int, int]]) -> Dict:
+    """Aggregate columns for (status_code, response_time_ms) rows of one group"""
+    latencies = sorted(ms for _, ms in rows if ms is not None)
+    return {
+        "request_count": len(rows),
+        "error_count": sum(1 for status_code, _ in rows if status_code is not None and status_code >= 400),
+        "avg_response_ms": sum(latencies) / len(latencies) if latencies else None,
+        "p50_response_ms": percentile(latencies, 50),
+        "p95_response_ms": percentile(latencies, 95),
+        "p99_response_ms": percentile(latencies, 99),
+        "max_response_ms": latencies[-1] if latencies else None,
+    }
+
+
+def get_watermark(db: Session) -> RollupWatermark:
+    """Watermark row for the usage rollup (created on first use)"""
+    watermark = db.get(RollupWatermark, USAGE_ROLLUP_NAME)
+    if watermark is None:
+        watermark = RollupWatermark(name=USAGE_ROLLUP_NAME, last_id=0)
+        db.add(watermark)
+    return watermark
+
+
+def rollup_api_usage(db: Session, now: datetime = None, retention_days: int = None) -> Dict:
+    """
+    Roll raw usage above the watermark into daily aggregates, then purge.
+    Args:
+        db: Database session (committed here)
+        now: Current time (for the retention cutoff)
+        retention_days: Days of raw rows to keep (USAGE_RETENTION_DAYS)
+    Returns:
+        Rows rolled up, groups updated, rows purged and the new watermark
+    """
+    now = now or datetime.utcnow()
+    retention_days = max(MIN_USAGE_RETENTION_DAYS, retention_days or usage_retention_days())
+
+    watermark = get_watermark(db)
+    start_id = watermark.last_id or 0
+    end_id = db.query(func.max(APIUsage.id)).scalar() or start_id
+
+    # Groups with new rows, by day
+    affected = defaultdict(set)
+    new_rows = db.query(
+        APIUsage.timestamp, APIUsage.user_id, APIUsage.api_key_id, APIUsage.endpoint, APIUsage.method
+    ).filter(APIUsage.id > start_id, APIUsage.id <= end_id)
+
+    rolled = 0
+    for timestamp, user_id, api_key_id, endpoint, method in new_rows:
+        affected[timestamp.date()].add((user_id, api_key_id, endpoint, method))
+        rolled += 1
+
+    for day, groups in affected.items():
+        day_start = datetime.combine(day, datetime.min.time())
+        rows_by_group = defaultdict(list)
+        day_rows = db.query(
+            APIUsage.user_id, APIUsage.api_key_id, APIUsage.endpoint, APIUsage.method,
+            APIUsage.status_code, APIUsage.response_time_ms
+        ).filter(
+            APIUsage.user_id.in_({group[0] for group in groups}),
+            APIUsage.timestamp >= day_start,
+            APIUsage.timestamp < day_start + timedelta(days=1),
+            APIUsage.id <= end_id
+        )
+        for user_id, api_key_id, endpoint, method, status_code, response_ms in day_rows:
+            group = (user_id, api_key_id, endpoint, method)
+            if group in groups:
+                rows_by_group[group].append((status_code, response_ms))
+
+        existing = {
+            (row.user_id, row.api_key_id, row.endpoint, row.method): row
+            for row in db.query(APIUsageDaily).filter(
+                APIUsageDaily.day == day,
+                APIUsageDaily.user_id.in_({group[0] for group in groups})
+            )
+        }
+
+        for group, rows in rows_by_group.items():
+            aggregate = existing.get(group)
+            if aggregate is None:
+                user_id, api_key_id, endpoint, method = group
+                aggregate = APIUsageDaily(
+                    day=day, user_id=user_id, api_key_id=api_key_id, endpoint=endpoint, method=method
+                )
+                db.add(aggregate)
+            for column, value in summarize(rows).items():
+                setattr(aggregate, column, value)
+
+    watermark.last_id = end_id
+
+    # Raw rows already folded into the aggregates and past retention. The
+    # newest row is kept: SQLite reuses ids below the max, which would put
+    # new rows under the watermark.
+    cutoff = now - timedelta(days=retention_days)
+    purged = db.execute(
+        delete(APIUsage).where(APIUsage.id < end_id, APIUsage.timestamp < cutoff)
+    ).rowcount
+
+    db.commit()
+
+    stats = {
+        "rows_rolled_up": rolled,
+        "groups_updated": sum(len(groups) for groups in affected.values()),
+        "rows_purged": purged,
+        "watermark": end_id,
+    }
+    logger.info(
+        f"✓ API usage rollup: {rolled} rows into {stats['groups_updated']} daily groups, "
+        f"{purged} raw rows purged (watermark {end_id})"
+    )
+    return stats
@@ -1,14 +1,22 @@
 """
 Database models for ShapeX Studio MVP
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON, ForeignKey, Index
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.database import Base
+from app.models.types import CompressedText, CompressedJSON
 
 
 class StudioSession(Base):
     """Workflow execution tracking for Studio sessions"""
     __tablename__ = "studio_sessions"
+    __table_args__ = (
+        # Session list: newest first, optionally by status (id ends the cursor keyset)
+        Index("ix_studio_sessions_status_created_id", "status", "created_at", "id"),
+        Index("ix_studio_sessions_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(64), unique=True, nullable=False, index=True)
@@ -54,10 +62,11 @@ class AgentExecution(Base):
     status = Column(String(50), default="pending")  # pending, running, completed, failed
     attempt_number = Column(Integer, default=1)
 
-    # Input/Output
+    # Input/Output (outputs live in agent_execution_outputs)
     input_context = Column(JSON)  # Context from previous agents
-    raw_output = Column(Text)
-    structured_output = Column(JSON)
+    output = relationship("AgentExecutionOutput", uselist=False, cascade="all, delete-orphan")
+    raw_output = association_proxy("output", "raw_output", creator=lambda value: AgentExecutionOutput(raw_output=value))
+    structured_output = association_proxy("output", "structured_output", creator=lambda value: AgentExecutionOutput(structured_output=value))
 
     # Performance metrics
     tokens_used = Column(Integer)
@@ -77,6 +86,15 @@ class AgentExecution(Base):
     completed_at = Column(DateTime)
 
 
+class AgentExecutionOutput(Base):
+    """Cold columns of an agent execution (full Claude output)"""
+    __tablename__ = "agent_execution_outputs"
+
+    execution_id = Column(Integer, ForeignKey("agent_executions.id", ondelete="CASCADE"), primary_key=True)
+    raw_output = Column(CompressedText)
+    structured_output = Column(CompressedJSON)
+
+
 class Blueprint(Base):
     """Business blueprint generated by Studio agents"""
     __tablename__ = "blueprints"
@@ -6,14 +6,14 @@ from typing import Dict, Any, Callable
 import asyncio
 import logging
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.database import Idea
 from app.studio.claude_client import ClaudeClient
 from app.studio.agents.researcher import ResearcherAgent
 from app.studio.agents.validator import ValidatorAgent
 from app.studio.agents.strategist import StrategistAgent
-from app.studio.models import StudioSession, AgentExecution, Blueprint, AgentContext
+from app.studio.models import StudioSession, AgentExecution, AgentExecutionOutput, Blueprint, AgentContext
 from app.studio.config import StudioConfig
 
 logger = logging.getLogger(__name__)
@@ -26,12 +26,12 @@ class MVPOrchestrator:
     Sequential flow: Researcher → Validator → Strategist
     """
 
-    def __init__(self, db: Session, claude_client: ClaudeClient):
+    def __init__(self, db: AsyncSession, claude_client: ClaudeClient):
         """
         Initialize orchestrator.
 
         Args:
-            db: Database session
+            db: Async database session
             claude_client: Claude API client
         """
         self.db = db
@@ -74,11 +74,11 @@ class MVPOrchestrator:
             agents_completed=[]
         )
         self.db.add(session)
-        self.db.commit()
+        await self.db.commit()
 
         try:
             # Fetch idea from ShapeX
-            idea = self._fetch_idea(idea_id)
+            idea = await self._fetch_idea(idea_id)
             if not idea:
                 raise ValueError(f"Idea {idea_id} not found")
 
@@ -109,7 +109,7 @@ class MVPOrchestrator:
             # Update session progress
             session.agents_completed = ["researcher"]
             session.progress = 0.33
-            self.db.commit()
+            await self.db.commit()
 
             # 2. Validator (depends on Researcher)
             outputs["validator"] = await self._execute_agent(
@@ -123,7 +123,7 @@ class MVPOrchestrator:
             # Update session progress
             session.agents_completed = ["researcher", "validator"]
             session.progress = 0.66
-            self.db.commit()
+            await self.db.commit()
 
             # 3. Strategist (depends on Researcher + Validator)
             outputs["strategist"] = await self._execute_agent(
@@ -140,7 +140,7 @@ class MVPOrchestrator:
             # Update session progress
             session.agents_completed = ["researcher", "validator", "strategist"]
             session.progress = 1.0
-            self.db.commit()
+            await self.db.commit()
 
             # Calculate total cost and duration
             total_cost = sum(o["cost_usd"] for o in outputs.values())
@@ -148,7 +148,7 @@ class MVPOrchestrator:
             duration = (datetime.utcnow() - start_time).total_seconds()
 
             # Create blueprint
-            blueprint = self._create_blueprint(session_id, idea_id, outputs)
+            blueprint = await self._create_blueprint(session_id, idea_id, outputs)
 
             # Update session
             session.status = "completed"
@@ -157,7 +157,7 @@ class MVPOrchestrator:
             session.total_cost_usd = total_cost
             session.total_tokens_used = total_tokens
             session.duration_seconds = duration
-            self.db.commit()
+            await self.db.commit()
 
             # Send session complete message
             await stream_callback({
@@ -194,7 +194,7 @@ class MVPOrchestrator:
             session.status = "failed"
             session.error_message = str(e)
             session.completed_at = datetime.utcnow()
-            self.db.commit()
+            await self.db.commit()
 
             # Send error message
             await stream_callback({
@@ -233,16 +233,18 @@ class MVPOrchestrator:
 
         while attempt <= max_retries:
             try:
-                # Create execution record
+                # Create execution record (its output row too, so setting the
+                # output later needs no lazy load on the async session)
                 execution = AgentExecution(
                     session_id=session_id,
                     agent_type=agent_type,
                     status="running",
                     attempt_number=attempt + 1,
-                    started_at=datetime.utcnow()
+                    started_at=datetime.utcnow(),
+                    output=AgentExecutionOutput()
                 )
                 self.db.add(execution)
-                self.db.commit()
+                await self.db.commit()
 
                 # Send agent_start message
                 await stream_callback({
@@ -266,10 +268,10 @@ class MVPOrchestrator:
                 execution.cost_usd = output["cost_usd"]
                 execution.duration_seconds = duration
                 execution.model_name = output["model"]
-                self.db.commit()
+                await self.db.commit()
 
                 # Save context snapshot
-                self._save_context(session_id, agent_type, idea, context, agent.system_prompt)
+                await self._save_context(session_id, agent_type, idea, context, agent.system_prompt)
 
                 # Send agent_complete message
                 await stream_callback({
@@ -294,7 +296,7 @@ class MVPOrchestrator:
                 execution.status = "failed"
                 execution.error_message = str(e)
                 execution.completed_at = datetime.utcnow()
-                self.db.commit()
+                await self.db.commit()
 
                 if attempt > max_retries:
                     logger.error(f"Agent {agent_type} failed after {max_retries} retries")
@@ -305,7 +307,7 @@ class MVPOrchestrator:
                 logger.info(f"Retrying {agent_type} in {delay}s...")
                 await asyncio.sleep(delay)
 
-    def _fetch_idea(self, idea_id: int) -> Idea:
+    async def _fetch_idea(self, idea_id: int) -> Idea:
         """
         Fetch idea from ShapeX database.
 
@@ -315,9 +317,9 @@ class MVPOrchestrator:
         Returns:
             Idea object
         """
-        return self.db.query(Idea).filter(Idea.id == idea_id).first()
+        return await self.db.get(Idea, idea_id)
 
-    def _create_blueprint(
+    async def _create_blueprint(
         self,
         session_id: str,
         idea_id: int,
@@ -366,13 +368,13 @@ class MVPOrchestrator:
         )
 
         self.db.add(blueprint)
-        self.db.commit()
+        await self.db.commit()
 
         logger.info(f"Blueprint created: {blueprint.id}")
 
         return blueprint
 
-    def _save_context(
+    async def _save_context(
         self,
         session_id: str,
         agent_type: str,
@@ -394,7 +396,7 @@ class MVPOrchestrator:
             system_prompt=system_prompt
         )
         self.db.add(context_record)
-        self.db.commit()
+        await self.db.commit()
 
     def _calculate_success_probability(
         self,
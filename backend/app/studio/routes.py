@@ -1,19 +1,23 @@
 """
 API routes for ShapeX Studio MVP
 """
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Dict, Any
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, Optional
 import uuid
 import logging
 from datetime import datetime
 
-from app.models.database import get_db, Idea
+from app.models.database import get_async_db, get_async_read_db, Idea
 from app.studio.orchestrator import MVPOrchestrator
 from app.studio.claude_client import ClaudeClient
 from app.studio.websocket_manager import ws_manager
 from app.studio.models import StudioSession, Blueprint
 from app.studio.config import StudioConfig
+from app.api.pagination import decode_cursor, split_page, MAX_PAGE_SIZE
+from app.api.queries import studio_sessions_select, STUDIO_SESSIONS_KEYSET
+from app.api.serializers import project, rows_to_dicts, STUDIO_SESSION_LIST_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +42,7 @@ async def health_check():
 @router.post("/sessions/create")
 async def create_session(
     idea_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Create a new Studio session.
@@ -52,7 +56,7 @@ async def create_session(
     """
     try:
         # Verify idea exists
-        idea = db.query(Idea).filter(Idea.id == idea_id).first()
+        idea = await db.get(Idea, idea_id)
         if not idea:
             raise HTTPException(status_code=404, detail=f"Idea {idea_id} not found")
 
@@ -80,7 +84,7 @@ async def create_session(
 @router.get("/sessions/{session_id}")
 async def get_session(
     session_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get session details.
@@ -92,9 +96,9 @@ async def get_session(
     Returns:
         Session details
     """
-    session = db.query(StudioSession).filter(
+    session = await db.scalar(select(StudioSession).where(
         StudioSession.session_id == session_id
-    ).first()
+    ))
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -120,7 +124,7 @@ async def get_session(
 @router.get("/blueprints/{blueprint_id}")
 async def get_blueprint(
     blueprint_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> Dict[str, Any]:
     """
     Get blueprint details.
@@ -132,7 +136,7 @@ async def get_blueprint(
     Returns:
         Complete blueprint data
     """
-    blueprint = db.query(Blueprint).filter(Blueprint.id == blueprint_id).first()
+    blueprint = await db.get(Blueprint, blueprint_id)
 
     if not blueprint:
         raise HTTPException(status_code=404, detail="Blueprint not found")
@@ -156,7 +160,7 @@ async def get_blueprint(
 async def studio_websocket(
     websocket: WebSocket,
     session_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     WebSocket endpoint for Studio MVP sessions.
@@ -233,47 +237,42 @@ async def studio_websocket(
 
 @router.get("/sessions")
 async def list_sessions(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     status: str = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> Dict[str, Any]:
     """
-    List recent Studio sessions.
+    List recent Studio sessions, newest first.
 
     Args:
         limit: Maximum number of sessions to return
         status: Filter by status (optional)
+        cursor: next_cursor of the previous page (optional)
         db: Database session
 
     Returns:
-        List of sessions
+        List of sessions and the cursor for the next page (None on the last page)
     """
-    query = db.query(StudioSession).order_by(StudioSession.created_at.desc())
-
-    if status:
-        query = query.filter(StudioSession.status == status)
+    try:
+        after = decode_cursor(cursor, STUDIO_SESSIONS_KEYSET) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    sessions = query.limit(limit).all()
+    # The keyset columns ride along after the listed fields for the cursor
+    statement = project(studio_sessions_select(status=status, after=after), STUDIO_SESSION_LIST_FIELDS)
+    rows = (await db.execute(statement.add_columns(StudioSession.id).limit(limit + 1))).all()
+    rows, next_cursor = split_page(rows, limit, STUDIO_SESSIONS_KEYSET)
 
     return {
-        "sessions": [
-            {
-                "session_id": s.session_id,
-                "idea_id": s.idea_id,
-                "status": s.status,
-                "progress": s.progress,
-                "total_cost_usd": s.total_cost_usd,
-                "duration_seconds": s.duration_seconds,
-                "created_at": s.created_at.isoformat() if s.created_at else None
-            }
-            for s in sessions
-        ],
-        "total": len(sessions)
+        "sessions": rows_to_dicts(rows, STUDIO_SESSION_LIST_FIELDS),
+        "total": len(rows),
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/analytics")
-async def get_analytics(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_analytics(db: AsyncSession = Depends(get_async_read_db)) -> Dict[str, Any]:
     """
     Get Studio analytics and metrics.
 
@@ -283,24 +282,24 @@ async def get_analytics(db: Session = Depends(get_db)) -> Dict[str, Any]:
     Returns:
         Analytics data
     """
-    total_sessions = db.query(StudioSession).count()
-    completed_sessions = db.query(StudioSession).filter(
+    total_sessions = await db.scalar(select(func.count(StudioSession.id)))
+    completed_sessions = await db.scalar(select(func.count(StudioSession.id)).where(
         StudioSession.status == "completed"
-    ).count()
-    failed_sessions = db.query(StudioSession).filter(
+    ))
+    failed_sessions = await db.scalar(select(func.count(StudioSession.id)).where(
         StudioSession.status == "failed"
-    ).count()
+    ))
 
     success_rate = (completed_sessions / total_sessions * 100) if total_sessions > 0 else 0
 
-    # Average metrics from completed sessions
-    completed = db.query(StudioSession).filter(
-        StudioSession.status == "completed"
-    ).all()
+    # Average metrics from completed sessions (missing values count as 0)
+    averages = (await db.execute(select(
+        func.avg(func.coalesce(StudioSession.duration_seconds, 0)),
+        func.avg(func.coalesce(StudioSession.total_cost_usd, 0)),
+        func.avg(func.coalesce(StudioSession.total_tokens_used, 0))
+    ).where(StudioSession.status == "completed"))).one()
 
-    avg_duration = sum(s.duration_seconds or 0 for s in completed) / len(completed) if completed else 0
-    avg_cost = sum(s.total_cost_usd or 0 for s in completed) / len(completed) if completed else 0
-    avg_tokens = sum(s.total_tokens_used or 0 for s in completed) / len(completed) if completed else 0
+    avg_duration, avg_cost, avg_tokens = (value or 0 for value in averages)
 
     return {
         "total_sessions": total_sessions,
@@ -0,0 +1,143 @@
+"""
+Benchmark: row-at-a-time ORM saves vs the bulk ingest path
+
+Writes N ideas, trends and sources into a fresh SQLite file (WAL profile)
+both ways and prints rows/sec.
+
+Usage (from backend/):
+    python benchmarks/bench_bulk_ingest.py [rows]
+"""
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, Idea, Trend, Source
+from app.models.engine import build_engine
+from app.services.bulk_ingest import insert_ideas, insert_trends
+from app.services.sources import upsert_sources
+
+
+def make_ideas(count):
+    return [
+        {
+            "title": f"Idea {i}",
+            "description": "Automates invoice follow-ups for agencies",
+            "category": "SaaS",
+            "channel": "quick-win" if i % 2 else "strategic",
+            "target_market": "Agencies",
+            "revenue_model": "Subscription",
+            "estimated_time_to_build": "2-4 weeks",
+            "estimated_startup_cost": "$500",
+            "key_features": ["reminders", "payment links"],
+            "competitors": ["Chaser"],
+            "differentiation": "Agency-specific templates",
+            "feasibility_score": 8.0,
+            "market_demand_score": 7.5,
+            "monetization_score": 8.0,
+            "competition_score": 6.0,
+            "risk_score": 5.0,
+            "overall_score": 7.4,
+            "ai_reasoning": "{}"
+        }
+        for i in range(count)
+    ]
+
+
+def make_trends(count):
+    return [
+        {"keyword": f"keyword {i}", "growth_rate": 12.5, "momentum_score": 61.0,
+         "related_keywords": ["a", "b"], "time_series": list(range(90))}
+        for i in range(count)
+    ]
+
+
+def make_sources(count):
+    return [
+        {"source_type": "a16z_blog", "title": f"Post {i}",
+         "url": f"https://a16z.com/posts/{i}", "description": "Thesis " * 40}
+        for i in range(count)
+    ]
+
+
+def orm_ideas(db, ideas):
+    for idea_data in ideas:
+        db.add(Idea(**{key: idea_data[key] for key in idea_data}, status="new", created_at=datetime.utcnow()))
+    db.commit()
+
+
+def orm_trends(db, trends):
+    now = datetime.utcnow()
+    for result in trends:
+        db.add(Trend(
+            keyword=result["keyword"], source="google_trends", timeframe="today 3-m", geo="US",
+            growth_rate=result["growth_rate"], momentum_score=result["momentum_score"],
+            related_keywords=result["related_keywords"], time_series_data=result["time_series"],
+            detected_at=now, last_updated=now, is_active=True
+        ))
+    db.commit()
+
+
+def orm_sources(db, sources):
+    now = datetime.utcnow()
+    for item in sources:
+        db.add(Source(
+            source_type=item["source_type"], title=item["title"], url=item["url"],
+            content=item["description"], scraped_at=now, last_analyzed=now, is_processed=False
+        ))
+    db.commit()
+
+
+def bulk_ideas(db, ideas):
+    insert_ideas(db, ideas)
+    db.commit()
+
+
+def bulk_trends(db, trends):
+    insert_trends(db, trends, "today 3-m", "US")
+    db.commit()
+
+
+def bulk_sources(db, sources):
+    upsert_sources(db, sources)
+
+
+CASES = [
+    ("ideas", make_ideas, orm_ideas, bulk_ideas),
+    ("trends", make_trends, orm_trends, bulk_trends),
+    ("sources", make_sources, orm_sources, bulk_sources),
+]
+
+
+def timed(write, rows):
+    """Rows/sec for one write into a fresh database"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        start = time.perf_counter()
+        write(db, rows)
+        elapsed = time.perf_counter() - start
+        db.close()
+        engine.dispose()
+    return len(rows) / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"{'table':<10}{'orm rows/s':>14}{'bulk rows/s':>14}{'speedup':>10}")
+
+    for name, make, orm_write, bulk_write in CASES:
+        rows = make(count)
+        before = timed(orm_write, rows)
+        after = timed(bulk_write, rows)
+        print(f"{name:<10}{before:>14,.0f}{after:>14,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: near-duplicate lookups against a growing idea index
+
+Indexes N synthetic ideas, then times signature + LSH query per candidate
+(half paraphrases of indexed ideas, half new) and compares with scanning
+every stored signature.
+
+Usage (from backend/):
+    python benchmarks/bench_idea_dedupe.py [ideas] [candidates]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.analyzers.similarity import SimilarityIndex, signature, similarity
+
+# Distinct made-up words: real ideas share a few common words, not most
+VOCABULARY = [f"term{i}" for i in range(5000)] + ["ai", "workflow", "automation", "saas", "small", "business"] * 200
+
+
+def make_text(rng, words=14):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def paraphrase(rng, text):
+    words = text.split()
+    words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    candidates = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng = random.Random(7)
+
+    texts = [make_text(rng) for _ in range(count)]
+    index = SimilarityIndex()
+    start = time.perf_counter()
+    for idea_id, text in enumerate(texts):
+        index.add(idea_id, signature(text))
+    build = time.perf_counter() - start
+
+    queries = [
+        paraphrase(rng, rng.choice(texts)) if i % 2 else make_text(rng)
+        for i in range(candidates)
+    ]
+
+    start = time.perf_counter()
+    duplicates = sum(index.query(signature(text)) is not None for text in queries)
+    lsh = (time.perf_counter() - start) / candidates * 1e6
+
+    stored = list(index.signatures.values())
+    start = time.perf_counter()
+    for text in queries[:50]:
+        sig = signature(text)
+        max(similarity(sig, other) for other in stored)
+    linear = (time.perf_counter() - start) / 50 * 1e6
+
+    print(f"indexed {count:,} ideas in {build:.2f}s")
+    print(f"{'lookup':<12}{'us/candidate':>14}")
+    print(f"{'lsh':<12}{lsh:>14.1f}")
+    print(f"{'linear':<12}{linear:>14.1f}")
+    print(f"{duplicates}/{candidates} candidates flagged as near-duplicates")
+
+
+if __name__ == "__main__":
+    main()
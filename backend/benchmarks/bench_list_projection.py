@@ -0,0 +1,104 @@
+"""
+Benchmark: full ORM hydration vs column projection for list endpoints
+
+Loads `limit` ideas the old way (query(Idea).all(), then pick fields) and
+the new way (projected tuples + rows_to_dicts) and prints time per row and
+peak allocated memory.
+
+Usage (from backend/):
+    python benchmarks/bench_list_projection.py [limit] [repeats]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.api.queries import ideas_query
+from app.api.serializers import project, rows_to_dicts, IDEA_LIST_FIELDS
+from app.models.database import Base
+from app.models.engine import build_engine
+from app.services.bulk_ingest import insert_ideas
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_bulk_ingest import make_ideas
+
+
+def orm_list(db, limit):
+    ideas = ideas_query(db).limit(limit).all()
+    return [
+        {
+            "id": idea.id,
+            "title": idea.title,
+            "description": idea.description,
+            "category": idea.category,
+            "channel": idea.channel,
+            "overall_score": idea.overall_score,
+            "feasibility_score": idea.feasibility_score,
+            "monetization_score": idea.monetization_score,
+            "market_demand_score": idea.market_demand_score,
+            "target_market": idea.target_market,
+            "revenue_model": idea.revenue_model,
+            "estimated_time_to_build": idea.estimated_time_to_build,
+            "estimated_startup_cost": idea.estimated_startup_cost,
+            "status": idea.status,
+            "favorite": idea.favorite,
+            "created_at": idea.created_at.isoformat()
+        }
+        for idea in ideas
+    ]
+
+
+def projected_list(db, limit):
+    rows = project(ideas_query(db), IDEA_LIST_FIELDS).limit(limit).all()
+    return rows_to_dicts(rows, IDEA_LIST_FIELDS)
+
+
+def measure(Session, build, limit, repeats):
+    """Microseconds per row and peak KiB for one listing"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        db = Session()
+        build(db, limit)
+        db.close()
+    per_row = (time.perf_counter() - start) / (repeats * limit) * 1e6
+
+    db = Session()
+    tracemalloc.start()
+    build(db, limit)
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    db.close()
+    return per_row, peak
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+
+        db = Session()
+        insert_ideas(db, make_ideas(limit))
+        db.commit()
+        db.close()
+
+        assert orm_list(Session(), limit) == projected_list(Session(), limit)
+
+        print(f"{'path':<12}{'us/row':>10}{'peak KiB':>12}")
+        for name, build in [("orm", orm_list), ("projection", projected_list)]:
+            per_row, peak = measure(Session, build, limit, repeats)
+            print(f"{name:<12}{per_row:>10.1f}{peak:>12,.0f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: per-keyword metric loop vs one vectorized pass
+
+Ranks N synthetic keywords by momentum both ways: compute_metrics() on
+each keyword's row in a Python loop, and once over the whole matrix.
+Also times loading the packed series of N stored trends from SQLite.
+
+Usage (from backend/):
+    python benchmarks/bench_trend_metrics.py [keywords] [periods]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from sqlalchemy.orm import sessionmaker
+
+from app.analyzers.trend_metrics import active_series, compute_metrics, rank_movers, series_matrix, top_rows
+from app.models.database import Base
+from app.models.engine import build_engine
+from app.services.bulk_ingest import insert_trends
+
+
+def make_series(count, periods, seed=7):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(5, 60, size=(count, 1))
+    drift = rng.normal(0, 0.4, size=(count, 1)) * np.arange(periods)
+    noise = rng.normal(0, 4, size=(count, periods))
+    return np.clip(base + drift + noise, 0, 100).round().astype(int).tolist()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    periods = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    series = make_series(count, periods)
+
+    start = time.perf_counter()
+    momentum = np.array([compute_metrics(series_matrix([points], periods))["momentum"][0] for points in series])
+    looped = top_rows(momentum, 20)
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    vectorized = top_rows(compute_metrics(series_matrix(series, periods))["momentum"], 20)
+    vector_ms = (time.perf_counter() - start) * 1000
+    assert looped.tolist() == vectorized.tolist()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        insert_trends(db, [
+            {"keyword": f"keyword {i}", "momentum_score": 0, "time_series": points}
+            for i, points in enumerate(series)
+        ], "today 3-m", "US")
+        db.commit()
+
+        start = time.perf_counter()
+        active_series(db)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        rank_movers(db, limit=20)
+        endpoint_ms = (time.perf_counter() - start) * 1000
+        db.close()
+        engine.dispose()
+
+    print(f"{count:,} keywords x {periods} periods")
+    print(f"{'step':<22}{'ms':>10}")
+    print(f"{'per-keyword loop':<22}{loop_ms:>10.1f}")
+    print(f"{'vectorized pass':<22}{vector_ms:>10.1f}")
+    print(f"{'load packed series':<22}{load_ms:>10.1f}")
+    print(f"{'rank_movers total':<22}{endpoint_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
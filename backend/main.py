@@ -73,6 +73,8 @@ scheduler_config = {
     "telegram_bot_token": os.getenv("TELEGRAM_BOT_TOKEN"),
     "telegram_user_id": os.getenv("TELEGRAM_USER_ID"),
     "enable_telegram": os.getenv("ENABLE_TELEGRAM", "true").lower() == "true",
+    "usage_rollup_interval_minutes": int(os.getenv("USAGE_ROLLUP_INTERVAL_MINUTES", 15)),
+    "usage_retention_days": int(os.getenv("USAGE_RETENTION_DAYS", 30)),
     "min_feasibility_score": float(os.getenv("MIN_FEASIBILITY_SCORE", 6.0)),
     "min_monetization_score": float(os.getenv("MIN_MONETIZATION_SCORE", 7.0)),
     "ideas_per_scan": int(os.getenv("IDEAS_PER_SCAN", 10)),
@@ -81,6 +83,17 @@ scheduler_config = {
     "enable_a16z_scraper": os.getenv("ENABLE_A16Z_SCRAPER", "true").lower() == "true",
     "enable_product_hunt": os.getenv("ENABLE_PRODUCT_HUNT", "true").lower() == "true",
     "enable_google_trends": os.getenv("ENABLE_GOOGLE_TRENDS", "true").lower() == "true",
+    "parallel_generation": os.getenv("PARALLEL_GENERATION", "true").lower() == "true",
+    "enable_http_cache": os.getenv("ENABLE_HTTP_CACHE", "true").lower() == "true",
+    "enable_idea_dedupe": os.getenv("ENABLE_IDEA_DEDUPE", "true").lower() == "true",
+    "idea_dedupe_threshold": float(os.getenv("IDEA_DEDUPE_THRESHOLD", 0.5)),
+    "trends_batch_mode": os.getenv("TRENDS_BATCH_MODE", "true").lower() == "true",
+    "trends_anchor": os.getenv("TRENDS_ANCHOR") or None,
+    "trends_timeframe": os.getenv("TRENDS_TIMEFRAME", "today 3-m"),
+    "trends_geo": os.getenv("TRENDS_GEO", "US"),
+    "trends_cache_ttl_hours": float(os.getenv("TRENDS_CACHE_TTL_HOURS", 24)),
+    "source_timeout_seconds": float(os.getenv("SOURCE_TIMEOUT_SECONDS", 60)),
+    "trends_timeout_seconds": float(os.getenv("TRENDS_TIMEOUT_SECONDS", 120)),
 }
 
 scheduler = ShapeXScheduler(config=scheduler_config)
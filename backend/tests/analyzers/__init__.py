@@ -0,0 +1,3 @@
+"""
+Analyzer tests
+"""
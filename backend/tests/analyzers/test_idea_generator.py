@@ -0,0 +1,101 @@
+"""
+Tests for parallel idea generation
+"""
+import asyncio
+import json
+import time
+import pytest
+from types import SimpleNamespace
+
+import app.analyzers.idea_generator as idea_generator
+from app.analyzers.idea_generator import IdeaGenerator
+
+IDEA = {
+    "title": "Invoice Chaser",
+    "description": "Automated invoice follow-ups",
+    "feasibility": 8,
+    "market_demand": 7,
+    "monetization": 9,
+    "competition": 6,
+    "risk": 7
+}
+
+
+class FakeMessages:
+    """Stands in for AsyncAnthropic.messages with a fixed latency"""
+
+    def __init__(self, delay: float, fail_on_temperature: float = None, text: str = None):
+        self.delay = delay
+        self.fail_on_temperature = fail_on_temperature
+        self.text = text if text is not None else json.dumps([IDEA])
+
+    async def create(self, model, max_tokens, temperature, messages):
+        await asyncio.sleep(self.delay)
+        if temperature == self.fail_on_temperature:
+            raise RuntimeError("overloaded")
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self.text)],
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=2000)
+        )
+
+
+def fake_client_factory(delay: float, fail_on_temperature: float = None, text: str = None):
+    class FakeAsyncAnthropic:
+        def __init__(self, api_key):
+            self.messages = FakeMessages(delay, fail_on_temperature, text)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    return FakeAsyncAnthropic
+
+
+def test_channels_run_in_parallel(monkeypatch):
+    """Test that both channels are in flight together and metrics are recorded"""
+    monkeypatch.setattr(idea_generator, "AsyncAnthropic", fake_client_factory(0.3))
+    generator = IdeaGenerator(api_key="test")
+
+    start = time.monotonic()
+    results = generator.generate_channels({"strategic": "a", "quick-win": "b"})
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.55
+    assert results["strategic"]["ideas"][0]["channel"] == "strategic"
+    assert results["quick-win"]["ideas"][0]["channel"] == "quick-win"
+
+    metrics = generator.channel_metrics["quick-win"]
+    assert metrics["total_tokens"] == 3000
+    # Sonnet 4.5: 1000 * $3/M + 2000 * $15/M
+    assert abs(metrics["cost_usd"] - 0.033) < 0.0001
+    assert metrics["latency_seconds"] >= 0.3
+
+
+def test_failed_channel_keeps_other_results(monkeypatch):
+    """Test that one failing channel does not cancel the others"""
+    monkeypatch.setattr(idea_generator, "AsyncAnthropic", fake_client_factory(0.01, fail_on_temperature=0.8))
+    generator = IdeaGenerator(api_key="test")
+
+    results = generator.generate_channels({"strategic": "a", "quick-win": "b"})
+
+    assert len(results["strategic"]["ideas"]) == 1
+    assert results["quick-win"]["ideas"] == []
+    assert "overloaded" in results["quick-win"]["metrics"]["error"]
+
+
+def test_unparseable_response_is_a_channel_error(monkeypatch):
+    """Test that malformed JSON is reported as an error, not as zero ideas"""
+    monkeypatch.setattr(idea_generator, "AsyncAnthropic", fake_client_factory(0.01, text='[{"title": "cut off'))
+    generator = IdeaGenerator(api_key="test")
+
+    results = generator.generate_channels({"strategic": "a"})
+
+    assert results["strategic"]["ideas"] == []
+    assert results["strategic"]["metrics"]["error"] == "Unparseable strategic response"
+    assert results["strategic"]["metrics"]["total_tokens"] == 3000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
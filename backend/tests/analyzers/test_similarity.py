@@ -0,0 +1,54 @@
+"""
+Tests for MinHash/LSH near-duplicate detection
+"""
+import pytest
+
+from app.analyzers.similarity import SimilarityIndex, shingles, signature, similarity, stem
+
+CODE_ASSISTANT = "AI code assistant: An AI pair programmer that writes and reviews code for developers"
+PARAPHRASE = "AI coding assistant: AI pair programmer that reviews and writes code for software developers"
+TEST_GENERATOR = "AI test generator: writes unit tests for developers automatically from code"
+
+
+def test_shingles_normalize_wording():
+    """Test stemming and stopword removal"""
+    assert stem("coding") == stem("code") == stem("coder")
+    assert shingles("The Invoices, for freelancers!") == {"invoic", "freelanc"}
+
+
+def test_signature_estimates_jaccard():
+    """Test that paraphrases score high and different ideas low"""
+    assert similarity(signature(CODE_ASSISTANT), signature(CODE_ASSISTANT)) == 1.0
+    assert similarity(signature(CODE_ASSISTANT), signature(PARAPHRASE)) > 0.75
+    assert similarity(signature(CODE_ASSISTANT), signature(TEST_GENERATOR)) < 0.5
+    assert similarity(signature(CODE_ASSISTANT), signature("Invoice chaser for plumbers")) < 0.1
+
+
+def test_index_finds_near_duplicates_only():
+    """Test LSH lookups against the threshold"""
+    index = SimilarityIndex(threshold=0.5)
+    index.add(1, signature(CODE_ASSISTANT))
+    index.add(2, signature("Invoice chaser: emails clients about unpaid bills"))
+
+    key, score = index.query(signature(PARAPHRASE))
+    assert key == 1 and score > 0.75
+    assert index.query(signature(TEST_GENERATOR)) is None
+    assert index.query(signature("")) is None
+
+
+def test_index_remove_and_replace():
+    """Test that removed keys are no longer returned"""
+    index = SimilarityIndex()
+    index.add(1, signature(CODE_ASSISTANT))
+    index.add(1, signature("Recipe planner for busy parents"))
+    assert len(index) == 1
+    assert index.query(signature(CODE_ASSISTANT)) is None
+
+    index.remove(1)
+    assert 1 not in index
+    assert index.query(signature("Recipe planner for busy parents")) is None
+    assert all(not buckets for buckets in index.buckets)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
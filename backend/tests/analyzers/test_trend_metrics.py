@@ -0,0 +1,90 @@
+"""
+Tests for the vectorized trend metrics engine
+"""
+import json
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.analyzers.trend_metrics import compute_metrics, rank_movers, series_matrix, top_rows
+from app.api.routes import get_trend_movers
+from app.models.database import Trend
+
+FLAT = [50] * 20
+RISING = [10] * 12 + [20, 30, 40, 50, 60, 70, 80, 90]
+SPIKE = [20, 21, 19, 20, 21, 19, 20, 21, 19, 20, 21, 19, 20, 21, 19, 20, 21, 19, 20, 80]
+FALLING = list(range(100, 0, -5))
+
+
+@pytest.fixture
+def db(db):
+    """Shared database with a few active trends and one retired row"""
+    for keyword, points in [("flat", FLAT), ("rising", RISING), ("spike", SPIKE), ("falling", FALLING), ("new", [5])]:
+        db.add(Trend(keyword=keyword, source="google_trends", geo="US", is_active=True, time_series_data=points))
+    db.add(Trend(keyword="retired", source="google_trends", geo="US", is_active=False, time_series_data=[1] * 10 + [99] * 10))
+    db.add(Trend(keyword="rising", source="google_trends", geo="GB", is_active=True, time_series_data=FLAT))
+    db.commit()
+    return db
+
+
+def test_series_matrix_right_aligns_and_pads():
+    """Test alignment on the latest point"""
+    matrix = series_matrix([[1, 2, 3], [4], []], periods=2)
+    assert matrix[0].tolist() == [2, 3]
+    assert np.isnan(matrix[1, 0]) and matrix[1, 1] == 4
+    assert np.isnan(matrix[2]).all()
+
+
+def test_compute_metrics_for_every_row_at_once():
+    """Test growth, acceleration, momentum and breakouts on known shapes"""
+    metrics = compute_metrics(series_matrix([FLAT, RISING, SPIKE, FALLING], periods=20))
+
+    assert metrics["growth_rate"][0] == 0
+    assert metrics["growth_rate"][1] == pytest.approx((75 - 35) / 35 * 100)
+    assert metrics["acceleration"][1] == pytest.approx((75 - 35) / 35 * 100 - (35 - 10) / 10 * 100)
+    assert metrics["momentum"][0] == pytest.approx(0)
+    assert metrics["momentum"][1] > 0 > metrics["momentum"][3]
+    assert metrics["breakout"].tolist() == [False, True, True, False]
+    assert metrics["z_score"][2] > metrics["z_score"][1]
+
+
+def test_short_history_is_not_ranked():
+    """Test that NaN metrics never make the ranking"""
+    metrics = compute_metrics(series_matrix([[5], RISING], periods=20))
+    assert np.isnan(metrics["growth_rate"][0]) and np.isnan(metrics["z_score"][0])
+    assert top_rows(metrics["growth_rate"], 5).tolist() == [1]
+
+
+def test_top_rows_orders_largest_first():
+    """Test partial sort of a large vector"""
+    values = np.arange(10000, dtype=float)
+    values[5] = np.nan
+    assert top_rows(values, 3).tolist() == [9999, 9998, 9997]
+    assert top_rows(values, 0).tolist() == []
+
+
+def test_rank_movers_over_active_trends(db):
+    """Test ranking loaded from packed series"""
+    movers = rank_movers(db, by="growth_rate", limit=3, geo="US")
+
+    assert [mover["keyword"] for mover in movers] == ["rising", "spike", "flat"]
+    assert movers[0]["growth_rate"] == pytest.approx(114.29)
+    breakouts = rank_movers(db, by="z_score", geo="US", breakouts_only=True)
+    assert [mover["keyword"] for mover in breakouts] == ["spike", "rising"]
+    assert all(mover["breakout"] for mover in breakouts)
+
+
+def test_movers_endpoint(db):
+    """Test /trends/movers and its sort validation"""
+    body = json.loads(get_trend_movers(sort="momentum", limit=2, geo=None, breakouts_only=False, db=db).body)
+    assert body["count"] == 2
+    assert body["movers"][0]["keyword"] in {"rising", "spike"}
+
+    with pytest.raises(HTTPException) as error:
+        get_trend_movers(sort="volume", limit=2, geo=None, breakouts_only=False, db=db)
+    assert error.value.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,221 @@
+"""
+Tests for route handlers on the async database layer
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.api import routes
+from app.models.database import Base, Idea, User, APIKey, APIUsage, get_async_db, get_async_read_db
+from app.models.engine import build_engine, build_async_engine
+from app.services.response_cache import response_cache
+from app.studio import orchestrator, routes as studio_routes
+from app.studio.models import StudioSession, AgentExecution, Blueprint
+
+API_KEY = "shpx_test"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """API client on a temporary database with one indie user"""
+    response_cache.clear()
+    url = f"sqlite:///{tmp_path / 'shapex.db'}"
+    engine = build_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    AsyncSession = async_sessionmaker(build_async_engine(url), expire_on_commit=False)
+
+    db = Session()
+    user = User(email="founder@example.com", tier="indie", is_active=True)
+    db.add(user)
+    db.flush()
+    db.add(APIKey(key=API_KEY, user_id=user.id, is_active=True))
+    db.add_all([
+        Idea(title="Invoice bot", description="Chases unpaid invoices", channel="quick-win", category="SaaS", overall_score=8.0),
+        Idea(title="Carbon ledger", description="Scope 3 accounting", channel="strategic", category="Climate", overall_score=9.0),
+    ])
+    db.add_all([
+        StudioSession(session_id="s1", idea_id=1, status="completed", duration_seconds=60, total_cost_usd=0.5, total_tokens_used=1000),
+        StudioSession(session_id="s2", idea_id=1, status="completed", duration_seconds=None, total_cost_usd=0.3, total_tokens_used=500),
+        StudioSession(session_id="s3", idea_id=2, status="failed"),
+    ])
+    db.commit()
+    db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api")
+    app.include_router(studio_routes.router, prefix="/api/studio")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+
+    client = TestClient(app)
+    client.session_factory = Session
+    return client
+
+
+def test_list_ideas_validates_key_and_tracks_usage(client):
+    """Test the authenticated idea list end to end"""
+    response = client.get("/api/ideas?min_score=7", headers={"X-API-Key": API_KEY})
+
+    assert response.status_code == 200
+    assert [i["title"] for i in response.json()["ideas"]] == ["Carbon ledger", "Invoice bot"]
+    assert response.headers["X-RateLimit-Limit"] == "100"
+
+    # Served from the response cache, still rate limited and tracked
+    cached = client.get("/api/ideas?min_score=7", headers={"X-API-Key": API_KEY})
+    assert cached.content == response.content
+    assert int(cached.headers["X-RateLimit-Remaining"]) == int(response.headers["X-RateLimit-Remaining"]) - 1
+    assert response_cache.stats()["endpoints"]["/ideas"]["hits"] == 1
+
+    db = client.session_factory()
+    assert db.query(APIUsage).filter(APIUsage.endpoint == "/api/ideas").count() == 2
+    assert db.query(APIKey).first().requests_made == 2
+    db.close()
+
+
+def test_list_ideas_pages_with_cursors(client):
+    """Test next_cursor paging on /ideas and /studio/sessions"""
+    headers = {"X-API-Key": API_KEY}
+
+    first = client.get("/api/ideas?limit=1", headers=headers).json()
+    assert [i["title"] for i in first["ideas"]] == ["Carbon ledger"]
+    second = client.get(f"/api/ideas?limit=1&cursor={first['next_cursor']}", headers=headers).json()
+    assert [i["title"] for i in second["ideas"]] == ["Invoice bot"]
+    assert second["next_cursor"] is None
+
+    assert client.get("/api/ideas?cursor=garbage", headers=headers).status_code == 400
+    assert client.get("/api/ideas?limit=10000", headers=headers).status_code == 422
+
+    sessions = client.get("/api/studio/sessions?limit=2").json()
+    rest = client.get(f"/api/studio/sessions?limit=2&cursor={sessions['next_cursor']}").json()
+    assert [s["session_id"] for s in sessions["sessions"] + rest["sessions"]] == ["s3", "s2", "s1"]
+    assert rest["next_cursor"] is None
+
+
+def test_get_idea_and_missing_idea(client):
+    """Test idea lookup by primary key"""
+    headers = {"X-API-Key": API_KEY}
+
+    assert client.get("/api/ideas/2", headers=headers).json()["title"] == "Carbon ledger"
+    assert client.get("/api/ideas/99", headers=headers).status_code == 404
+
+
+def test_search_ideas_ranks_matches_and_applies_filters(client):
+    """Test /ideas/search (and that it isn't routed to /ideas/{idea_id})"""
+    headers = {"X-API-Key": API_KEY}
+
+    body = client.get("/api/ideas/search?q=invoices", headers=headers).json()
+    assert [i["title"] for i in body["ideas"]] == ["Invoice bot"]
+    assert body["next_offset"] is None
+
+    assert client.get("/api/ideas/search?q=invoice&channel=strategic", headers=headers).json()["count"] == 0
+    assert client.get("/api/ideas/search?q=%22%22", headers=headers).json()["count"] == 0
+    assert client.get("/api/ideas/search", headers=headers).status_code == 422
+
+
+def test_usage_is_counted_and_tracked_on_the_primary(client, tmp_path):
+    """Test that idea reads come from the read session while rate limiting and tracking use the primary"""
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    engine = build_engine(url)
+    Base.metadata.create_all(engine)
+    replica = sessionmaker(bind=engine)()
+    replica.add(Idea(title="Replica idea", description="Only on the replica", channel="strategic", overall_score=7.0))
+    replica.commit()
+    ReplicaSession = async_sessionmaker(build_async_engine(url), expire_on_commit=False)
+
+    async def override_get_async_read_db():
+        async with ReplicaSession() as session:
+            yield session
+
+    client.app.dependency_overrides[get_async_read_db] = override_get_async_read_db
+    headers = {"X-API-Key": API_KEY}
+
+    assert [i["title"] for i in client.get("/api/ideas", headers=headers).json()["ideas"]] == ["Replica idea"]
+    search = client.get("/api/ideas/search?q=replica", headers=headers)
+    assert search.json()["count"] == 1
+    assert search.headers["X-RateLimit-Remaining"] == "99"
+    assert client.get("/api/ideas/1", headers=headers).json()["title"] == "Replica idea"
+
+    assert replica.query(APIUsage).count() == 0
+    db = client.session_factory()
+    assert db.query(APIUsage).count() == 3
+    db.close()
+    replica.close()
+
+
+def test_invalid_and_rate_limited_keys_are_rejected(client):
+    """Test validate_api_key on the async session"""
+    assert client.get("/api/ideas").status_code == 401
+    assert client.get("/api/ideas", headers={"X-API-Key": "shpx_wrong"}).status_code == 401
+
+    db = client.session_factory()
+    db.query(User).first().tier = "free"
+    db.add_all([APIUsage(user_id=1, api_key_id=1, endpoint="/api/ideas") for _ in range(10)])
+    db.commit()
+    db.close()
+
+    response = client.get("/api/ideas", headers={"X-API-Key": API_KEY})
+    assert response.status_code == 429
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_studio_routes(client):
+    """Test the Studio HTTP routes on the async session"""
+    assert client.post("/api/studio/sessions/create?idea_id=1").json()["idea_title"] == "Invoice bot"
+    assert client.post("/api/studio/sessions/create?idea_id=99").status_code == 404
+    assert client.get("/api/studio/sessions/s3").json()["status"] == "failed"
+    assert client.get("/api/studio/blueprints/1").status_code == 404
+
+    sessions = client.get("/api/studio/sessions?status=completed").json()
+    assert {s["session_id"] for s in sessions["sessions"]} == {"s1", "s2"}
+
+    analytics = client.get("/api/studio/analytics").json()
+    assert analytics["total_sessions"] == 3
+    assert analytics["failed_sessions"] == 1
+    assert analytics["averages"]["duration_seconds"] == 30.0
+    assert analytics["averages"]["cost_usd"] == 0.4
+    assert analytics["averages"]["tokens_used"] == 750
+
+
+class FakeAgent:
+    """Studio agent that answers immediately without calling Claude"""
+    system_prompt = "fake"
+
+    def __init__(self, claude_client):
+        pass
+
+    async def execute(self, idea, context, stream_callback):
+        return {"raw_output": "{}", "structured_output": {}, "tokens_used": 10, "cost_usd": 0.01, "model": "fake"}
+
+
+def test_studio_websocket_runs_workflow_on_async_session(client, monkeypatch):
+    """Test the Studio WebSocket workflow end to end on the async session"""
+    for agent in ("ResearcherAgent", "ValidatorAgent", "StrategistAgent"):
+        monkeypatch.setattr(orchestrator, agent, FakeAgent)
+
+    with client.websocket_connect("/api/studio/ws/s9") as websocket:
+        websocket.send_json({"type": "start_workflow", "idea_id": 2})
+        messages = []
+        while not messages or messages[-1]["type"] not in ("workflow_complete", "workflow_error"):
+            messages.append(websocket.receive_json())
+
+    assert messages[0]["idea"]["title"] == "Carbon ledger"
+    assert messages[-1]["type"] == "workflow_complete"
+    assert messages[-1]["metrics"]["total_tokens"] == 30
+
+    db = client.session_factory()
+    session = db.query(StudioSession).filter(StudioSession.session_id == "s9").one()
+    assert (session.status, session.progress) == ("completed", 1.0)
+    assert db.get(Blueprint, session.blueprint_id).idea_id == 2
+    assert [e.raw_output for e in db.query(AgentExecution).filter(AgentExecution.session_id == "s9")] == ["{}"] * 3
+    db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,81 @@
+"""
+Tests for keyset (cursor) pagination
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api import queries
+from app.api.pagination import decode_cursor, encode_cursor, split_page
+from app.api.serializers import project, IDEA_LIST_FIELDS
+from app.models.database import Idea
+
+CREATED = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest.fixture
+def db(db):
+    """Shared database with ideas that tie on score and created_at"""
+    db.add_all([
+        Idea(title=f"Idea {i}", description="d", channel="strategic" if i % 2 else "quick-win",
+             overall_score=float(i % 4), created_at=CREATED - timedelta(days=i % 3))
+        for i in range(25)
+    ])
+    db.commit()
+    return db
+
+
+def walk(db, limit, **filters):
+    """Ids of every page in order, following next cursors"""
+    pages, after = [], None
+    while True:
+        rows = project(queries.ideas_query(db, after=after, **filters), IDEA_LIST_FIELDS).limit(limit + 1).all()
+        rows, cursor = split_page(rows, limit, queries.IDEAS_KEYSET)
+        pages.append([row.id for row in rows])
+        if cursor is None:
+            return pages
+        after = decode_cursor(cursor, queries.IDEAS_KEYSET)
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode to the values they were built from"""
+    values = (7.5, datetime(2026, 10, 1, 12, 30, 15), 42)
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, queries.IDEAS_KEYSET) == values
+    # Whole-number scores come back as floats
+    assert decode_cursor(encode_cursor([8, values[1], 42]), queries.IDEAS_KEYSET)[0] == 8.0
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor([1, 2]), encode_cursor(["x", "2026-10-01", 1]),
+                                    encode_cursor([1.0, "yesterday", 1]), encode_cursor([1.0, "2026-10-01", 1.5])])
+def test_malformed_cursor_is_rejected(cursor):
+    """Test that tampered or foreign cursors raise ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, queries.IDEAS_KEYSET)
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 25, 50])
+def test_pages_cover_the_ordered_list_once(db, limit):
+    """Test that walking cursors returns every idea once, in list order, despite ties"""
+    expected = [idea.id for idea in queries.ideas_query(db).all()]
+
+    pages = walk(db, limit)
+
+    assert [idea_id for page in pages for idea_id in page] == expected
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+
+
+def test_pages_respect_filters(db):
+    """Test cursors over a filtered list"""
+    expected = [idea.id for idea in queries.ideas_query(db, channel="strategic", min_score=1.0).all()]
+
+    pages = walk(db, 3, channel="strategic", min_score=1.0)
+
+    assert [idea_id for page in pages for idea_id in page] == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Query-plan regression tests for hot read paths
+Fails if any hot query falls back to a full table scan.
+"""
+import re
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app.api import queries, serializers
+from app.models.database import ensure_indexes
+from app.services.trend_cache import TrendCache
+
+
+# Every hot read path, with the filter combinations the API uses
+HOT_QUERIES = {
+    "ideas": lambda db: queries.ideas_query(db).limit(50),
+    "ideas_by_channel": lambda db: queries.ideas_query(db, channel="strategic").limit(50),
+    "ideas_by_category": lambda db: queries.ideas_query(db, category="SaaS").limit(50),
+    "ideas_by_min_score": lambda db: queries.ideas_query(db, min_score=7.0).limit(50),
+    "ideas_by_channel_and_score": lambda db: queries.ideas_query(db, channel="quick-win", min_score=7.0).limit(50),
+    "ideas_after_cursor": lambda db: queries.ideas_query(db, after=(7.5, datetime(2026, 10, 1), 42)).limit(50),
+    "ideas_by_channel_after_cursor": lambda db: queries.ideas_query(
+        db, channel="strategic", after=(7.5, datetime(2026, 10, 1), 42)
+    ).limit(50),
+    "quick_wins": lambda db: queries.quick_win_query(db).limit(10),
+    "active_trends": lambda db: queries.active_trends_query(db).limit(20),
+    "active_trends_by_momentum": lambda db: queries.active_trends_query(db, min_momentum=50.0).limit(20),
+    "monthly_usage": lambda db: queries.monthly_usage_query(db, user_id=1),
+    "idea_search": lambda db: queries.search_ideas_query(db, "invoice", channel="strategic").limit(20),
+    "usage_report": lambda db: queries.usage_report_query(db, 1, date(2026, 10, 1), date(2026, 11, 1)),
+    "recent_scans": lambda db: queries.recent_scans_query(db).limit(10),
+    "last_completed_scan": lambda db: queries.last_completed_scan_query(db).limit(1),
+    "studio_sessions": lambda db: queries.studio_sessions_query(db).limit(50),
+    "studio_sessions_by_status": lambda db: queries.studio_sessions_query(db, status="completed").limit(50),
+    "studio_sessions_after_cursor": lambda db: queries.studio_sessions_query(
+        db, status="completed", after=(datetime(2026, 10, 1), 42)
+    ).limit(50),
+    "ideas_list_projection": lambda db: serializers.project(
+        queries.ideas_select(channel="strategic"), serializers.IDEA_LIST_FIELDS
+    ).limit(500),
+    "trends_projection": lambda db: serializers.project(
+        queries.active_trends_query(db), serializers.TREND_LIST_FIELDS
+    ).limit(500),
+    "studio_sessions_projection": lambda db: serializers.project(
+        queries.studio_sessions_select(), serializers.STUDIO_SESSION_LIST_FIELDS
+    ).limit(500),
+    "trend_cache_lookup": lambda db: TrendCache.lookup_query(db, ["SaaS", "fintech"], "US"),
+}
+
+
+def explain(db, query):
+    """EXPLAIN QUERY PLAN detail lines for a query (ORM Query or Select)"""
+    statement = getattr(query, "statement", query).compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {statement}")).fetchall()
+    return [row[-1] for row in rows]
+
+
+def full_scans(plan):
+    """Plan lines that read a whole table without an index"""
+    return [line for line in plan if re.match(r"SCAN \w+$", line)]
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_an_index(db, name):
+    """Test that the hot query is answered from an index"""
+    plan = explain(db, HOT_QUERIES[name](db))
+    assert not full_scans(plan), f"{name} does a full table scan: {plan}"
+
+
+def test_ensure_indexes_adds_missing_indexes(db):
+    """Test that existing databases get the composite indexes and lose replaced ones"""
+    bind = db.get_bind()
+    db.execute(text("DROP INDEX ix_ideas_channel_score_created_id"))
+    db.execute(text("DROP INDEX ix_api_usage_user_timestamp"))
+    db.execute(text("CREATE INDEX ix_ideas_channel_score_created ON ideas (channel, overall_score, created_at)"))
+    db.commit()
+
+    ensure_indexes(bind)
+
+    names = {index["name"] for index in inspect(bind).get_indexes("ideas")}
+    assert "ix_ideas_channel_score_created_id" in names
+    assert "ix_ideas_channel_score_created" not in names
+    assert "ix_api_usage_user_timestamp" in {index["name"] for index in inspect(bind).get_indexes("api_usage")}
+
+
+def test_month_bounds_roll_over_the_year():
+    """Test that December's window ends on January 1st"""
+    start, end = queries.month_bounds(datetime(2026, 12, 15, 10, 30))
+    assert start == datetime(2026, 12, 1)
+    assert end == datetime(2027, 1, 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
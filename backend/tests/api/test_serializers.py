@@ -0,0 +1,88 @@
+"""
+Tests for list endpoint projections and row serialization
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from app.api import queries
+from app.api.routes import get_trends, get_strategic_opportunities, get_quick_win_opportunities, update_idea
+from app.api.serializers import project, row_to_dict, IDEA_LIST_FIELDS, TREND_LIST_FIELDS
+from app.models.database import Idea, Trend
+from app.services.response_cache import response_cache
+
+
+@pytest.fixture
+def db(db):
+    """Shared database with a few ideas and trends"""
+    created = datetime(2026, 10, 1, 12, 0)
+    db.add_all([
+        Idea(title="Carbon ledger", description="d", channel="strategic", category="Climate",
+             overall_score=9.0, monetization_score=6.0, created_at=created, ai_reasoning="{}"),
+        Idea(title="Invoice bot", description="d", channel="quick-win", category="SaaS",
+             overall_score=8.0, monetization_score=9.0, estimated_startup_cost="$500", created_at=created),
+        Trend(keyword="SaaS", momentum_score=70.0, growth_rate=12.0, related_keywords=["b2b"],
+              detected_at=created, is_active=True, time_series_data=list(range(90))),
+    ])
+    db.commit()
+    return db
+
+
+def test_projection_selects_only_listed_columns(db):
+    """Test that list queries no longer read unlisted columns"""
+    sql = str(project(queries.ideas_query(db), IDEA_LIST_FIELDS).statement)
+
+    assert "ideas.notes" not in sql
+    assert "ideas.key_features" not in sql
+    assert "ideas.overall_score" in sql
+    assert "ORDER BY ideas.overall_score DESC" in sql
+
+
+def test_row_to_dict_matches_orm_serialization(db):
+    """Test that projected rows serialize like the ORM objects did"""
+    idea = db.query(Idea).filter(Idea.title == "Carbon ledger").one()
+    row = project(queries.ideas_query(db, channel="strategic"), IDEA_LIST_FIELDS).first()
+
+    expected = {key: getattr(idea, key) for key, _ in IDEA_LIST_FIELDS}
+    expected["created_at"] = idea.created_at.isoformat()
+    assert row_to_dict(row, IDEA_LIST_FIELDS) == expected
+
+
+def test_list_endpoints_return_projected_rows(db):
+    """Test the sync list endpoints end to end"""
+    trends = json.loads(get_trends(limit=20, min_momentum=None, db=db).body)
+    assert trends["trends"] == [{
+        "keyword": "SaaS",
+        "momentum_score": 70.0,
+        "growth_rate": 12.0,
+        "category": None,
+        "related_keywords": ["b2b"],
+        "detected_at": "2026-10-01T12:00:00"
+    }]
+    assert set(trends["trends"][0]) == {key for key, _ in TREND_LIST_FIELDS}
+
+    strategic = json.loads(get_strategic_opportunities(limit=10, db=db).body)
+    assert [o["title"] for o in strategic["opportunities"]] == ["Carbon ledger"]
+
+    quick_wins = json.loads(get_quick_win_opportunities(limit=10, db=db).body)
+    assert quick_wins["opportunities"][0]["estimated_startup_cost"] == "$500"
+
+
+def test_list_endpoints_are_cached_until_ideas_change(db):
+    """Test that repeat requests are served from the response cache until an idea is patched"""
+    first = get_strategic_opportunities(limit=10, db=db).body
+    db.add(Idea(title="Grid storage", description="d", channel="strategic", overall_score=9.5))
+    db.commit()
+
+    # Written without an invalidation: still the cached response
+    assert get_strategic_opportunities(limit=10, db=db).body == first
+    assert response_cache.stats()["endpoints"]["/opportunities/strategic"]["hits"] == 1
+
+    update_idea(1, {"favorite": True}, db=db)
+    titles = [o["title"] for o in json.loads(get_strategic_opportunities(limit=10, db=db).body)["opportunities"]]
+    assert titles == ["Grid storage", "Carbon ledger"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
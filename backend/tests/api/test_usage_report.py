@@ -0,0 +1,73 @@
+"""
+Tests for the /auth/usage daily usage report
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth import routes as auth_routes
+from app.models.database import User, APIKey, APIUsageDaily, get_db
+
+API_KEY = "shpx_usage"
+
+
+@pytest.fixture
+def client(session_factory):
+    """Auth API client with one user, an active and a revoked key, and old and recent rollups"""
+    db = session_factory()
+    user = User(email="founder@example.com", tier="indie", is_active=True)
+    db.add(user)
+    db.flush()
+    key = APIKey(key=API_KEY, user_id=user.id, is_active=True)
+    db.add_all([key, APIKey(key="shpx_revoked", user_id=user.id, is_active=False)])
+    db.flush()
+
+    today = datetime.utcnow().date()
+    db.add_all([
+        APIUsageDaily(day=today - timedelta(days=days_ago), user_id=user.id, api_key_id=key.id,
+                      endpoint="/api/ideas", method="GET", request_count=requests, error_count=0)
+        for days_ago, requests in ((1, 5), (100, 7), (400, 11))
+    ])
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app = FastAPI()
+    app.include_router(auth_routes.router, prefix="/api/auth")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_report_reaches_past_raw_row_retention(client):
+    """Test that daily rollups outlive raw rows, so days isn't capped by USAGE_RETENTION_DAYS"""
+    recent = client.get("/api/auth/usage", headers={"X-API-Key": API_KEY})
+    year = client.get("/api/auth/usage", params={"days": 365}, headers={"X-API-Key": API_KEY})
+
+    assert recent.status_code == 200
+    assert recent.json()["days"] == 30
+    assert recent.json()["total_requests"] == 5
+    assert year.status_code == 200
+    assert year.json()["total_requests"] == 12
+    assert [row["requests"] for row in year.json()["daily"]] == [5, 7]
+
+
+def test_report_validates_days_and_key(client):
+    """Test the days bounds and that revoked keys are rejected"""
+    assert client.get("/api/auth/usage", params={"days": 0}, headers={"X-API-Key": API_KEY}).status_code == 422
+    assert client.get(
+        "/api/auth/usage", params={"days": auth_routes.USAGE_REPORT_MAX_DAYS + 1}, headers={"X-API-Key": API_KEY}
+    ).status_code == 422
+    assert client.get("/api/auth/usage", headers={"X-API-Key": "shpx_revoked"}).status_code == 401
+    assert client.get("/api/auth/usage").status_code == 401
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Shared fixtures and factories for the backend tests
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.database import Base
+import app.studio.models  # noqa: F401  (registers Studio tables)
+from app.scrapers import trends_analyzer
+from app.services.response_cache import response_cache
+from app.services.scanner import ShapeXScanner
+
+
+def make_idea(title, description="desc", score=8.0, **overrides):
+    """Generated idea in the IdeaGenerator result format; overrides replace any field"""
+    idea = {
+        "title": title,
+        "description": description,
+        "category": "SaaS",
+        "channel": "strategic",
+        "target_market": "SMBs",
+        "revenue_model": "Subscription",
+        "estimated_time_to_build": "2-4 weeks",
+        "estimated_startup_cost": "$500",
+        "key_features": [],
+        "competitors": [],
+        "differentiation": "",
+        "feasibility_score": 8.0,
+        "market_demand_score": 8.0,
+        "monetization_score": 8.0,
+        "competition_score": 6.0,
+        "risk_score": 6.0,
+        "overall_score": score,
+        "ai_reasoning": "{}"
+    }
+    idea.update(overrides)
+    return idea
+
+
+@pytest.fixture
+def db():
+    """In-memory database session (the response cache starts empty)"""
+    response_cache.clear()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory on an in-memory database (one connection, usable from any thread)"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def scanner_config():
+    """Config for the scanner fixture; override in a module for other settings"""
+    return {"anthropic_api_key": "test"}
+
+
+@pytest.fixture
+def scanner(db, scanner_config, monkeypatch):
+    """Scanner on the db fixture without a Google Trends session"""
+    monkeypatch.setattr(trends_analyzer, "TrendReq", lambda **kwargs: None)
+    return ShapeXScanner(db, scanner_config)
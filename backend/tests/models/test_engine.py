@@ -0,0 +1,111 @@
+"""
+Tests for database engine profiles
+"""
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.models.engine import async_url, build_async_engine, build_engine, engine_options
+
+
+def test_sqlite_file_engine_applies_pragmas(tmp_path):
+    """Test that every connection runs in WAL with the tuned pragmas"""
+    engine = build_engine(f"sqlite:///{tmp_path / 'shapex.db'}")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+    assert isinstance(engine.pool, QueuePool)
+    engine.dispose()
+
+
+def test_pragmas_are_configurable(tmp_path, monkeypatch):
+    """Test that env settings override the defaults"""
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "FULL")
+    monkeypatch.setenv("DB_BUSY_TIMEOUT_MS", "250")
+    engine = build_engine(f"sqlite:///{tmp_path / 'shapex.db'}")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 2  # FULL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 250
+
+    engine.dispose()
+
+
+def test_reader_not_blocked_by_open_write_transaction(tmp_path):
+    """Test that a reader sees committed data while a writer holds its lock"""
+    engine = build_engine(f"sqlite:///{tmp_path / 'shapex.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE ideas (id INTEGER PRIMARY KEY, title TEXT)"))
+        conn.execute(text("INSERT INTO ideas (title) VALUES ('committed')"))
+
+    writer_holds_lock = threading.Event()
+    reader_done = threading.Event()
+
+    def write():
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO ideas (title) VALUES ('pending')"))
+            writer_holds_lock.set()
+            reader_done.wait(timeout=5)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    writer_holds_lock.wait(timeout=5)
+
+    with engine.connect() as conn:
+        titles = [row[0] for row in conn.execute(text("SELECT title FROM ideas"))]
+    reader_done.set()
+    writer.join()
+
+    assert titles == ["committed"]
+    engine.dispose()
+
+
+def test_in_memory_sqlite_shares_one_connection():
+    """Test that in-memory databases are visible from every thread"""
+    assert engine_options("sqlite://")["poolclass"] is StaticPool
+    assert engine_options("sqlite:///:memory:")["poolclass"] is StaticPool
+
+
+def test_postgres_profile_uses_pre_ping_and_recycle():
+    """Test the server database pool settings"""
+    options = engine_options("postgresql://shapex@localhost/shapex")
+
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == 1800
+    assert "connect_args" not in options
+
+
+def test_async_url_uses_async_driver():
+    """Test that sync URLs are mapped to their async driver"""
+    assert async_url("sqlite:///./data/shapex.db") == "sqlite+aiosqlite:///./data/shapex.db"
+    assert async_url("postgresql://shapex:secret@db/shapex") == "postgresql+asyncpg://shapex:secret@db/shapex"
+    assert async_url("sqlite+aiosqlite://") == "sqlite+aiosqlite://"
+
+    with pytest.raises(ValueError):
+        async_url("mysql://shapex@db/shapex")
+
+
+def test_async_engine_applies_pragmas(tmp_path):
+    """Test that async connections get the same SQLite profile"""
+    engine = build_async_engine(f"sqlite:///{tmp_path / 'shapex.db'}")
+
+    async def read_pragmas():
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+        await engine.dispose()
+        return journal_mode, busy_timeout
+
+    assert asyncio.run(read_pragmas()) == ("wal", 5000)
+    assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
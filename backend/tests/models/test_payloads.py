@@ -0,0 +1,145 @@
+"""
+Tests for payload side tables and compressed column types
+"""
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import database
+from app.models.database import Base, Idea, IdeaPayload, Trend, drop_legacy_columns, legacy_columns, migrate_db
+from app.models.types import COMPRESSED, RAW, pack, unpack
+from app.studio.models import AgentExecution, AgentExecutionOutput, StudioSession
+
+REASONING = json.dumps({"reasoning": "Agencies chase invoices by hand. " * 50})
+
+
+@pytest.fixture
+def engine():
+    """In-memory database"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_pack_compresses_large_values_only(monkeypatch):
+    """Test the stored format of payloads"""
+    large = REASONING.encode("utf-8")
+
+    assert pack(large)[:1] == COMPRESSED
+    assert len(pack(large)) < len(large) / 5
+    assert pack(b"short")[:1] == RAW
+    assert unpack(pack(large)) == large
+
+    monkeypatch.setenv("BLOB_COMPRESSION", "false")
+    assert pack(large)[:1] == RAW
+    assert unpack(pack(large)) == large
+
+
+def test_idea_payload_is_a_side_row_loaded_on_access(engine):
+    """Test that ai_reasoning round-trips without widening the ideas row"""
+    db = sessionmaker(bind=engine)()
+    db.add(Idea(title="Invoice bot", description="desc", ai_reasoning=REASONING))
+    db.commit()
+    db.close()
+
+    assert "ai_reasoning" not in str(select(Idea))
+    assert "ai_reasoning" not in {column["name"] for column in inspect(engine).get_columns("ideas")}
+
+    db = sessionmaker(bind=engine)()
+    idea = db.query(Idea).one()
+    assert "payload" not in idea.__dict__  # Not loaded by the list query
+    assert idea.ai_reasoning == REASONING
+    assert db.query(IdeaPayload).one().idea_id == idea.id
+
+    db.delete(idea)
+    db.commit()
+    assert db.query(IdeaPayload).count() == 0
+    db.close()
+
+
+def test_trend_series_and_agent_outputs_proxy_to_side_tables(engine):
+    """Test the trend series and agent output proxies"""
+    db = sessionmaker(bind=engine)()
+    trend = Trend(keyword="SaaS", time_series_data=[1, 2, 3])
+    db.add(trend)
+    db.add(StudioSession(session_id="s1", idea_id=1))
+    execution = AgentExecution(session_id="s1", agent_type="researcher")
+    execution.raw_output = "```json {} ```"
+    execution.structured_output = {"insights": {"opportunity_score": 8}}
+    db.add(execution)
+    db.commit()
+
+    trend.time_series_data = [4, 5]
+    db.commit()
+    db.expire_all()
+
+    assert db.query(Trend).one().time_series_data == [4, 5]
+    output = db.query(AgentExecutionOutput).one()
+    assert output.raw_output == "```json {} ```"
+    assert output.structured_output == {"insights": {"opportunity_score": 8}}
+    db.close()
+
+
+@pytest.fixture
+def legacy_engine():
+    """Database created before payloads moved to side tables"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE ideas (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, description TEXT NOT NULL, ai_reasoning TEXT)"))
+        conn.execute(text("CREATE TABLE trends (id INTEGER PRIMARY KEY, keyword VARCHAR(255) NOT NULL, time_series_data JSON)"))
+        conn.execute(text("INSERT INTO ideas (title, description, ai_reasoning) VALUES ('a', 'd', :r), ('b', 'd', NULL)"), {"r": REASONING})
+        conn.execute(text("INSERT INTO trends (keyword, time_series_data) VALUES ('SaaS', '[10, 20]')"))
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_migrate_copies_legacy_columns_without_dropping_them(legacy_engine):
+    """Test that startup migration moves payloads and leaves the legacy columns"""
+    assert legacy_columns(legacy_engine) == [("ideas", "ai_reasoning", 1, 0), ("trends", "time_series_data", 1, 0)]
+
+    migrate_db(legacy_engine)
+    migrate_db(legacy_engine)  # Idempotent
+
+    assert legacy_columns(legacy_engine) == [("ideas", "ai_reasoning", 1, 1), ("trends", "time_series_data", 1, 1)]
+    db = sessionmaker(bind=legacy_engine)()
+    ideas = {idea.title: idea for idea in db.query(Idea)}
+    assert ideas["a"].ai_reasoning == REASONING
+    assert ideas["b"].ai_reasoning is None
+    assert db.query(IdeaPayload).count() == 1
+    assert db.query(Trend).one().time_series_data == [10, 20]
+
+    # New rows only write the side tables
+    db.add(Idea(title="c", description="d", ai_reasoning="new"))
+    db.commit()
+    db.close()
+    migrate_db(legacy_engine)
+    assert legacy_columns(legacy_engine)[0] == ("ideas", "ai_reasoning", 1, 1)
+
+
+def test_drop_legacy_columns_is_an_explicit_checked_step(legacy_engine, monkeypatch):
+    """Test that the one-shot migration checks SQLite, migrates, then drops"""
+    monkeypatch.setattr(database, "MIN_SQLITE_DROP_COLUMN", (99, 0, 0))
+    with pytest.raises(RuntimeError, match="SQLite 3.35"):
+        drop_legacy_columns(legacy_engine)
+    assert "ai_reasoning" in {column["name"] for column in inspect(legacy_engine).get_columns("ideas")}
+
+    monkeypatch.undo()
+    monkeypatch.setattr(database, "migrate_db", lambda bind: None)
+    with pytest.raises(RuntimeError, match=r"ideas.ai_reasoning \(0 of 1 rows migrated\)"):
+        drop_legacy_columns(legacy_engine)
+
+    monkeypatch.undo()
+    assert drop_legacy_columns(legacy_engine) == [("ideas", "ai_reasoning"), ("trends", "time_series_data")]
+    assert drop_legacy_columns(legacy_engine) == []
+
+    assert "ai_reasoning" not in {column["name"] for column in inspect(legacy_engine).get_columns("ideas")}
+    assert "time_series_data" not in {column["name"] for column in inspect(legacy_engine).get_columns("trends")}
+    db = sessionmaker(bind=legacy_engine)()
+    assert {idea.title: idea.ai_reasoning for idea in db.query(Idea)} == {"a": REASONING, "b": None}
+    assert db.query(Trend).one().time_series_data == [10, 20]
+    db.close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
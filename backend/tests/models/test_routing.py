@@ -0,0 +1,149 @@
+"""
+Tests for read-replica routing
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, Idea, Trend
+from app.models.engine import build_async_engine, build_engine
+from app.models.routing import RoutingSession, write_tracker
+
+
+def seed(engine, title):
+    """One idea and one trend, told apart by which database they are in"""
+    db = sessionmaker(bind=engine)()
+    db.add(Idea(title=title, description="d"))
+    db.add(Trend(keyword=title))
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def urls(tmp_path):
+    """A primary and a replica database whose contents differ"""
+    urls = {
+        "primary": f"sqlite:///{tmp_path / 'primary.db'}",
+        "replica": f"sqlite:///{tmp_path / 'replica.db'}",
+    }
+    for name, url in urls.items():
+        engine = build_engine(url)
+        Base.metadata.create_all(engine)
+        seed(engine, name)
+        engine.dispose()
+
+    write_tracker.clear()
+    yield urls
+    write_tracker.clear()
+
+
+@pytest.fixture
+def Session(urls):
+    """Routing session factory with a 60 second replica lag window"""
+    return sessionmaker(
+        class_=RoutingSession,
+        primary=build_engine(urls["primary"]),
+        replica=build_engine(urls["replica"]),
+        lag_seconds=60
+    )
+
+
+def titles(db):
+    return [idea.title for idea in db.query(Idea).order_by(Idea.id)]
+
+
+def test_reads_go_to_replica_and_writes_to_primary(Session, urls):
+    """Test the basic split"""
+    db = Session()
+    assert titles(db) == ["replica"]
+    db.close()
+
+    db = Session()
+    db.add(Trend(keyword="written"))
+    db.commit()
+    db.close()
+
+    primary = sessionmaker(bind=build_engine(urls["primary"]))()
+    assert primary.query(Trend).filter(Trend.keyword == "written").count() == 1
+    primary.close()
+
+
+def test_session_reads_its_own_writes(Session):
+    """Test that tables written in a session are read from the primary"""
+    db = Session()
+    db.add(Idea(title="new", description="d"))
+    db.flush()
+
+    assert titles(db) == ["primary", "new"]
+    # Untouched tables still come from the replica
+    assert [trend.keyword for trend in db.query(Trend)] == ["replica"]
+    db.close()
+
+
+def test_recent_writes_pin_tables_to_primary_across_sessions(Session):
+    """Test read-your-writes for the next request within the lag window"""
+    db = Session()
+    db.add(Idea(title="new", description="d"))
+    db.commit()
+    db.close()
+
+    db = Session()
+    assert titles(db) == ["primary", "new"]
+    assert [trend.keyword for trend in db.query(Trend)] == ["replica"]
+    db.close()
+
+    db = Session(lag_seconds=0)
+    assert titles(db) == ["replica"]
+    db.close()
+
+
+def test_rolled_back_writes_are_not_published(Session):
+    """Test that only committed writes affect other sessions"""
+    db = Session()
+    db.add(Idea(title="discarded", description="d"))
+    db.flush()
+    db.rollback()
+    db.close()
+
+    db = Session()
+    assert titles(db) == ["replica"]
+    db.close()
+
+
+def test_without_replica_everything_uses_primary(urls):
+    """Test the fallback when no replica is configured"""
+    db = RoutingSession(primary=build_engine(urls["primary"]), replica=None)
+    assert titles(db) == ["primary"]
+    db.close()
+
+
+def test_async_sessions_route_through_sync_engines(urls):
+    """Test routing for AsyncSession read dependencies"""
+    primary = build_async_engine(urls["primary"])
+    replica = build_async_engine(urls["replica"])
+    Session = async_sessionmaker(
+        primary,
+        sync_session_class=RoutingSession,
+        primary=primary.sync_engine,
+        replica=replica.sync_engine,
+        lag_seconds=60
+    )
+
+    async def run():
+        async with Session() as db:
+            before = (await db.scalars(select(Idea.title))).all()
+            db.add(Idea(title="new", description="d"))
+            await db.commit()
+            after = (await db.scalars(select(Idea.title).order_by(Idea.id))).all()
+        await primary.dispose()
+        await replica.dispose()
+        return before, after
+
+    assert asyncio.run(run()) == (["replica"], ["primary", "new"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
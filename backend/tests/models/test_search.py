@@ -0,0 +1,97 @@
+"""
+Tests for the full-text index over ideas
+"""
+import pytest
+from sqlalchemy import text, update
+
+from app.api import queries
+from app.models.database import Idea, migrate_db
+from app.models.search import IDEA_FTS_TABLE, fts5_query, has_idea_search
+from app.services.bulk_ingest import bulk_update
+
+
+@pytest.fixture
+def db(db):
+    """Shared database with a few ideas"""
+    db.add_all([
+        Idea(title="Invoice chaser", description="Emails clients about unpaid bills", overall_score=6.0,
+             channel="quick-win", target_market="Freelancers"),
+        Idea(title="Cash flow forecast", description="Predicts invoice payment dates", overall_score=9.0,
+             channel="strategic", key_features=["bank sync", "scenario planning"]),
+        Idea(title="Recipe planner", description="Weekly meal plans", overall_score=7.0,
+             differentiation="Uses what is already in the fridge"),
+    ])
+    db.commit()
+    return db
+
+
+def search(db, q, **filters):
+    return [idea.title for idea in queries.search_ideas_query(db, q, **filters)]
+
+
+def test_fts5_query_quotes_user_input():
+    """Test that operators and punctuation are matched as plain words"""
+    assert fts5_query('invoice OR "bills') == '"invoice" "OR" "bills"*'
+    assert fts5_query(" -*() ") is None
+
+
+def test_search_ranks_title_matches_first(db):
+    """Test bm25 ranking with title weighted above description"""
+    assert search(db, "invoice") == ["Invoice chaser", "Cash flow forecast"]
+    assert search(db, "invoic") == ["Invoice chaser", "Cash flow forecast"]  # prefix
+    assert search(db, "fridge") == ["Recipe planner"]
+    assert search(db, "scenario") == ["Cash flow forecast"]
+    assert search(db, "freelancers bills") == ["Invoice chaser"]
+    assert search(db, "NEAR(") == []
+
+
+def test_search_applies_list_filters(db):
+    """Test channel and min_score filters on search results"""
+    assert search(db, "invoice", channel="strategic") == ["Cash flow forecast"]
+    assert search(db, "invoice", min_score=8) == ["Cash flow forecast"]
+
+
+def test_index_follows_inserts_updates_and_deletes(db):
+    """Test that the triggers keep the index in sync"""
+    db.add(Idea(title="Dental invoice audit", description="d"))
+    db.commit()
+    assert "Dental invoice audit" in search(db, "dental")
+
+    recipe = db.query(Idea).filter(Idea.title == "Recipe planner").one()
+    recipe.title = "Grocery planner"
+    db.commit()
+    assert search(db, "recipe") == []
+    assert search(db, "grocery") == ["Grocery planner"]
+
+    bulk_update(db, Idea, [{"id": recipe.id, "differentiation": "Pantry aware"}])
+    db.commit()
+    assert search(db, "fridge") == []
+    assert search(db, "pantry") == ["Grocery planner"]
+
+    # Unindexed columns don't fire the reindex trigger
+    db.execute(update(Idea).where(Idea.id == recipe.id).values(overall_score=1.0))
+    db.delete(recipe)
+    db.commit()
+    assert search(db, "grocery") == []
+
+    # Raises if the index no longer matches the ideas table
+    db.execute(text(f"INSERT INTO {IDEA_FTS_TABLE}({IDEA_FTS_TABLE}) VALUES ('integrity-check')"))
+
+
+def test_migrate_db_indexes_existing_ideas(db):
+    """Test that databases created before the index get it, populated"""
+    bind = db.get_bind()
+    db.execute(text(f"DROP TABLE {IDEA_FTS_TABLE}"))
+    for trigger in ("insert", "update", "delete"):
+        db.execute(text(f"DROP TRIGGER ideas_fts_{trigger}"))
+    db.commit()
+    assert not has_idea_search(bind)
+
+    migrate_db(bind)
+
+    assert has_idea_search(bind)
+    assert search(db, "invoice") == ["Invoice chaser", "Cash flow forecast"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
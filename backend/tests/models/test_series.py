@@ -0,0 +1,136 @@
+"""
+Tests for compact trend series storage and canonical trend rows
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, Trend, TrendSeries, drop_legacy_columns, legacy_columns, migrate_db
+from app.models.series import STEP_MONTH, decode_series, encode_series, merge_series, timeframe_window, trim_series
+from app.models.types import pack
+
+
+def daily(start_day, values):
+    start = datetime(2026, 10, 1) + timedelta(days=start_day)
+    return [{"date": str(start + timedelta(days=i)), "value": value} for i, value in enumerate(values)]
+
+
+def test_encode_round_trips_daily_monthly_and_bare_series():
+    """Test start date + step encoding for the Google Trends resolutions"""
+    points = daily(0, [40, 42, 39])
+    encoded = encode_series(points)
+    assert (encoded["start_date"], encoded["step_seconds"], encoded["points"]) == (datetime(2026, 10, 1), 86400, [40, 42, 39])
+    assert decode_series(**encoded) == points
+
+    monthly = [{"date": f"2026-{month:02d}-01", "value": month} for month in range(1, 13)]
+    encoded = encode_series(monthly)
+    assert encoded["step_seconds"] == STEP_MONTH
+    assert decode_series(**encoded)[-1] == {"date": "2026-12-01 00:00:00", "value": 12}
+
+    assert decode_series(**encode_series([1, 2])) == [1, 2]
+    assert decode_series(**encode_series(None)) is None
+
+
+def test_merge_appends_new_points_and_rescales_old_ones():
+    """Test incremental merge of overlapping fetches"""
+    stored = encode_series(daily(0, [10, 20, 30]))
+    merged = merge_series(stored, encode_series(daily(2, [60, 80])))
+
+    # Overlap on day 2 is 30 -> 60, so kept points double
+    assert merged["start_date"] == datetime(2026, 10, 1)
+    assert merged["points"] == [20, 40, 60, 80]
+
+    assert merge_series(stored, encode_series(daily(1, [10])))["points"] == [5, 10, 15]
+    assert merge_series(stored, encode_series(daily(0, [1, 2, 3, 4, 5])), max_points=3)["points"] == [3, 4, 5]
+
+
+def test_merge_without_overlap_replaces_stored_series():
+    """Test that fetches sharing no (non-zero) point can't be put on one scale"""
+    stored = encode_series(daily(0, [10, 20, 30]))
+    contiguous = encode_series(daily(3, [60, 80]))
+    assert merge_series(stored, contiguous) == contiguous
+
+    zeros = encode_series(daily(0, [0, 0, 0]))
+    assert merge_series(zeros, encode_series(daily(2, [50, 60]))) == encode_series(daily(2, [50, 60]))
+
+
+def test_merge_replaces_series_that_do_not_line_up():
+    """Test that gaps, other steps and undated values are replaced"""
+    stored = encode_series(daily(0, [10, 20, 30]))
+    gap = encode_series(daily(10, [1, 2]))
+    weekly = encode_series([{"date": "2026-10-01", "value": 1}, {"date": "2026-10-08", "value": 2}, {"date": "2026-10-15", "value": 3}])
+
+    assert merge_series(stored, gap) == gap
+    assert merge_series(stored, weekly) == weekly
+    assert merge_series(stored, encode_series([7, 8])) == encode_series([7, 8])
+    assert merge_series(None, gap) == gap
+
+
+def test_timeframe_window_and_trim():
+    """Test trimming a merged series to the window a timeframe covers"""
+    now = datetime(2026, 5, 31, 12)
+    assert timeframe_window("today 3-m", now) == (datetime(2026, 2, 28, 12), None)
+    assert timeframe_window("today 5-y", now) == (datetime(2021, 5, 31, 12), None)
+    assert timeframe_window("now 7-d", now) == (datetime(2026, 5, 24, 12), None)
+    assert timeframe_window("2026-01-01 2026-01-31", now) == (datetime(2026, 1, 1), datetime(2026, 2, 1))
+    assert timeframe_window("all", now) == (None, None)
+
+    points = daily(0, list(range(30)))  # 2026-10-01 .. 2026-10-30
+    as_of = datetime(2026, 10, 30, 18)
+    assert [p["value"] for p in trim_series(points, "now 7-d", as_of)] == list(range(22, 30))
+    assert [p["value"] for p in trim_series(points, "2026-10-03 2026-10-05", as_of)] == [2, 3, 4]
+    assert trim_series(points, "today 3-m", as_of) == points
+    assert trim_series(points, "all", as_of) == points
+    assert trim_series([1, 2, 3], "now 7-d", as_of) == [1, 2, 3]
+
+
+def test_packed_points_are_smaller_than_json(db, monkeypatch):
+    """Test the storage win over the JSON list of point dicts"""
+    monkeypatch.setenv("BLOB_COMPRESSION", "false")
+    points = daily(0, [(i * 7) % 100 for i in range(90)])
+    db.add(Trend(keyword="SaaS", time_series_data=points))
+    db.commit()
+
+    stored = db.execute(text("SELECT length(points) FROM trend_series")).scalar()
+    assert stored < len(str(points)) / 5
+    assert db.query(Trend).one().time_series_data == points
+
+
+def test_migrate_converts_json_series_and_deactivates_duplicates():
+    """Test existing databases: JSON series columns and one row per scan"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE trends (id INTEGER PRIMARY KEY, keyword VARCHAR(255) NOT NULL, source VARCHAR(100), "
+            "geo VARCHAR(10), last_updated DATETIME, is_active BOOLEAN)"
+        ))
+        conn.execute(text("CREATE TABLE trend_series (trend_id INTEGER PRIMARY KEY, time_series_data BLOB)"))
+        for day in range(3):
+            conn.execute(text(
+                "INSERT INTO trends (keyword, source, geo, last_updated, is_active) "
+                "VALUES ('SaaS', 'google_trends', 'US', :updated, 1)"
+            ), {"updated": datetime(2026, 10, 1 + day)})
+        conn.execute(text(
+            "INSERT INTO trends (keyword, source, geo, last_updated, is_active) VALUES ('fintech', 'google_trends', 'US', :updated, 1)"
+        ), {"updated": datetime(2026, 10, 1)})
+        conn.execute(text("INSERT INTO trend_series VALUES (3, :data)"), {"data": pack(b'[{"date": "2026-10-01", "value": 5}]')})
+
+    Base.metadata.create_all(engine)
+    migrate_db(engine)
+    migrate_db(engine)  # Idempotent
+
+    assert legacy_columns(engine) == [("trend_series", "time_series_data", 1, 1)]
+    assert drop_legacy_columns(engine) == [("trend_series", "time_series_data")]
+    assert "time_series_data" not in {column["name"] for column in inspect(engine).get_columns("trend_series")}
+    db = sessionmaker(bind=engine)()
+    active = db.query(Trend).filter(Trend.is_active == True).order_by(Trend.id).all()
+    assert [(trend.id, trend.keyword) for trend in active] == [(3, "SaaS"), (4, "fintech")]
+    assert active[0].time_series_data == [{"date": "2026-10-01 00:00:00", "value": 5}]
+    assert db.query(TrendSeries).one().step_seconds == 0
+    db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,3 @@
+"""
+Scraper tests
+"""
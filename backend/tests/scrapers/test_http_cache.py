@@ -0,0 +1,110 @@
+"""
+Tests for the conditional-GET page cache
+"""
+import httpx
+import pytest
+
+from app.scrapers.http_cache import HTTPCache
+from app.scrapers.http_client import FetchEngine
+
+URL = "https://example.com/rfs"
+
+
+class CountingParser:
+    """Records how many times BeautifulSoup-level parsing would run"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, html):
+        self.calls += 1
+        return [{"title": html}]
+
+
+def fetch(engine, parser):
+    return engine.run(engine.fetch_parsed(URL, parser, "test", source="default"))
+
+
+def test_not_modified_skips_parse(tmp_path):
+    """Test that a 304 reuses the cached parse result"""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="page", headers={"ETag": '"v1"'})
+
+    engine = FetchEngine(transport=httpx.MockTransport(handler), cache=HTTPCache(tmp_path))
+    parser = CountingParser()
+
+    assert fetch(engine, parser) == [{"title": "page"}]
+    assert fetch(engine, parser) == [{"title": "page"}]
+
+    assert parser.calls == 1
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+
+
+def test_last_modified_is_sent(tmp_path):
+    """Test that If-Modified-Since is sent when the server gave Last-Modified"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-Modified-Since"))
+        return httpx.Response(200, text="page", headers={"Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"})
+
+    engine = FetchEngine(transport=httpx.MockTransport(handler), cache=HTTPCache(tmp_path))
+    fetch(engine, CountingParser())
+    fetch(engine, CountingParser())
+
+    assert seen == [None, "Mon, 05 Oct 2026 10:00:00 GMT"]
+
+
+def test_unchanged_body_hash_skips_parse(tmp_path):
+    """Test that a 200 with an identical body is not parsed again"""
+    engine = FetchEngine(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="same")),
+        cache=HTTPCache(tmp_path)
+    )
+    parser = CountingParser()
+
+    fetch(engine, parser)
+    fetch(engine, parser)
+
+    assert parser.calls == 1
+
+
+def test_cached_parse_is_stamped_with_the_current_fetch(tmp_path):
+    """Test that a reused parse result doesn't replay the first fetch's scraped_at"""
+    engine = FetchEngine(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="same")),
+        cache=HTTPCache(tmp_path)
+    )
+
+    def parse(html):
+        return [{"title": html, "scraped_at": "2026-01-01T00:00:00"}]
+
+    first = fetch(engine, parse)
+    second = fetch(engine, parse)
+
+    assert first == [{"title": "same", "scraped_at": "2026-01-01T00:00:00"}]
+    assert second[0]["title"] == "same"
+    assert second[0]["scraped_at"] == HTTPCache(tmp_path).load(URL)["fetched_at"]
+
+
+def test_changed_body_is_parsed(tmp_path):
+    """Test that a changed page is parsed again"""
+    bodies = iter(["first", "second"])
+    engine = FetchEngine(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text=next(bodies))),
+        cache=HTTPCache(tmp_path)
+    )
+    parser = CountingParser()
+
+    assert fetch(engine, parser) == [{"title": "first"}]
+    assert fetch(engine, parser) == [{"title": "second"}]
+    assert parser.calls == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
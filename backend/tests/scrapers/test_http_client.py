@@ -0,0 +1,96 @@
+"""
+Tests for the shared async fetch engine
+"""
+import asyncio
+import httpx
+import pytest
+
+from app.scrapers.http_client import FetchEngine, RetryPolicy
+from app.scrapers.yc_scraper import YCombinatorScraper
+
+FAST_POLICIES = {
+    "default": RetryPolicy(max_attempts=3, backoff_base=0.01),
+}
+
+
+def test_retries_until_success():
+    """Test that retryable statuses are retried with the source policy"""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, text="ok")
+
+    engine = FetchEngine(policies=FAST_POLICIES, transport=httpx.MockTransport(handler))
+
+    assert engine.run(engine.get_text("https://example.com/")) == "ok"
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_attempts():
+    """Test that the last error is raised once attempts are exhausted"""
+    engine = FetchEngine(
+        policies=FAST_POLICIES,
+        transport=httpx.MockTransport(lambda request: httpx.Response(503))
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        engine.run(engine.get_text("https://example.com/"))
+
+
+def test_per_host_limit():
+    """Test that concurrent requests to one host are capped"""
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return httpx.Response(200, text=str(request.url))
+
+    engine = FetchEngine(per_host_limit=2, transport=httpx.MockTransport(handler))
+    urls = [f"https://example.com/{i}" for i in range(6)]
+
+    pages = engine.run(engine.fetch_many(urls))
+
+    assert pages == urls
+    assert state["peak"] == 2
+
+
+def test_fetch_many_returns_none_for_failures():
+    """Test that one failed page does not fail the batch"""
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text="page")
+
+    engine = FetchEngine(policies=FAST_POLICIES, transport=httpx.MockTransport(handler))
+
+    pages = engine.run(engine.fetch_many(["https://example.com/a", "https://example.com/missing"]))
+
+    assert pages == ["page", None]
+
+
+def test_yc_scraper_uses_engine():
+    """Test that the YC scraper parses RFS pages fetched through the engine"""
+    html = """
+    <html><body>
+      <h2>Developer tools for AI agents</h2>
+      <p>We want to fund tools that make agents reliable.</p>
+    </body></html>
+    """
+    engine = FetchEngine(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=html)))
+    scraper = YCombinatorScraper(engine=engine)
+
+    items = engine.run(scraper.scrape_rfs())
+
+    assert len(items) == 1
+    assert items[0]["title"] == "Developer tools for AI agents"
+    assert items[0]["source_type"] == "yc_rfs"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,145 @@
+"""
+Tests for batched Google Trends analysis
+"""
+import pandas as pd
+import pytest
+
+from app.scrapers import trends_analyzer
+from app.scrapers.trends_analyzer import TrendsAnalyzer
+
+DATES = pd.date_range("2025-01-05", periods=12, freq="W")
+
+# "True" search volume per keyword (absolute, not Google-normalized)
+VOLUMES = {
+    "SaaS": [40.0] * 12,
+    "AI automation": [20.0 + 5 * i for i in range(12)],
+    "fintech": [60.0] * 12,
+    "healthtech": [30.0 - i for i in range(12)],
+    "climate tech": [10.0] * 12,
+    "no-code tools": [80.0 + i for i in range(12)],
+    "remote work": [5.0] * 12,
+}
+
+
+class FakeTrendReq:
+    """pytrends stand-in that normalizes each payload to 0-100 like Google"""
+
+    def __init__(self, fail_terms=None, rate_limits=None):
+        self.payloads = []
+        self.fail_terms = set(fail_terms or [])
+        self.rate_limits = dict(rate_limits or {})  # term -> 429s before it succeeds
+        self.terms = []
+
+    def build_payload(self, kw_list, **kwargs):
+        self.terms = list(kw_list)
+        self.payloads.append(self.terms)
+
+    def interest_over_time(self):
+        limited = [term for term in self.terms if self.rate_limits.get(term)]
+        if limited:
+            for term in limited:
+                self.rate_limits[term] -= 1
+            raise Exception("The request failed: Google returned a response with code 429")
+        if self.fail_terms & set(self.terms):
+            raise Exception("The request failed: Google returned a response with code 400")
+        peak = max(max(VOLUMES[term]) for term in self.terms)
+        return pd.DataFrame(
+            {term: [round(v * 100 / peak) for v in VOLUMES[term]] for term in self.terms},
+            index=DATES
+        )
+
+    def related_queries(self):
+        return {
+            term: {"top": pd.DataFrame({"query": [f"{term} q{i}" for i in range(6)]})}
+            for term in self.terms
+        }
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(trends_analyzer, "TrendReq", lambda **kwargs: FakeTrendReq())
+    return TrendsAnalyzer()
+
+
+def test_groups_keywords_in_fives_around_anchor(analyzer):
+    """Each payload holds the anchor plus up to four keywords"""
+    keywords = list(VOLUMES)
+    results = analyzer.batch_analyze_grouped(keywords, anchor="SaaS", delay=0)
+
+    payloads = analyzer.pytrends.payloads
+    assert len(payloads) == 2
+    assert all(p[0] == "SaaS" and len(p) <= 5 for p in payloads)
+    assert [r["keyword"] for r in results] == keywords
+    assert all(len(r["related_keywords"]) == 5 for r in results)
+
+
+def test_rescales_groups_to_a_common_scale(analyzer):
+    """Averages are comparable across payloads after anchor rescaling"""
+    results = {
+        r["keyword"]: r
+        for r in analyzer.batch_analyze_grouped(list(VOLUMES), anchor="SaaS", delay=0)
+    }
+
+    # fintech and remote work are in different payloads; true ratio is 12x
+    # (loose tolerance: Google rounds each payload to integers)
+    ratio = results["fintech"]["average_interest"] / results["remote work"]["average_interest"]
+    assert ratio == pytest.approx(12, rel=0.15)
+    assert results["fintech"]["average_interest"] > results["SaaS"]["average_interest"]
+
+
+def test_growth_and_momentum_match_single_keyword_formula(analyzer):
+    """Vectorized metrics use the same recent/older window as analyze_keyword"""
+    result = analyzer.batch_analyze_grouped(["SaaS", "AI automation"], delay=0)[1]
+
+    assert result["growth_rate"] > 0
+    assert isinstance(result["momentum_score"], float)
+    assert result["momentum_score"] == pytest.approx(
+        result["recent_interest"] * (1 + result["growth_rate"] / 100), rel=0.01
+    )
+    assert len(result["time_series"]) == 12
+
+
+def test_failed_group_is_analyzed_per_keyword(monkeypatch):
+    """A failed payload's keywords are retried one at a time, not given fallback data"""
+    fake = FakeTrendReq(fail_terms={"remote work"})
+    monkeypatch.setattr(trends_analyzer, "TrendReq", lambda **kwargs: fake)
+    analyzer = TrendsAnalyzer()
+
+    results = analyzer.batch_analyze_grouped(list(VOLUMES), anchor="SaaS", delay=0)
+
+    by_keyword = {r["keyword"]: r for r in results}
+    assert "error" in by_keyword["remote work"]
+    assert not any(r.get("is_fallback") for r in results)
+    assert by_keyword["no-code tools"]["momentum_score"] > 0
+    assert "anchor" not in by_keyword["no-code tools"]
+    assert by_keyword["fintech"]["anchor"] == "SaaS"
+    assert fake.payloads[-2:] == [["no-code tools"], ["remote work"]]
+    assert len(results) == len(VOLUMES)
+
+
+def test_individual_fallback_backs_off_on_rate_limits(monkeypatch):
+    """Keywords analyzed one at a time are retried after a 429 like batch_analyze"""
+    fake = FakeTrendReq(rate_limits={"remote work": 4})
+    monkeypatch.setattr(trends_analyzer, "TrendReq", lambda **kwargs: fake)
+    analyzer = TrendsAnalyzer()
+
+    results = analyzer.batch_analyze_grouped(list(VOLUMES), anchor="SaaS", delay=0)
+
+    by_keyword = {r["keyword"]: r for r in results}
+    assert "error" not in by_keyword["remote work"]
+    assert by_keyword["remote work"]["average_interest"] > 0
+    assert fake.payloads[-2:] == [["remote work"], ["remote work"]]
+
+
+def test_group_with_zero_anchor_is_not_merged(analyzer, monkeypatch):
+    """Keywords can't be rescaled against an anchor without interest"""
+    monkeypatch.setitem(VOLUMES, "dead fad", [0.0] * 12)
+
+    results = analyzer.batch_analyze_grouped(["fintech", "remote work"], anchor="dead fad", delay=0)
+
+    assert [r["keyword"] for r in results] == ["fintech", "remote work"]
+    assert all("anchor" not in r and r["average_interest"] > 0 for r in results)
+    assert analyzer.pytrends.payloads[1:] == [["fintech"], ["remote work"]]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
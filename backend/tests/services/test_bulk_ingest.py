@@ -0,0 +1,98 @@
+"""
+Tests for the bulk ingest path
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models.database import Idea, Trend
+from app.services.bulk_ingest import bulk_insert, filter_ideas
+from tests.conftest import make_idea
+
+
+def test_bulk_ideas_keep_scan_filter_semantics(scanner, db):
+    """Test that bulk ingest and _save_ideas keep the same ideas"""
+    ideas = [
+        make_idea("kept", key_features=["billing"]),
+        make_idea("low feasibility", feasibility_score=5.9),
+        make_idea("low monetization", monetization_score=6.9),
+        make_idea("on the thresholds", feasibility_score=6.0, monetization_score=7.0),
+    ]
+    # The same ideas are saved twice on purpose
+    scanner.dedupe_ideas = False
+
+    bulk_ids = scanner.bulk_ingest_ideas(ideas)
+    saved = scanner._save_ideas(ideas)
+
+    titles = [idea.title for idea in db.query(Idea).filter(Idea.id.in_(bulk_ids)).order_by(Idea.id)]
+    assert titles == ["kept", "on the thresholds"]
+    assert [idea.title for idea in saved] == titles
+    assert saved[0].key_features == ["billing"]
+    assert saved[0].status == "new"
+
+
+def test_bulk_insert_returns_ids_in_input_order_across_chunks(db):
+    """Test RETURNING ids line up with the input rows"""
+    rows = [dict(keyword=f"kw{i}", source="import") for i in range(25)]
+
+    ids = bulk_insert(db, Trend, rows, chunk_size=7)
+    db.commit()
+
+    assert len(ids) == 25
+    assert [db.get(Trend, trend_id).keyword for trend_id in ids] == [row["keyword"] for row in rows]
+
+
+def test_bulk_trends_skip_errors_and_fallbacks(scanner, db):
+    """Test that only real analyses are ingested"""
+    ids = scanner.bulk_ingest_trends([
+        {"keyword": "SaaS", "momentum_score": 70.0, "growth_rate": 12.0, "time_series": [1, 2]},
+        {"keyword": "fintech", "error": "429"},
+        {"keyword": "healthtech", "momentum_score": 50.0, "is_fallback": True},
+    ])
+
+    trend = db.get(Trend, ids[0])
+    assert len(ids) == 1
+    assert (trend.keyword, trend.timeframe, trend.geo, trend.is_active) == ("SaaS", "today 3-m", "US", True)
+    assert trend.time_series_data == [1, 2]
+
+
+def test_trends_are_stored_on_one_canonical_row_per_key(scanner, db):
+    """Test that repeated scans update the row and merge the series"""
+    def analysis(momentum, days):
+        return {"keyword": "SaaS", "momentum_score": momentum, "growth_rate": 1.0,
+                "time_series": [{"date": f"2026-10-0{day}", "value": day * 10} for day in days]}
+
+    first = scanner.bulk_ingest_trends([analysis(50.0, [1, 2, 3])])
+    second = scanner.bulk_ingest_trends([analysis(60.0, [3, 4])], timeframe="today 1-m")
+    other_geo = scanner.bulk_ingest_trends([analysis(70.0, [1])], geo="GB")
+
+    assert first == second != other_geo
+    trend = db.get(Trend, first[0])
+    db.refresh(trend)
+    assert (trend.momentum_score, trend.timeframe) == (60.0, "today 1-m")
+    assert [point["value"] for point in trend.time_series_data] == [10, 20, 30, 40]
+    assert db.query(Trend).count() == 2
+
+
+def test_legacy_duplicate_trend_rows_are_deactivated(scanner, db):
+    """Test that older active rows for a key are retired on the next store"""
+    db.add_all([
+        Trend(keyword="SaaS", source="google_trends", geo="US", is_active=True, last_updated=datetime(2026, 1, day))
+        for day in (1, 2, 3)
+    ])
+    db.commit()
+
+    ids = scanner.bulk_ingest_trends([{"keyword": "SaaS", "momentum_score": 1.0}])
+
+    active = db.query(Trend).filter(Trend.is_active == True).all()
+    assert [trend.id for trend in active] == ids == [3]
+
+
+def test_filter_ideas_without_scanner():
+    """Test the shared threshold helper"""
+    kept = filter_ideas([make_idea("a"), make_idea("b", monetization_score=3.0)], 6.0, 7.0)
+    assert [idea["title"] for idea in kept] == ["a"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,67 @@
+"""
+Tests for the concurrent source collection stage
+"""
+import time
+import pytest
+from app.services.collector import SourceCollector
+
+
+def test_sources_run_concurrently():
+    """Test that wall-clock time tracks the slowest source, not the sum"""
+    collector = SourceCollector()
+    for name in ["a", "b", "c"]:
+        collector.add(name, lambda: time.sleep(0.3) or [{"ok": True}])
+
+    start = time.monotonic()
+    outcome = collector.collect()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.8
+    assert all(len(outcome["results"][name]) == 1 for name in ["a", "b", "c"])
+    assert outcome["errors"] == {}
+
+
+def test_failed_source_returns_partial_results():
+    """Test that a failing source does not drop the others"""
+    def broken():
+        raise RuntimeError("boom")
+
+    collector = SourceCollector()
+    collector.add("good", lambda: [1, 2, 3])
+    collector.add("bad", broken)
+
+    outcome = collector.collect()
+
+    assert outcome["results"]["good"] == [1, 2, 3]
+    assert outcome["results"]["bad"] == []
+    assert "boom" in outcome["errors"]["bad"]
+
+
+def test_source_timeout():
+    """Test that a slow source is cut off at its own timeout"""
+    collector = SourceCollector()
+    collector.add("slow", lambda: time.sleep(2) or [1], timeout=0.2)
+    collector.add("fast", lambda: [1])
+
+    start = time.monotonic()
+    outcome = collector.collect()
+
+    assert time.monotonic() - start < 1.5
+    assert outcome["results"]["slow"] == []
+    assert "timed out" in outcome["errors"]["slow"]
+    assert outcome["results"]["fast"] == [1]
+
+
+def test_async_source():
+    """Test that coroutine functions are awaited directly"""
+    async def fetch():
+        return ["async"]
+
+    collector = SourceCollector()
+    collector.add("coro", fetch)
+
+    assert collector.collect()["results"]["coro"] == ["async"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
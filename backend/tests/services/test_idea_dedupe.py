@@ -0,0 +1,97 @@
+"""
+Tests for near-duplicate handling when saving generated ideas
+"""
+import pytest
+
+from app.analyzers.similarity import idea_text, signature, unpack_signature
+from app.models.database import Idea, IdeaSignature
+from app.services import scanner as scanner_module
+from app.services.scanner import ShapeXScanner
+from tests.conftest import make_idea
+
+
+CODE_ASSISTANT = make_idea("AI code assistant", "An AI pair programmer that writes and reviews code for developers")
+PARAPHRASE = make_idea("AI coding assistant", "AI pair programmer that reviews and writes code for software developers")
+INVOICES = make_idea("Invoice chaser", "Emails clients about unpaid bills")
+
+
+def titles(db):
+    return [idea.title for idea in db.query(Idea).order_by(Idea.id)]
+
+
+def test_paraphrases_in_one_batch_keep_the_best(scanner, db):
+    """Test that only the highest scoring paraphrase is saved"""
+    saved = scanner._save_ideas([CODE_ASSISTANT, INVOICES, dict(PARAPHRASE, overall_score=9.0)])
+
+    assert [idea.title for idea in saved] == ["Invoice chaser", "AI coding assistant"]
+    assert titles(db) == ["Invoice chaser", "AI coding assistant"]
+
+
+def test_duplicates_of_stored_ideas_are_skipped_across_scans(scanner, db):
+    """Test that a later scan's paraphrase doesn't add a row"""
+    scanner._save_ideas([CODE_ASSISTANT])
+    later_scan = ShapeXScanner(db, {"anthropic_api_key": "test"})
+
+    assert later_scan._save_ideas([PARAPHRASE, INVOICES])[0].title == "Invoice chaser"
+    assert titles(db) == ["AI code assistant", "Invoice chaser"]
+
+
+def test_higher_scoring_duplicate_refreshes_stored_idea(scanner, db):
+    """Test the merge keeps the row and user fields but takes the better content"""
+    stored = scanner._save_ideas([CODE_ASSISTANT])[0]
+    stored.favorite = True
+    stored.notes = "call Sam"
+    db.commit()
+
+    assert scanner._save_ideas([dict(PARAPHRASE, overall_score=9.5)]) == []
+
+    idea = db.query(Idea).one()
+    assert (idea.id, idea.title, idea.overall_score) == (stored.id, "AI coding assistant", 9.5)
+    assert (idea.favorite, idea.notes, idea.status) == (True, "call Sam", "new")
+
+
+def test_deleted_ideas_no_longer_count_as_duplicates(scanner, db):
+    """Test that stale index entries are dropped"""
+    db.delete(scanner._save_ideas([CODE_ASSISTANT])[0])
+    db.commit()
+
+    assert [idea.title for idea in scanner._save_ideas([PARAPHRASE])] == ["AI coding assistant"]
+
+
+@pytest.mark.parametrize("scanner_config", [{"anthropic_api_key": "test", "enable_idea_dedupe": False}])
+def test_dedupe_can_be_disabled(scanner, db):
+    """Test ENABLE_IDEA_DEDUPE=false"""
+    scanner._save_ideas([CODE_ASSISTANT, PARAPHRASE])
+    assert len(titles(db)) == 2
+
+
+def test_later_scans_load_stored_signatures_instead_of_rehashing(scanner, db, monkeypatch):
+    """Test that signatures are saved with ideas (and merges) and read back by the next scan"""
+    scanner._save_ideas([CODE_ASSISTANT, INVOICES])
+    scanner._save_ideas([dict(PARAPHRASE, overall_score=9.5)])
+
+    stored = {row.idea_id: unpack_signature(row.minhash) for row in db.query(IdeaSignature)}
+    ideas = {idea.id: idea for idea in db.query(Idea)}
+    assert set(stored) == set(ideas)
+    for idea_id, sig in stored.items():
+        assert (sig == signature(idea_text(ideas[idea_id].title, ideas[idea_id].description))).all()
+
+    hashed = []
+    monkeypatch.setattr(scanner_module, "signature", lambda text: hashed.append(text) or signature(text))
+    index = ShapeXScanner(db, {"anthropic_api_key": "test"})._load_similarity_index()
+
+    assert len(index) == 2
+    assert hashed == []
+
+
+def test_ideas_stored_without_signatures_are_backfilled(scanner, db):
+    """Test that ideas saved before signatures were kept get one on the next scan"""
+    db.add(Idea(title=CODE_ASSISTANT["title"], description=CODE_ASSISTANT["description"], overall_score=8.0))
+    db.commit()
+
+    assert scanner._save_ideas([PARAPHRASE]) == []
+    assert db.query(IdeaSignature).count() == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,143 @@
+"""
+Tests for the materialized idea_stats summary behind /stats
+"""
+import json
+
+import pytest
+from sqlalchemy import event
+
+from app.api.routes import get_statistics, update_idea
+from app.models.database import Idea, IdeaStats, migrate_db, refresh_idea_stats
+from app.services import idea_stats
+from app.services.idea_stats import load_idea_totals, rebuild_idea_stats, summarize_ideas
+from tests.conftest import make_idea
+
+
+CODE_ASSISTANT = make_idea("AI code assistant", "An AI pair programmer that writes and reviews code for developers")
+PARAPHRASE = make_idea("AI coding assistant", "AI pair programmer that reviews and writes code for software developers")
+INVOICES = make_idea("Invoice chaser", "Emails clients about unpaid bills", 7.0)
+
+
+@pytest.fixture
+def scanner_config():
+    """Save ideas without score filters"""
+    return {"anthropic_api_key": "test", "min_feasibility_score": 0, "min_monetization_score": 0}
+
+
+def expected_stats(db):
+    """/stats ideas, scores and categories computed the old way, from every idea"""
+    ideas = db.query(Idea).all()
+    categories = {}
+    for idea in ideas:
+        categories[idea.category] = categories.get(idea.category, 0) + 1
+    top = sorted(categories.items(), key=lambda item: (-item[1], item[0] or ""))[:5]
+    average = lambda column: round(sum(getattr(i, column) for i in ideas) / len(ideas), 2) if ideas else 0
+    return {
+        "ideas": {
+            "total": len(ideas),
+            "strategic": sum(1 for i in ideas if i.channel == "strategic"),
+            "quick_wins": sum(1 for i in ideas if i.channel == "quick-win"),
+            "favorites": sum(1 for i in ideas if i.favorite),
+        },
+        "scores": {
+            "average_overall": average("overall_score"),
+            "average_feasibility": average("feasibility_score"),
+            "average_monetization": average("monetization_score"),
+        },
+        "categories": {"top": [{"name": name, "count": count} for name, count in top]},
+    }
+
+
+def summary_stats(db):
+    return summarize_ideas(load_idea_totals(db))
+
+
+def add_ideas(db):
+    db.add_all([
+        Idea(title="a", description="d", channel="strategic", category="SaaS", overall_score=9.0,
+             feasibility_score=7.0, monetization_score=6.0, favorite=True),
+        Idea(title="b", description="d", channel="quick-win", category="SaaS", overall_score=7.5,
+             feasibility_score=8.0, monetization_score=9.0),
+        Idea(title="c", description="d", channel="quick-win", category=None, overall_score=6.0,
+             feasibility_score=5.0, monetization_score=5.5),
+    ])
+    db.commit()
+
+
+def test_one_pass_aggregate_matches_full_scan(db):
+    """Test the unbuilt summary fallback and the rebuilt summary against per-idea math"""
+    add_ideas(db)
+    assert db.query(IdeaStats).count() == 0
+    assert summary_stats(db) == expected_stats(db)
+
+    assert rebuild_idea_stats(db) == 3
+    assert summary_stats(db) == expected_stats(db)
+
+
+def test_empty_database_stats(db):
+    """Test /stats on a database without ideas or scans"""
+    body = json.loads(get_statistics(db=db).body)
+    assert body["ideas"] == {"total": 0, "strategic": 0, "quick_wins": 0, "favorites": 0}
+    assert body["scores"]["average_overall"] == 0
+    assert body["last_scan"] is None
+
+
+def test_saves_merges_and_patches_keep_summary_in_step(db, scanner):
+    """Test incremental maintenance against a rebuild after every write path"""
+    rebuild_idea_stats(db)
+
+    scanner._save_ideas([CODE_ASSISTANT, INVOICES, make_idea("Grid storage", "Batteries for the grid", 6.5)])
+    assert summary_stats(db) == expected_stats(db)
+
+    # A better-scoring paraphrase is merged into the stored idea, moving its scores
+    scanner._save_ideas([{**PARAPHRASE, "overall_score": 9.5, "category": "DevTools", "feasibility_score": 6.0}])
+    assert db.query(Idea).count() == 3
+    assert summary_stats(db) == expected_stats(db)
+
+    scanner.bulk_ingest_ideas([make_idea("Fleet tracker", "Tracks delivery vans", 7.0)], dedupe=False)
+    update_idea(1, {"favorite": True}, db=db)
+    update_idea(2, {"status": "validated"}, db=db)
+    assert summary_stats(db) == expected_stats(db)
+
+    incremental = sorted(tuple(row) for row in load_idea_totals(db))
+    rebuild_idea_stats(db)
+    assert sorted(tuple(row) for row in load_idea_totals(db)) == pytest.approx(incremental)
+
+
+def test_startup_builds_summary_only_when_missing_or_outdated(db, monkeypatch):
+    """Test that migrate_db() doesn't rebuild a current summary, and the explicit rebuild does"""
+    add_ideas(db)
+    bind = db.get_bind()
+    migrate_db(bind)
+    assert summary_stats(db) == expected_stats(db)
+
+    # Drift from a write that bypassed record_idea_changes()
+    db.query(IdeaStats).update({IdeaStats.idea_count: 0})
+    db.commit()
+    assert refresh_idea_stats(bind) is False
+    assert summary_stats(db) != expected_stats(db)
+
+    assert refresh_idea_stats(bind, force=True) is True
+    assert summary_stats(db) == expected_stats(db)
+
+    monkeypatch.setattr(idea_stats, "IDEA_STATS_VERSION", idea_stats.IDEA_STATS_VERSION + 1)
+    assert refresh_idea_stats(bind) is True
+    assert refresh_idea_stats(bind) is False
+
+
+def test_stats_reads_summary_not_ideas(db, scanner):
+    """Test that /stats with a built summary never queries the ideas table"""
+    scanner._save_ideas([CODE_ASSISTANT, INVOICES])
+    migrate_db(db.get_bind())
+
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda conn, cursor, sql, *args: statements.append(sql))
+    body = json.loads(get_statistics(db=db).body)
+
+    assert body["ideas"]["total"] == 2
+    assert body["categories"]["top"] == [{"name": "SaaS", "count": 2}]
+    assert not [sql for sql in statements if "FROM ideas" in sql]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
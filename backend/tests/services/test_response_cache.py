@@ -0,0 +1,128 @@
+"""
+Tests for the response cache and its generation counters
+"""
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from app.services.response_cache import (
+    DatabaseGenerations,
+    ResponseCache,
+    IDEAS,
+    TRENDS,
+    cache_key,
+)
+
+
+def fetch(cache, endpoint, params, names, payload):
+    """respond() with a build that records whether it ran"""
+    calls = []
+
+    def build():
+        calls.append(1)
+        return payload
+
+    body = cache.respond(endpoint, params, names, build).body
+    return json.loads(body), bool(calls)
+
+
+def test_cache_key_ignores_order_and_unset_params():
+    """Test that equivalent query params share a key"""
+    assert cache_key("/ideas", {"limit": 50, "channel": "strategic", "cursor": None}) == \
+        cache_key("/ideas", {"channel": "strategic", "limit": 50})
+    assert cache_key("/ideas", {"limit": 50}) != cache_key("/ideas", {"limit": 20})
+    assert cache_key("/ideas", {"channel": "1"}) != cache_key("/ideas", {"channel": 1})
+
+
+def test_hit_until_generation_bumped():
+    """Test read-through hits, then a rebuild after invalidation"""
+    cache = ResponseCache()
+
+    assert fetch(cache, "/trends", {"limit": 20}, (TRENDS,), {"v": 1}) == ({"v": 1}, True)
+    assert fetch(cache, "/trends", {"limit": 20}, (TRENDS,), {"v": 2}) == ({"v": 1}, False)
+
+    cache.invalidate(IDEAS)  # unrelated generation
+    assert fetch(cache, "/trends", {"limit": 20}, (TRENDS,), {"v": 2}) == ({"v": 1}, False)
+
+    cache.invalidate(TRENDS)
+    assert fetch(cache, "/trends", {"limit": 20}, (TRENDS,), {"v": 2}) == ({"v": 2}, True)
+
+    stats = cache.stats()["endpoints"]["/trends"]
+    assert (stats["hits"], stats["misses"], stats["stale"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert cache.stats()["generations"] == {IDEAS: 1, TRENDS: 1}
+
+
+def test_write_during_build_is_not_cached_as_current():
+    """Test that an entry stamped before a write is stale afterwards"""
+    cache = ResponseCache()
+    key = cache.key("/ideas", {})
+
+    stamp = cache.stamp((IDEAS,))
+    cache.invalidate(IDEAS)  # lands while the old data is being read
+    cache.put(key, stamp, {"v": "old"})
+
+    assert cache.get(key, cache.stamp((IDEAS,))) is None
+
+
+def test_ttl_lru_and_disabled():
+    """Test expiry, eviction of the least recently used entry and the off switch"""
+    cache = ResponseCache(ttl_seconds=0.05, max_entries=2)
+    fetch(cache, "/a", {}, (IDEAS,), 1)
+    fetch(cache, "/b", {}, (IDEAS,), 2)
+    fetch(cache, "/a", {}, (IDEAS,), 1)  # /a is now most recent
+    fetch(cache, "/c", {}, (IDEAS,), 3)
+    assert fetch(cache, "/b", {}, (IDEAS,), 2)[1] is True
+    assert cache.stats()["entries"] == 2
+
+    time.sleep(0.06)
+    assert fetch(cache, "/c", {}, (IDEAS,), 3)[1] is True
+
+    disabled = ResponseCache(enabled=False)
+    assert fetch(disabled, "/a", {}, (IDEAS,), 1) == (1, True)
+    assert fetch(disabled, "/a", {}, (IDEAS,), 1) == (1, True)
+    assert disabled.stats()["entries"] == 0
+
+
+def test_database_generations_are_shared(session_factory):
+    """Test that a bump in one process invalidates another's entries"""
+    worker = ResponseCache(generations=DatabaseGenerations(session_factory, poll_seconds=0))
+    scanner = DatabaseGenerations(session_factory, poll_seconds=0)
+
+    fetch(worker, "/stats", {}, (IDEAS,), {"total": 1})
+    assert fetch(worker, "/stats", {}, (IDEAS,), {"total": 2})[1] is False
+
+    scanner.bump([IDEAS])
+    scanner.bump([IDEAS, TRENDS])
+
+    assert fetch(worker, "/stats", {}, (IDEAS,), {"total": 2}) == ({"total": 2}, True)
+    assert worker.stats()["shared"] is True
+    assert worker.stats()["generations"] == {IDEAS: 2, TRENDS: 1}
+
+
+def test_async_stamp_reads_shared_generations_off_the_event_loop(session_factory):
+    """Test that stamp_async() doesn't run the counter query on the loop's thread"""
+    threads = []
+
+    def recording_factory():
+        threads.append(threading.get_ident())
+        return session_factory()
+
+    cache = ResponseCache(generations=DatabaseGenerations(recording_factory, poll_seconds=0))
+    cache.invalidate(IDEAS)
+    threads.clear()
+
+    async def stamp():
+        return threading.get_ident(), await cache.stamp_async((IDEAS,))
+
+    loop_thread, stamp = asyncio.run(stamp())
+    assert stamp == ((IDEAS,), (1,))
+    assert threads and loop_thread not in threads
+    assert asyncio.run(ResponseCache().stamp_async((IDEAS,))) == ((IDEAS,), (0,))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,140 @@
+"""
+Tests for scan stage checkpoints and resume
+"""
+import pytest
+
+from app.models.database import Idea, ScanJob, ScanCheckpoint
+from app.services.scan_events import ScanEventManager
+from tests.conftest import make_idea
+
+
+@pytest.fixture
+def scanner(scanner):
+    """Shared scanner with its own events, stubbed collection, a quick-win
+    channel that fails once and a save stage that can be made to crash once"""
+    scanner.events = ScanEventManager()
+    scanner.calls = {"collect": 0, "channels": []}
+    scanner.failing_channels = {"quick-win"}
+    scanner.crash_save = False
+
+    def collect():
+        scanner.calls["collect"] += 1
+        return {
+            "vc_sources": [{"title": "RFS"}],
+            "product_hunt_data": [],
+            "trends": [{"keyword": "SaaS", "momentum_score": 60.0}],
+            "source_changes": {"inserted": 1, "updated": 0, "unchanged": 0},
+            "errors": {},
+            "durations": {}
+        }
+
+    def generate_channels(prompts, count=5):
+        scanner.calls["channels"].append(sorted(prompts))
+        first_call = len(scanner.calls["channels"]) == 1
+        results = {}
+        for channel in prompts:
+            if channel in scanner.failing_channels and first_call:
+                results[channel] = {"ideas": [], "metrics": {"error": "overloaded"}}
+            else:
+                results[channel] = {
+                    "ideas": [make_idea(f"{channel} idea", score=7.7, channel=channel)],
+                    "metrics": {"latency_seconds": 1.0, "total_tokens": 100}
+                }
+        return results
+
+    save_ideas = scanner._save_ideas
+
+    def save(ideas):
+        if scanner.crash_save:
+            scanner.crash_save = False
+            raise RuntimeError("disk full")
+        return save_ideas(ideas)
+
+    scanner._collect_sources = collect
+    scanner.idea_generator.generate_channels = generate_channels
+    scanner._save_ideas = save
+    return scanner
+
+
+def test_failed_channel_is_recorded_without_failing_the_scan(scanner, db):
+    """Test that the other channel's ideas are saved and the failed channel isn't checkpointed"""
+    result = scanner.run_full_scan()
+
+    assert result["success"]
+    assert result["ideas_generated"] == 1
+    assert result["channel_metrics"]["quick-win"]["error"] == "overloaded"
+    assert result["top_ideas"][0]["channel"] == "strategic"
+
+    stages = {c.stage for c in db.query(ScanCheckpoint).filter(ScanCheckpoint.job_id == result["job_id"])}
+    assert stages == {"collect", "generate:strategic", "save"}
+    assert db.get(ScanJob, result["job_id"]).status == "completed"
+
+
+def test_scan_fails_when_every_channel_fails(scanner, db):
+    """Test that a scan without any generated channel fails and keeps collection"""
+    scanner.failing_channels = {"strategic", "quick-win"}
+    result = scanner.run_full_scan()
+
+    assert not result["success"]
+    assert "strategic (overloaded)" in result["error"] and "quick-win (overloaded)" in result["error"]
+    assert result["completed_stages"] == ["collect"]
+    assert db.get(ScanJob, result["job_id"]).status == "failed"
+
+
+def test_resume_repeats_only_incomplete_stages(scanner, db):
+    """Test that resume skips collection and successful channels, and retries failed ones"""
+    scanner.crash_save = True
+    failed = scanner.run_full_scan()
+    assert not failed["success"]
+    assert sorted(failed["completed_stages"]) == ["collect", "generate:strategic"]
+    assert db.query(Idea).count() == 0
+
+    result = scanner.resume_scan(failed["job_id"])
+
+    assert result["success"]
+    assert result["ideas_generated"] == 2
+    assert sorted(result["resumed_stages"]) == ["collect", "generate:strategic"]
+    assert scanner.calls["collect"] == 1
+    assert scanner.calls["channels"] == [["quick-win", "strategic"], ["quick-win"]]
+
+    stages = {c.stage for c in db.query(ScanCheckpoint).filter(ScanCheckpoint.job_id == failed["job_id"])}
+    assert stages == {"collect", "generate:strategic", "generate:quick-win", "save"}
+    assert set(result["channel_metrics"]) == {"strategic", "quick-win"}
+    assert "error" not in result["channel_metrics"]["quick-win"]
+
+
+def test_stages_publish_progress_events(scanner):
+    """Test that a failed run and its resume stream stage events"""
+    scanner.crash_save = True
+    failed = scanner.run_full_scan()
+    scanner.resume_scan(failed["job_id"])
+
+    events = scanner.events.snapshot(failed["job_id"])
+    summary = [(e["type"], e.get("stage")) for e in events]
+
+    assert summary[:9] == [
+        ("scan_started", None),
+        ("stage_started", "collect"),
+        ("stage_finished", "collect"),
+        ("stage_started", "generate:strategic"),
+        ("stage_started", "generate:quick-win"),
+        ("stage_finished", "generate:strategic"),
+        ("stage_failed", "generate:quick-win"),
+        ("stage_started", "save"),
+        ("scan_failed", None),
+    ]
+    assert summary[-1] == ("scan_completed", None)
+    assert [e for e in events if e["type"] == "stage_finished" and e["stage"] == "save"][0]["ideas_saved"] == 2
+
+
+def test_only_failed_scans_can_be_resumed(scanner, db):
+    """Test that completed or unknown jobs are rejected"""
+    completed = scanner.run_full_scan()
+    assert completed["success"]
+
+    assert not scanner.resume_scan(completed["job_id"])["success"]
+    assert not scanner.resume_scan(9999)["success"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,152 @@
+"""
+Tests for single-flight scan coordination
+"""
+import threading
+
+import pytest
+
+from app.models.database import ScanJob
+from app.api.routes import get_scanner_config
+from app.services.scan_coordinator import SCAN_CONFIG_KEYS, ScanCoordinator, config_fingerprint
+from app.services.scan_events import ScanEventManager
+
+
+class FakeScanner:
+    """Blocks until released and records which jobs it ran"""
+
+    def __init__(self, db, config, release, ran):
+        self.db = db
+        self.config = config
+        self.release = release
+        self.ran = ran
+
+    def run_full_scan(self, job_type="manual", job_id=None):
+        self.release.wait(timeout=5)
+        job = self.db.query(ScanJob).filter(ScanJob.id == job_id).first()
+        job.status = "completed"
+        self.db.commit()
+        self.ran.append((job_id, self.config.get("max_ideas_per_channel")))
+        return {"success": True, "job_id": job_id, "ideas_generated": 3}
+
+    def resume_scan(self, job_id):
+        return {"success": False, "error": f"Scan job {job_id} is completed, only failed scans can be resumed"}
+
+
+@pytest.fixture
+def coordinator(session_factory):
+    """Coordinator on the shared in-memory database with a gated fake scanner"""
+    release = threading.Event()
+    ran = []
+    coordinator = ScanCoordinator(
+        session_factory=session_factory,
+        scanner_factory=lambda db, config: FakeScanner(db, config, release, ran),
+        events=ScanEventManager()
+    )
+    coordinator.release = release
+    coordinator.ran = ran
+    coordinator.Session = session_factory
+    return coordinator
+
+
+def test_duplicate_triggers_attach_to_running_scan(coordinator):
+    """Test that repeated triggers share one job"""
+    config = {"max_ideas_per_channel": 5, "anthropic_api_key": "a"}
+
+    first = coordinator.submit(config)
+    duplicates = [coordinator.submit({**config, "anthropic_api_key": "b"}) for _ in range(4)]
+
+    assert first["status"] == "started"
+    assert all(d == {"status": "attached", "job_id": first["job_id"]} for d in duplicates)
+
+    coordinator.release.set()
+    assert coordinator.wait(first["job_id"], timeout=5)["success"]
+    assert coordinator.ran == [(first["job_id"], 5)]
+
+    db = coordinator.Session()
+    assert db.query(ScanJob).count() == 1
+    db.close()
+
+
+def test_different_config_is_busy_unless_queued(coordinator):
+    """Test that a different config is rejected or runs after the current scan"""
+    first = coordinator.submit({"max_ideas_per_channel": 5})
+
+    busy = coordinator.submit({"max_ideas_per_channel": 3})
+    queued = coordinator.submit({"max_ideas_per_channel": 3}, queue=True)
+    queued_again = coordinator.submit({"max_ideas_per_channel": 3}, queue=True)
+
+    assert busy == {"status": "busy", "job_id": first["job_id"]}
+    assert queued["status"] == "queued"
+    assert queued_again == {"status": "attached", "job_id": queued["job_id"]}
+
+    db = coordinator.Session()
+    assert db.query(ScanJob).filter(ScanJob.id == queued["job_id"]).first().status == "queued"
+    db.close()
+
+    coordinator.release.set()
+    assert coordinator.wait(queued["job_id"], timeout=5)["success"]
+    assert coordinator.ran == [(first["job_id"], 5), (queued["job_id"], 3)]
+    assert coordinator.get_running() is None
+
+
+def test_run_and_wait_returns_attached_scan_result(coordinator):
+    """Test that a scheduled scan waits for the manual scan in flight"""
+    config = {"max_ideas_per_channel": 5}
+    manual = coordinator.submit(config)
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(coordinator.run_and_wait(config, job_type="daily")))
+    waiter.start()
+    coordinator.release.set()
+    waiter.join(timeout=5)
+
+    assert results[0]["job_id"] == manual["job_id"]
+    assert len(coordinator.ran) == 1
+
+
+def test_refused_resume_ends_the_event_stream(coordinator):
+    """Test that a resume the scanner refuses still publishes scan_failed"""
+    coordinator.release.set()
+    job_id = coordinator.submit({})["job_id"]
+    coordinator.wait(job_id, timeout=5)
+    coordinator.events.publish(job_id, "scan_completed")
+
+    coordinator.submit({}, resume_job_id=job_id)
+    result = coordinator.wait(job_id, timeout=5)
+
+    assert not result["success"]
+    assert [e["type"] for e in coordinator.events.snapshot(job_id)] == ["scan_completed", "scan_failed"]
+
+
+def test_fingerprint_ignores_secrets_and_schedule():
+    """Test that only scan-relevant config distinguishes scans"""
+    base = {"max_ideas_per_channel": 5}
+    assert config_fingerprint(base) == config_fingerprint({**base, "anthropic_api_key": "x", "daily_scan_time": "10:00"})
+    assert config_fingerprint(base) != config_fingerprint({"max_ideas_per_channel": 4})
+
+
+def test_scheduler_and_manual_configs_share_fingerprint(monkeypatch):
+    """Test that the scheduler's config (scanner keys plus schedule, rollup and
+    notification settings, as built in main.py) fingerprints like get_scanner_config()"""
+    monkeypatch.setenv("MAX_IDEAS_PER_CHANNEL", "3")
+    monkeypatch.setenv("TRENDS_GEO", "GB")
+    manual = get_scanner_config()
+    scheduled = {
+        **manual,
+        "enable_scheduled_scans": True,
+        "daily_scan_time": "09:00",
+        "weekly_report_day": "friday",
+        "weekly_report_time": "17:00",
+        "telegram_bot_token": "token",
+        "telegram_user_id": "42",
+        "enable_telegram": True,
+        "usage_rollup_interval_minutes": 15,
+        "usage_retention_days": 30,
+    }
+
+    assert config_fingerprint(scheduled) == config_fingerprint(manual)
+    assert set(SCAN_CONFIG_KEYS) == set(manual) - {"anthropic_api_key", "product_hunt_api_key"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
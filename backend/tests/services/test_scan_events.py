@@ -0,0 +1,166 @@
+"""
+Tests for scan progress events and the scan progress WebSocket
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.api import routes
+from app.models.database import Base, ScanJob, get_db, get_async_db
+from app.models.engine import build_engine, build_async_engine
+from app.services.scan_coordinator import ScanCoordinator
+from app.services.scan_events import ScanEventManager
+
+
+def test_publish_from_thread_reaches_subscriber():
+    """Test that events published by a scan thread arrive on the loop"""
+    events = ScanEventManager()
+
+    async def listen():
+        queue, snapshot = events.subscribe(1)
+        thread = threading.Thread(target=events.publish, args=(1, "stage_started"), kwargs={"stage": "collect"})
+        thread.start()
+        event = await asyncio.wait_for(queue.get(), timeout=2)
+        thread.join()
+        events.unsubscribe(1, queue)
+        return snapshot, event
+
+    snapshot, event = asyncio.run(listen())
+
+    assert snapshot == []
+    assert event["type"] == "stage_started"
+    assert event["stage"] == "collect"
+    assert events.get_subscriber_count() == 0
+
+
+def test_history_is_bounded_per_job_and_across_jobs():
+    """Test that old events and old jobs are dropped"""
+    events = ScanEventManager(max_jobs=2, max_events_per_job=3)
+
+    for i in range(5):
+        events.publish(1, "tick", i=i)
+    events.publish(2, "tick")
+    events.publish(3, "tick")
+
+    assert events.snapshot(1) == []
+    assert len(events.snapshot(2)) == 1
+    assert [e["seq"] for e in events.snapshot(3)] == [7]
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """API client on a temporary database with an isolated event manager"""
+    url = f"sqlite:///{tmp_path / 'shapex.db'}"
+    engine = build_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    AsyncSession = async_sessionmaker(build_async_engine(url), expire_on_commit=False)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    events = ScanEventManager()
+    monkeypatch.setattr(routes, "scan_events", events)
+
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    client = TestClient(app)
+    client.session_factory = Session
+    client.events = events
+    return client
+
+
+def test_websocket_sends_snapshot_then_live_events(client):
+    """Test that a subscriber gets past events, then new ones until completion"""
+    db = client.session_factory()
+    job = ScanJob(job_type="manual", status="running")
+    db.add(job)
+    db.commit()
+    job_id = job.id
+    db.close()
+
+    client.events.publish(job_id, "scan_started", job_type="manual")
+
+    with client.websocket_connect(f"/api/scan/ws/{job_id}") as websocket:
+        snapshot = websocket.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["status"] == "running"
+        assert [e["type"] for e in snapshot["events"]] == ["scan_started"]
+
+        client.events.publish(job_id, "stage_finished", stage="collect", vc_sources=3)
+        client.events.publish(job_id, "scan_completed", ideas_generated=2)
+
+        assert websocket.receive_json()["stage"] == "collect"
+        assert websocket.receive_json()["type"] == "scan_completed"
+
+
+def test_websocket_finished_job_sends_snapshot_only(client):
+    """Test that a completed job's socket closes after the snapshot"""
+    db = client.session_factory()
+    job = ScanJob(job_type="daily", status="completed")
+    db.add(job)
+    db.commit()
+    job_id = job.id
+    db.close()
+
+    with client.websocket_connect(f"/api/scan/ws/{job_id}") as websocket:
+        snapshot = websocket.receive_json()
+        assert snapshot["status"] == "completed"
+        assert snapshot["events"] == []
+
+
+class CrashingScanner:
+    """Raises once released, before publishing any event"""
+
+    def __init__(self, release):
+        self.release = release
+
+    def run_full_scan(self, job_type="manual", job_id=None):
+        self.release.wait(timeout=5)
+        raise RuntimeError("scanner exploded")
+
+
+def test_websocket_closes_when_scanner_crashes(client):
+    """Test that a coordinated scan that crashes ends its progress stream"""
+    release = threading.Event()
+    coordinator = ScanCoordinator(
+        session_factory=client.session_factory,
+        scanner_factory=lambda db, config: CrashingScanner(release),
+        events=client.events
+    )
+    job_id = coordinator.submit({})["job_id"]
+
+    with client.websocket_connect(f"/api/scan/ws/{job_id}") as websocket:
+        assert websocket.receive_json()["status"] == "running"
+
+        release.set()
+        event = websocket.receive_json()
+        assert event["type"] == "scan_failed"
+        assert event["error"] == "scanner exploded"
+
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    db = client.session_factory()
+    assert db.query(ScanJob).filter(ScanJob.id == job_id).first().status == "failed"
+    db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""
+Tests for source URL normalization and content-hash upserts
+"""
+import pytest
+
+from app.models.database import Source
+from app.services.sources import normalize_url, source_key, upsert_sources
+
+
+def test_normalize_url_drops_volatile_parts():
+    """Test that cache-busting and tracking parameters are ignored"""
+    assert normalize_url("HTTPS://A16Z.com:443/focus/fintech/?ts=2026-10-01T00:00:00&utm_source=x#top") == \
+        "https://a16z.com/focus/fintech"
+    assert normalize_url("https://example.com/post?b=2&a=1") == "https://example.com/post?a=1&b=2"
+
+
+def test_shared_page_items_get_distinct_keys():
+    """Test that RFS sections on one page do not collide"""
+    first = {"source_type": "yc_rfs", "url": "https://www.ycombinator.com/rfs", "title": "AI for science"}
+    second = {"source_type": "yc_rfs", "url": "https://www.ycombinator.com/rfs", "title": "Stablecoin finance"}
+
+    assert source_key(first) != source_key(second)
+    assert source_key(first) == "https://www.ycombinator.com/rfs#ai-for-science"
+
+
+def test_repeated_scans_do_not_grow_table(db):
+    """Test that re-ingesting the same items updates in place"""
+    items = [
+        {"source_type": "a16z_focus", "url": "https://a16z.com/focus/fintech?ts=1", "title": "Fintech", "description": "Payments"},
+        {"source_type": "yc_blog", "url": "https://www.ycombinator.com/blog/post", "title": "Post", "description": "Body"},
+    ]
+
+    assert upsert_sources(db, items)["inserted"] == 2
+
+    items[0]["url"] = "https://a16z.com/focus/fintech?ts=2"
+    stats = upsert_sources(db, items)
+
+    assert stats == {"inserted": 0, "updated": 0, "unchanged": 2}
+    assert db.query(Source).count() == 2
+
+
+def test_only_changed_sources_are_reprocessed(db):
+    """Test that is_processed is reset only when content changes"""
+    items = [
+        {"source_type": "yc_blog", "url": "https://www.ycombinator.com/blog/a", "title": "A", "description": "one"},
+        {"source_type": "yc_blog", "url": "https://www.ycombinator.com/blog/b", "title": "B", "description": "two"},
+    ]
+    upsert_sources(db, items)
+    db.query(Source).update({Source.is_processed: True})
+    db.commit()
+
+    items[1]["description"] = "two, revised"
+    stats = upsert_sources(db, items)
+
+    assert stats["updated"] == 1
+    processed = {s.title: s.is_processed for s in db.query(Source)}
+    assert processed == {"A": True, "B": False}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""
+Tests for the Trend-table backed trend cache
+"""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.database import Trend
+from app.services.trend_cache import TrendCache
+
+
+class FakeFetch:
+    """Records fetched keywords and returns a deterministic analysis"""
+
+    def __init__(self, momentum=50.0, gate=None):
+        self.calls = []
+        self.momentum = momentum
+        self.gate = gate
+
+    def __call__(self, keywords, timeframe, geo):
+        self.calls.append(list(keywords))
+        if self.gate:
+            self.gate.wait(timeout=5)
+        return [
+            {
+                "keyword": k,
+                "growth_rate": 10.0,
+                "momentum_score": self.momentum,
+                "related_keywords": [f"{k} tools"],
+                "time_series": [{"date": "2026-10-01", "value": 40}]
+            }
+            for k in keywords
+        ]
+
+
+def test_miss_fetches_and_stores_one_row_per_key(session_factory):
+    """Test that a cold cache fetches synchronously and persists the key"""
+    fetch = FakeFetch()
+    cache = TrendCache(fetch, ttl_hours=24, session_factory=session_factory)
+
+    results = cache.get(["SaaS", "fintech"], "today 3-m", "US")
+    again = cache.get(["SaaS", "fintech"], "today 3-m", "US")
+
+    assert [r["keyword"] for r in results] == ["SaaS", "fintech"]
+    assert fetch.calls == [["SaaS", "fintech"]]
+    assert all(r["cached"] and not r["stale"] for r in again)
+
+    db = session_factory()
+    rows = db.query(Trend).all()
+    assert len(rows) == 2
+    assert {(r.timeframe, r.geo) for r in rows} == {("today 3-m", "US")}
+    db.close()
+
+
+def test_key_includes_timeframe_and_geo(session_factory):
+    """Test that a different timeframe or region is a separate entry"""
+    fetch = FakeFetch()
+    cache = TrendCache(fetch, ttl_hours=24, session_factory=session_factory)
+
+    cache.get(["SaaS"], "today 3-m", "US")
+    cache.get(["SaaS"], "today 12-m", "US")
+    cache.get(["SaaS"], "today 3-m", "GB")
+
+    assert len(fetch.calls) == 3
+
+
+def test_stale_served_immediately_and_refreshed_in_background(session_factory):
+    """Test that stale rows are returned while one background refresh runs"""
+    db = session_factory()
+    db.add(Trend(
+        keyword="SaaS", source="google_trends", timeframe="today 3-m", geo="US",
+        momentum_score=10.0, last_updated=datetime.utcnow() - timedelta(days=3)
+    ))
+    db.commit()
+    db.close()
+
+    gate = threading.Event()
+    fetch = FakeFetch(momentum=90.0, gate=gate)
+    cache = TrendCache(fetch, ttl_hours=24, session_factory=session_factory)
+
+    results = cache.get(["SaaS"], "today 3-m", "US")
+    assert results[0]["momentum_score"] == 10.0
+    assert results[0]["stale"]
+
+    # A second scan while the refresh is in flight does not start another
+    assert cache.refresh_in_background(["SaaS"], "today 3-m", "US") is None
+
+    gate.set()
+    for thread in threading.enumerate():
+        if thread.name == "shapex-trend-refresh":
+            thread.join(timeout=5)
+
+    assert fetch.calls == [["SaaS"]]
+    refreshed = cache.get(["SaaS"], "today 3-m", "US")[0]
+    assert refreshed["momentum_score"] == 90.0
+    assert not refreshed["stale"]
+
+
+def test_cached_series_is_trimmed_to_the_timeframe(session_factory):
+    """Test that a long merged series is served only for the requested window"""
+    updated = datetime.utcnow()
+    start = updated - timedelta(days=199)
+    db = session_factory()
+    trend = Trend(
+        keyword="SaaS", source="google_trends", timeframe="now 7-d", geo="US",
+        momentum_score=10.0, last_updated=updated
+    )
+    trend.time_series_data = [{"date": str(start + timedelta(days=i)), "value": i % 100} for i in range(200)]
+    db.add(trend)
+    db.commit()
+    db.close()
+
+    cache = TrendCache(FakeFetch(), ttl_hours=24, session_factory=session_factory)
+    series = cache.get(["SaaS"], "now 7-d", "US")[0]["time_series"]
+
+    assert len(series) == 8
+    assert series[-1]["date"] == str(updated)
+
+
+def test_fallback_results_are_not_cached(session_factory):
+    """Test that estimated data never masks a real Trends query"""
+    def fetch(keywords, timeframe, geo):
+        return [{"keyword": k, "momentum_score": 50, "is_fallback": True} for k in keywords]
+
+    cache = TrendCache(fetch, ttl_hours=24, session_factory=session_factory)
+    results = cache.get(["SaaS"], "today 3-m", "US")
+
+    assert results[0]["is_fallback"]
+    db = session_factory()
+    assert db.query(Trend).count() == 0
+    db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
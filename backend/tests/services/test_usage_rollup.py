@@ -0,0 +1,115 @@
+"""
+Tests for the API usage rollup and retention job
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api import queries
+from app.models.database import APIUsage, APIUsageDaily
+from app.services.usage_rollup import get_watermark, percentile, rollup_api_usage
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+def add_usage(db, timestamp, count, endpoint="/api/ideas", user_id=1, status_code=200, start_ms=10):
+    db.add_all([
+        APIUsage(user_id=user_id, api_key_id=user_id, endpoint=endpoint, method="GET",
+                 status_code=status_code, timestamp=timestamp, response_time_ms=start_ms + i)
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def monthly_count(db, user_id=1):
+    return queries.monthly_usage_query(db, user_id=user_id, now=NOW).scalar()
+
+
+def test_percentile_nearest_rank():
+    """Test percentile picks on small and empty lists"""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) is None
+
+
+def test_rollup_builds_daily_aggregates(db):
+    """Test counts, errors and latency percentiles per group"""
+    add_usage(db, NOW - timedelta(hours=1), 100)
+    add_usage(db, NOW - timedelta(hours=1), 4, endpoint="/api/stats", status_code=500)
+
+    stats = rollup_api_usage(db, now=NOW)
+
+    assert stats["rows_rolled_up"] == 104
+    assert stats["groups_updated"] == 2
+    ideas = db.query(APIUsageDaily).filter(APIUsageDaily.endpoint == "/api/ideas").one()
+    assert ideas.day == NOW.date()
+    assert (ideas.request_count, ideas.error_count) == (100, 0)
+    assert (ideas.p50_response_ms, ideas.p95_response_ms, ideas.max_response_ms) == (59, 104, 109)
+    assert ideas.avg_response_ms == pytest.approx(59.5)
+    errors = db.query(APIUsageDaily).filter(APIUsageDaily.endpoint == "/api/stats").one()
+    assert errors.error_count == 4
+
+
+def test_monthly_count_is_unchanged_by_rollup(db):
+    """Test that the rate limiter sees aggregates plus the raw tail"""
+    add_usage(db, NOW - timedelta(days=3), 5)
+    add_usage(db, NOW - timedelta(hours=1), 3)
+    add_usage(db, NOW - timedelta(days=40), 7)  # last month
+    add_usage(db, NOW, 2, user_id=2)
+    assert monthly_count(db) == 8
+
+    rollup_api_usage(db, now=NOW)
+    assert monthly_count(db) == 8
+
+    add_usage(db, NOW, 2)
+    assert monthly_count(db) == 10
+    assert monthly_count(db, user_id=2) == 2
+
+
+def test_incremental_rollup_recomputes_touched_groups(db):
+    """Test that new rows for a rolled-up day update its aggregate exactly"""
+    add_usage(db, NOW - timedelta(hours=2), 10, start_ms=100)
+    rollup_api_usage(db, now=NOW)
+
+    add_usage(db, NOW - timedelta(hours=1), 10, start_ms=0)
+    stats = rollup_api_usage(db, now=NOW)
+
+    assert stats["rows_rolled_up"] == 10
+    daily = db.query(APIUsageDaily).one()
+    assert daily.request_count == 20
+    assert (daily.p50_response_ms, daily.max_response_ms) == (9, 109)
+    assert rollup_api_usage(db, now=NOW)["rows_rolled_up"] == 0
+
+
+def test_retention_purges_rolled_up_rows_only(db):
+    """Test that old raw rows are purged after rollup and reports keep them"""
+    add_usage(db, NOW - timedelta(days=40), 6)
+    add_usage(db, NOW - timedelta(hours=1), 2)
+
+    stats = rollup_api_usage(db, now=NOW, retention_days=30)
+
+    assert stats["rows_purged"] == 6
+    assert db.query(APIUsage).count() == 2
+    assert get_watermark(db).last_id == stats["watermark"]
+
+    report = queries.usage_report_query(db, 1, (NOW - timedelta(days=60)).date(), NOW.date() + timedelta(days=1)).all()
+    assert [row.request_count for row in report] == [2, 6]
+
+
+def test_purge_keeps_newest_row(db):
+    """Test that the max id survives so new rows land above the watermark"""
+    add_usage(db, NOW - timedelta(days=40), 3)
+
+    rollup_api_usage(db, now=NOW, retention_days=30)
+    assert db.query(APIUsage).count() == 1
+
+    add_usage(db, NOW, 1)
+    assert monthly_count(db) == 1
+    assert rollup_api_usage(db, now=NOW)["rows_rolled_up"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
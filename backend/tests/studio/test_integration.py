@@ -8,7 +8,7 @@ import os
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from app.models.database import SessionLocal, Idea
+from app.models.database import SessionLocal, Idea, get_async_sessionmaker
 from app.studio.claude_client import ClaudeClient
 from app.studio.orchestrator import MVPOrchestrator
 from app.studio.agents.researcher import ResearcherAgent
@@ -60,6 +60,16 @@ def test_idea(db):
     return idea
 
 
+async def run_session(claude_client, session_id, idea_id, callback):
+    """Run a Studio session on its own async database session, as the WebSocket route does"""
+    async with get_async_sessionmaker()() as async_db:
+        return await MVPOrchestrator(async_db, claude_client).execute_session(
+            session_id=session_id,
+            idea_id=idea_id,
+            stream_callback=callback
+        )
+
+
 @pytest.fixture
 def stream_messages():
     """Capture stream messages"""
@@ -237,8 +247,6 @@ async def test_2_full_workflow_with_orchestrator(db, claude_client, test_idea, s
 
     messages, callback = stream_messages
 
-    # Create orchestrator
-    orchestrator = MVPOrchestrator(db, claude_client)
     session_id = f"test-{datetime.utcnow().timestamp()}"
 
     print(f"\n🚀 Starting workflow for session: {session_id}")
@@ -247,11 +255,7 @@ async def test_2_full_workflow_with_orchestrator(db, claude_client, test_idea, s
     start_time = datetime.utcnow()
 
     # Execute workflow
-    result = await orchestrator.execute_session(
-        session_id=session_id,
-        idea_id=test_idea.id,
-        stream_callback=callback
-    )
+    result = await run_session(claude_client, session_id, test_idea.id, callback)
 
     duration = (datetime.utcnow() - start_time).total_seconds()
 
@@ -388,7 +392,6 @@ async def test_4_performance_validation(db, claude_client, test_idea, stream_mes
     print("="*70)
 
     messages, callback = stream_messages
-    orchestrator = MVPOrchestrator(db, claude_client)
 
     # Run single session and measure
     session_id = f"perf-test-{datetime.utcnow().timestamp()}"
@@ -396,11 +399,7 @@ async def test_4_performance_validation(db, claude_client, test_idea, stream_mes
     print(f"\n⏱️  Running performance test session...")
     start_time = datetime.utcnow()
 
-    result = await orchestrator.execute_session(
-        session_id=session_id,
-        idea_id=test_idea.id,
-        stream_callback=callback
-    )
+    result = await run_session(claude_client, session_id, test_idea.id, callback)
 
     duration = (datetime.utcnow() - start_time).total_seconds()
     cost = result["metrics"]["total_cost_usd"]
@@ -474,7 +473,6 @@ async def test_5_concurrent_sessions(db, claude_client, test_idea):
     print("="*70)
 
     num_sessions = 5
-    orchestrator = MVPOrchestrator(db, claude_client)
 
     # Create callback that tracks messages per session
     session_messages = {}
@@ -496,11 +494,8 @@ async def test_5_concurrent_sessions(db, claude_client, test_idea):
         session_id = f"concurrent-{i+1}-{datetime.utcnow().timestamp()}"
         session_ids.append(session_id)
 
-        task = orchestrator.execute_session(
-            session_id=session_id,
-            idea_id=test_idea.id,
-            stream_callback=create_callback(session_id)
-        )
+        # Each session gets its own database session (AsyncSession isn't shared across tasks)
+        task = run_session(claude_client, session_id, test_idea.id, create_callback(session_id))
         tasks.append(task)
         print(f"   ✅ Session {i+1} launched: {session_id}")
 